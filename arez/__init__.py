@@ -10,8 +10,18 @@ from .status import *
 from .mixins import *
 from .champion import *
 from .exceptions import *
+from .usage import DataUsed
+from .metrics import *
+from .frame import *
+from .aggregate import *
+from .export import *
+from .store import *
+from .watcher import *
+from .graph import *
 from .api import PaladinsAPI
 from .endpoint import Endpoint
+from .breaker import CircuitBreaker
+from .scheduler import RequestScheduler
 from .statuspage import StatusPage
 from .utils import Lookup, Duration
 
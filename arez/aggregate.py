@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+from typing import Any, Optional, List, Dict, Tuple, Iterator, Iterable, AsyncIterable
+
+from .match import Match
+from .enums import Queue, Rank
+from .mixins import WinLoseMixin, KDAMixin
+
+
+__all__ = [
+    "ChampionAggregate",
+    "ChampionAggregator",
+]
+# (queue, rank tier, champion ID)
+AggregateKey = Tuple[Queue, Optional[str], int]
+# (queue, rank tier)
+MatchesKey = Tuple[Queue, Optional[str]]
+FIELDS = ("wins", "losses", "bans", "kills", "deaths", "assists", "damage", "healing")
+
+
+def _rank_tier(rank: Rank) -> str:
+    # Gold IV -> Gold, Master -> Master
+    return rank.name.split(' ')[0]
+
+
+class ChampionAggregate(WinLoseMixin, KDAMixin):
+    """
+    Represents the aggregated statistics of a single champion.
+
+    You can get these from the `ChampionAggregator`.
+
+    Inherits from `WinLoseMixin` and `KDAMixin`, so all of their helper attributes are available
+    here, calculated over all of the picks.
+
+    Attributes
+    ----------
+    wins : int
+        The amount of times the champion was picked and won.
+    losses : int
+        The amount of times the champion was picked and lost.
+    bans : int
+        The amount of times the champion was banned.
+    kills : int
+        The total amount of kills.
+    deaths : int
+        The total amount of deaths.
+    assists : int
+        The total amount of assists.
+    damage : int
+        The total amount of damage dealt.
+    healing : int
+        The total amount of healing done.
+    """
+    def __init__(self):
+        WinLoseMixin.__init__(self, wins=0, losses=0)
+        KDAMixin.__init__(self, kills=0, deaths=0, assists=0)
+        self.bans = 0
+        self.damage = 0
+        self.healing = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(picks={self.picks}, bans={self.bans}, "
+            f"winrate={self.winrate_text}, kda={self.kda_text})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, self.__class__):
+            return self._values() == other._values()
+        return NotImplemented
+
+    # the aggregates are mutable, and compared by their values
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def picks(self) -> int:
+        """
+        The amount of times the champion was picked. This is just ``wins + losses``.
+
+        :type: int
+        """
+        return self.wins + self.losses
+
+    def _values(self) -> List[int]:
+        return [getattr(self, name) for name in FIELDS]
+
+    def _merge(self, other: ChampionAggregate):
+        for name in FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+
+class ChampionAggregator:
+    """
+    An incremental aggregator of champion statistics, that lets you consume a stream of matches
+    (usually from `PaladinsAPI.get_matches_for_queue`) without keeping the matches in memory.
+
+    For every queue, rank tier and champion, it counts the picks, wins, losses and bans,
+    and sums up the kills, deaths, assists, damage dealt and healing done.
+    The memory used depends only on the amount of distinct queues, tiers and champions seen.
+
+    The rank tier of a match is determined by the average rank of it's ranked players,
+    leaving out the ones that are still qualifying, and is the name of the rank's division:
+    ``Qualifying``, ``Bronze``, ``Silver``, ``Gold``, ``Platinum``, ``Diamond``, ``Master``
+    or ``Grandmaster``. Players don't have a rank in the non-ranked queues, so those matches
+    always end up in the ``Qualifying`` tier.
+
+    Partial aggregates computed by separate workers can be combined with `merge`,
+    and transferred between processes with `to_dict` and `from_dict`.
+
+    .. code-block:: py
+
+        aggregator = arez.ChampionAggregator()
+        await aggregator.consume(api.get_matches_for_queue(queue, start=start, end=end))
+        for champion_id, stats in aggregator.totals().items():
+            print(champion_id, stats.picks, stats.bans, stats.winrate_text)
+
+    Parameters
+    ----------
+    by_rank : bool
+        When set to `False`, the statistics aren't split by rank tier,
+        and the tier is always `None`.\n
+        Defaults to `True`.
+
+    Attributes
+    ----------
+    matches : Dict[Tuple[Queue, Optional[str]], int]
+        The amount of matches consumed, for each queue and rank tier.
+    stats : Dict[Tuple[Queue, Optional[str], int], ChampionAggregate]
+        The aggregated statistics, for each queue, rank tier and champion ID.
+    """
+    def __init__(self, *, by_rank: bool = True):
+        self.by_rank = by_rank
+        self.matches: Dict[MatchesKey, int] = {}
+        self.stats: Dict[AggregateKey, ChampionAggregate] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(matches={sum(self.matches.values())}, "
+            f"stats={len(self.stats)})"
+        )
+
+    def __iter__(self) -> Iterator[Tuple[AggregateKey, ChampionAggregate]]:
+        return iter(self.stats.items())
+
+    def _get(self, key: AggregateKey) -> ChampionAggregate:
+        aggregate = self.stats.get(key)
+        if aggregate is None:
+            aggregate = self.stats[key] = ChampionAggregate()
+        return aggregate
+
+    def add(self, match: Match):
+        """
+        Adds a single match to the statistics.
+
+        Parameters
+        ----------
+        match : Match
+            The match to add.
+        """
+        queue = match.queue
+        tier: Optional[str] = None
+        players = list(match.players)
+        if self.by_rank:
+            # players that are still qualifying would only drag the average down
+            ranks = [mp.rank.value for mp in players if mp.rank != Rank.Qualifying]
+            if ranks:
+                tier = _rank_tier(Rank(round(sum(ranks) / len(ranks))))
+            else:
+                tier = _rank_tier(Rank.Qualifying)
+        matches_key = (queue, tier)
+        self.matches[matches_key] = self.matches.get(matches_key, 0) + 1
+        for champion in match.bans:
+            self._get((queue, tier, champion.id)).bans += 1
+        for mp in players:
+            aggregate = self._get((queue, tier, mp.champion.id))
+            if mp.winner:
+                aggregate.wins += 1
+            else:
+                aggregate.losses += 1
+            aggregate.kills += mp.kills
+            aggregate.deaths += mp.deaths
+            aggregate.assists += mp.assists
+            aggregate.damage += mp.damage_done
+            aggregate.healing += mp.healing_done
+
+    def extend(self, matches: Iterable[Match]):
+        """
+        Adds all matches from the iterable provided to the statistics.
+
+        Parameters
+        ----------
+        matches : Iterable[Match]
+            The matches to add.
+        """
+        for match in matches:
+            self.add(match)
+
+    async def consume(self, matches: AsyncIterable[Match]) -> ChampionAggregator:
+        """
+        Adds all matches from the async iterable provided to the statistics,
+        one at a time, as they arrive.
+
+        Parameters
+        ----------
+        matches : AsyncIterable[Match]
+            The matches to add, usually `PaladinsAPI.get_matches_for_queue`.
+
+        Returns
+        -------
+        ChampionAggregator
+            This aggregator, for chaining.
+        """
+        async for match in matches:
+            self.add(match)
+        return self
+
+    def merge(self, other: ChampionAggregator) -> ChampionAggregator:
+        """
+        Adds the statistics of another aggregator to this one.
+
+        Parameters
+        ----------
+        other : ChampionAggregator
+            The aggregator to merge into this one.
+
+        Returns
+        -------
+        ChampionAggregator
+            This aggregator, for chaining.
+
+        Raises
+        ------
+        ValueError
+            The aggregators differ in whether they split the statistics by rank.
+        """
+        if other.by_rank != self.by_rank:
+            raise ValueError("Can't merge aggregators with different by_rank settings")
+        for matches_key, count in other.matches.items():
+            self.matches[matches_key] = self.matches.get(matches_key, 0) + count
+        for key, aggregate in other.stats.items():
+            self._get(key)._merge(aggregate)
+        return self
+
+    def totals(
+        self, *, queue: Optional[Queue] = None, tier: Optional[str] = None
+    ) -> Dict[int, ChampionAggregate]:
+        """
+        Returns the statistics for each champion, combined over all queues and rank tiers,
+        or only the ones specified.
+
+        Parameters
+        ----------
+        queue : Optional[Queue]
+            The queue to limit the statistics to.\n
+            Defaults to `None`, meaning all queues.
+        tier : Optional[str]
+            The rank tier to limit the statistics to.\n
+            Defaults to `None`, meaning all tiers.
+
+        Returns
+        -------
+        Dict[int, ChampionAggregate]
+            A mapping of champion IDs to their statistics.
+        """
+        totals: Dict[int, ChampionAggregate] = {}
+        for (key_queue, key_tier, champion_id), aggregate in self.stats.items():
+            if queue is not None and key_queue is not queue:
+                continue
+            if tier is not None and key_tier != tier:
+                continue
+            total = totals.get(champion_id)
+            if total is None:
+                total = totals[champion_id] = ChampionAggregate()
+            total._merge(aggregate)
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the aggregated statistics as a JSON-serializable dictionary,
+        that can be turned back into an aggregator with `from_dict`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The serialized aggregator.
+        """
+        return {
+            "by_rank": self.by_rank,
+            "matches": [
+                [queue.value, tier, count] for (queue, tier), count in self.matches.items()
+            ],
+            "stats": [
+                [queue.value, tier, champion_id, aggregate._values()]
+                for (queue, tier, champion_id), aggregate in self.stats.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ChampionAggregator:
+        """
+        Creates an aggregator from the dictionary returned by `to_dict`.
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            The serialized aggregator.
+
+        Returns
+        -------
+        ChampionAggregator
+            The aggregator.
+        """
+        aggregator = cls(by_rank=data["by_rank"])
+        for queue_value, tier, count in data["matches"]:
+            aggregator.matches[(Queue(queue_value, return_default=True), tier)] = count
+        for queue_value, tier, champion_id, values in data["stats"]:
+            aggregate = ChampionAggregate()
+            for name, value in zip(FIELDS, values):
+                setattr(aggregate, name, value)
+            aggregator.stats[(Queue(queue_value, return_default=True), tier, champion_id)] = (
+                aggregate
+            )
+        return aggregator
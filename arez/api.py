@@ -2,20 +2,24 @@ from __future__ import annotations
 
 import re
 import asyncio
+import aiohttp
 import logging
 from collections import defaultdict, OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import (
-    Any, Optional, Union, List, Dict, Iterable, Sequence, AsyncGenerator, Literal, overload
+    Any, Optional, Union, List, Dict, Tuple, Iterable, Sequence, AsyncGenerator, Literal, overload
 )
 
 from .match import Match
+from .store import MatchStore
 from .status import ServerStatus
 from .utils import chunk, _date_gen
 from .cache import DataCache, CacheEntry
 from .exceptions import Private, NotFound
 from .player import Player, PartialPlayer
-from .enums import Language, Platform, Queue, PC_PLATFORMS
+from .tracing import _span, _traced
+from .scheduler import _current_priority
+from .enums import Language, Platform, Queue, Priority, PC_PLATFORMS
 
 
 __all__ = ["PaladinsAPI"]
@@ -50,6 +54,21 @@ class PaladinsAPI(DataCache):
         Your developer's ID (devId).
     auth_key : str
         Your developer's authentication key (authKey).
+    credentials : Iterable[Tuple[Union[int, str], str]]
+        Additional developer's ID and authentication key pairs to use.\n
+        Each pair keeps a separate session, and every request is made using the least loaded
+        one. Pairs that turn out to be invalid are skipped for as long as there are others
+        available.\n
+        Defaults to no additional pairs.
+    max_concurrent : Optional[int]
+        The maximum amount of requests that can be in flight at the same time,
+        for each developer's ID and authentication key pair.\n
+        Defaults to `None`, meaning no limit.
+    rate_limit : Optional[float]
+        The maximum amount of requests per second, for each developer's ID
+        and authentication key pair.\n
+        See `Endpoint` for more information.\n
+        Defaults to `None`, meaning no limit.
     cache : bool
         When set to `False`, this disables the data cache. This makes most objects returned
         from the API be `CacheObject` instead of their respective data-rich counterparts.
@@ -60,6 +79,30 @@ class PaladinsAPI(DataCache):
         Can be set to a `Language` instance, in which case that language will be set as default
         first, before initializing.\n
         Defaults to `False`, where no initialization occurs.
+    max_languages : Optional[int]
+        The maximum amount of languages to keep cached at the same time.
+        When exceeded, the least recently used language is evicted from the cache.
+        The default language is never evicted.\n
+        Defaults to `None`, meaning no limit.
+    max_cache_size : Optional[int]
+        The approximate memory budget of the cache, in bytes.
+        See `DataCache` for more information.\n
+        Defaults to `None`, meaning no limit.
+    match_store : Optional[MatchStore]
+        A local store of matches, that `get_match` and `get_matches` look up before making
+        any requests, and save the fetched matches into.\n
+        Defaults to `None`, meaning no store is used.
+    keep_raw : bool
+        When set to `True`, the `Match`, `PartialMatch`, `Player` and `ChampionStats` objects
+        keep the raw data returned from the API, which lets them be serialized with ``to_dict``
+        and the matches be stored with `MatchStore.add`.
+        Keeping it makes each object take up several times more memory.\n
+        Defaults to `False`.
+    session : Optional[aiohttp.ClientSession]
+        An existing HTTP session to make the requests with, letting several clients
+        (like `StatusPage`) share the same connection pool. A session provided this way
+        isn't closed when the API is closed.\n
+        Defaults to `None`, meaning a new session is created.
     loop : Optional[asyncio.AbstractEventLoop]
         The event loop you want to use for this API.\n
         Default loop is used when not provided.
@@ -69,26 +112,43 @@ class PaladinsAPI(DataCache):
         dev_id: Union[int, str],
         auth_key: str,
         *,
+        credentials: Iterable[Tuple[Union[int, str], str]] = (),
+        max_concurrent: Optional[int] = None,
+        rate_limit: Optional[float] = None,
         cache: bool = True,
         initialize: Union[bool, Language] = False,
+        max_languages: Optional[int] = None,
+        max_cache_size: Optional[int] = None,
+        match_store: Optional[MatchStore] = None,
+        keep_raw: bool = False,
+        session: Optional[aiohttp.ClientSession] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
     ):
         if loop is None:  # pragma: no branch
             loop = asyncio.get_event_loop()
         self._server_status: Optional[ServerStatus] = None
+        self.match_store: Optional[MatchStore] = match_store
+        self.keep_raw: bool = keep_raw
         super().__init__(
             "http://api.paladins.com/paladinsapi.svc",
             dev_id,
             auth_key,
+            credentials=credentials,
+            max_concurrent=max_concurrent,
+            rate_limit=rate_limit,
+            session=session,
             loop=loop,
             enabled=cache,
             initialize=initialize,
+            max_languages=max_languages,
+            max_cache_size=max_cache_size,
         )
 
     # solely for typing, __aexit__ exists in the DataCache
     async def __aenter__(self) -> PaladinsAPI:
         return self
 
+    @_traced
     async def get_server_status(self, *, force_refresh: bool = False) -> ServerStatus:
         """
         Fetches the server status.
@@ -97,6 +157,7 @@ class PaladinsAPI(DataCache):
         Use the ``force_refresh`` parameter to override this behavior.
 
         Uses up one request each time the cache is refreshed.
+        This request isn't affected by the circuit breaker.
 
         Parameters
         ----------
@@ -116,21 +177,32 @@ class PaladinsAPI(DataCache):
         """
         # Use a lock to ensure we're not fetching this twice in quick succession
         async with self._locks["server_status"]:
-            if (
-                self._server_status is None
-                or datetime.utcnow() - timedelta(minutes=1) >= self._server_status.timestamp
-                or force_refresh
-            ):
-                logger.info(f"api.get_server_status({force_refresh=}) -> fetching new")
-                response = await self.request("gethirezserverstatus")
-                if response:
-                    self._server_status = ServerStatus(response)
-            else:
-                logger.info(f"api.get_server_status({force_refresh=}) -> using cached")
+            with _span(self.tracer, "PaladinsAPI.server_status_lookup") as span:
+                hit = not (
+                    self._server_status is None
+                    or datetime.utcnow() - timedelta(minutes=1) >= self._server_status.timestamp
+                    or force_refresh
+                )
+                span.set_attribute("arez.cache_hit", hit)
+                if hit:
+                    logger.info(
+                        "api.get_server_status(force_refresh=%r) -> using cached", force_refresh
+                    )
+                else:
+                    logger.info(
+                        "api.get_server_status(force_refresh=%r) -> fetching new", force_refresh
+                    )
+                    response = await self.request("gethirezserverstatus")
+                    if response:
+                        self._server_status = ServerStatus(response)
+                        # let the circuit breaker probe the API early
+                        # once the servers are back up
+                        self.breaker.report_health(self._server_status.all_up)
         if self._server_status is None:
             raise NotFound("Server status")
         return self._server_status
 
+    @_traced
     async def get_champion_info(
         self,
         language: Optional[Language] = None,
@@ -175,7 +247,9 @@ class PaladinsAPI(DataCache):
         assert language is None or isinstance(language, Language)
         if language is None:
             language = self._default_language
-        logger.info(f"api.get_champion_info({language=}, {force_refresh=})")
+        logger.info(
+            "api.get_champion_info(language=%r, force_refresh=%r)", language, force_refresh
+        )
         entry = await self._fetch_entry(language, force_refresh=force_refresh, cache=cache)
         if entry is None:
             raise NotFound("Champion information")
@@ -222,7 +296,10 @@ class PaladinsAPI(DataCache):
             The wrapped player object.
         """
         assert isinstance(player_id, int)
-        logger.debug(f"api.wrap_player({player_id=}, {player_name=}, {platform=}, {private=})")
+        logger.debug(
+            "api.wrap_player(player_id=%r, player_name=%r, platform=%r, private=%r)",
+            player_id, player_name, platform, private,
+        )
         return PartialPlayer(
             self, id=player_id, name=player_name, platform=platform, private=private
         )
@@ -239,6 +316,7 @@ class PaladinsAPI(DataCache):
     ) -> Union[Player, PartialPlayer]:
         ...
 
+    @_traced
     async def get_player(
         self, player: Union[int, str], *, return_private: bool = False
     ) -> Union[Player, PartialPlayer]:
@@ -280,7 +358,7 @@ class PaladinsAPI(DataCache):
         # save on the request by raising Notfound for zero straight away
         if player == '0':
             raise NotFound("Player")
-        logger.info(f"api.get_player({player=}, {return_private=})")
+        logger.info("api.get_player(player=%r, return_private=%r)", player, return_private)
         player_list = await self.request("getplayer", player)
         if not player_list:
             # No one got returned
@@ -312,6 +390,7 @@ class PaladinsAPI(DataCache):
     ) -> Sequence[Union[Player, PartialPlayer]]:
         ...
 
+    @_traced
     async def get_players(
         self, player_ids: Iterable[int], *, return_private: bool = False
     ) -> Sequence[Union[Player, PartialPlayer]]:
@@ -347,9 +426,11 @@ class PaladinsAPI(DataCache):
             ids_list.remove(0)
         if not ids_list:
             return []
-        logger.info(
-            f"api.get_players(player_ids=[{', '.join(map(str, ids_list))}], {return_private=})"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "api.get_players(player_ids=[%s], return_private=%r)",
+                ', '.join(map(str, ids_list)), return_private,
+            )
         player_list: List[Union[Player, PartialPlayer]] = []
         for chunk_ids in chunk(ids_list, 20):
             chunk_response = await self.request("getplayerbatch", ','.join(map(str, chunk_ids)))
@@ -368,6 +449,7 @@ class PaladinsAPI(DataCache):
             player_list.extend(chunk_players)
         return player_list
 
+    @_traced
     async def search_players(
         self, player_name: str, platform: Optional[Platform] = None, *, return_private: bool = True
     ) -> List[PartialPlayer]:
@@ -420,7 +502,8 @@ class PaladinsAPI(DataCache):
         if platform is not None:
             # Specific platform
             logger.info(
-                f"api.search_players({player_name=}, platform={platform.name}, {return_private=})"
+                "api.search_players(player_name=%r, platform=%s, return_private=%r)",
+                player_name, platform.name, return_private,
             )
             if platform in PC_PLATFORMS:
                 # PC platforms, with unique names
@@ -432,7 +515,10 @@ class PaladinsAPI(DataCache):
                 )
         else:
             # All platforms
-            logger.info(f"api.search_players({player_name=}, {platform=}, {return_private=})")
+            logger.info(
+                "api.search_players(player_name=%r, platform=%r, return_private=%r)",
+                player_name, platform, return_private,
+            )
             response = await self.request("searchplayers", player_name)
             player_name = player_name.lower()
             # pre-process the names to prioritize unique names first
@@ -456,6 +542,7 @@ class PaladinsAPI(DataCache):
             for p in list_response
         ]
 
+    @_traced
     async def get_from_platform(
         self, platform_id: int, platform: Platform
     ) -> PartialPlayer:
@@ -489,7 +576,9 @@ class PaladinsAPI(DataCache):
         """
         assert isinstance(platform_id, int)
         assert isinstance(platform, Platform)
-        logger.info(f"api.get_from_platform({platform_id=}, platform={platform.name})")
+        logger.info(
+            "api.get_from_platform(platform_id=%r, platform=%s)", platform_id, platform.name
+        )
         response = await self.request("getplayeridbyportaluserid", platform.value, platform_id)
         if not response:
             raise NotFound("Linked profile")
@@ -498,13 +587,14 @@ class PaladinsAPI(DataCache):
             self, id=p["player_id"], platform=p["portal_id"], private=p["privacy_flag"] == 'y'
         )
 
+    @_traced
     async def get_match(
         self, match_id: int, language: Optional[Language] = None, *, expand_players: bool = False
     ) -> Match:
         """
         Fetches a match for the given Match ID.
 
-        Uses up a single request.
+        Uses up a single request, unless the match is present in the `match_store`.
 
         Parameters
         ----------
@@ -536,16 +626,26 @@ class PaladinsAPI(DataCache):
             language = self._default_language
         # ensure we have champion information first
         await self._ensure_entry(language)
-        logger.info(f"api.get_match({match_id=}, {language=}, {expand_players=})")
-        response = await self.request("getmatchdetails", match_id)
-        if not response:
-            raise NotFound("Match")
+        logger.info(
+            "api.get_match(match_id=%r, language=%r, expand_players=%r)",
+            match_id, language, expand_players,
+        )
+        response = None
+        if self.match_store is not None:
+            response = self.match_store._get_raw((match_id,)).get(match_id)
+        if response is None:
+            response = await self.request("getmatchdetails", match_id)
+            if not response:
+                raise NotFound("Match")
+            if self.match_store is not None:
+                self.match_store._add_raw((response,))
         players: Dict[int, Player] = {}
         if expand_players:
             players_list = await self.get_players((int(p["playerId"]) for p in response))
             players = {p.id: p for p in players_list}
         return Match(self, language, response, players)
 
+    @_traced
     async def get_matches(
         self,
         match_ids: Iterable[int],
@@ -556,7 +656,8 @@ class PaladinsAPI(DataCache):
         """
         Fetches multiple matches in a batch, for the given Match IDs. Removes duplicates.
 
-        Uses up a single request for every multiple of 10 unique match IDs passed.
+        Uses up a single request for every multiple of 10 unique match IDs passed,
+        that aren't present in the `match_store`.
 
         Parameters
         ----------
@@ -574,7 +675,7 @@ class PaladinsAPI(DataCache):
         Returns
         -------
         List[Match]
-            A list of the available matches requested.\n
+            A list of the available matches requested, in the order of the IDs passed.\n
             Some of the matches can be not present if they weren't available on the server.
         """
         assert language is None or isinstance(language, Language)
@@ -586,17 +687,33 @@ class PaladinsAPI(DataCache):
             language = self._default_language
         # ensure we have champion information first
         await self._ensure_entry(language)
-        logger.info(
-            f"api.get_matches(match_ids=[{', '.join(map(str, ids_list))}], "
-            f"{language=}, {expand_players=})"
-        )
-        matches: List[Match] = []
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "api.get_matches(match_ids=[%s], language=%r, expand_players=%r)",
+                ', '.join(map(str, ids_list)), language, expand_players,
+            )
+        matches: Dict[int, Match] = {}
         players: Dict[int, Player] = {}
-        for chunk_ids in chunk(ids_list, 10):  # chunk the IDs into groups of 10
+        missing_ids = ids_list
+        if self.match_store is not None:
+            stored = self.match_store._get_raw(ids_list)
+            if stored:
+                logger.debug("api.get_matches -> %s matches found in the store", len(stored))
+                missing_ids = [match_id for match_id in ids_list if match_id not in stored]
+                if expand_players:
+                    players_list = await self.get_players(
+                        int(p["playerId"]) for match_list in stored.values() for p in match_list
+                    )
+                    players.update({p.id: p for p in players_list})
+                for match_id, match_list in stored.items():
+                    matches[match_id] = Match(self, language, match_list, players)
+        for chunk_ids in chunk(missing_ids, 10):  # chunk the IDs into groups of 10
             response = await self.request("getmatchdetailsbatch", ','.join(map(str, chunk_ids)))
             bunched_matches: Dict[int, list] = defaultdict(list)
             for p in response:
                 bunched_matches[p["Match"]].append(p)
+            if self.match_store is not None:
+                self.match_store._add_raw(bunched_matches.values())
             if expand_players:
                 player_ids = []
                 for p in response:
@@ -605,12 +722,10 @@ class PaladinsAPI(DataCache):
                         player_ids.append(pid)
                 players_list = await self.get_players(player_ids)
                 players.update({p.id: p for p in players_list})
-            chunked_matches: List[Match] = [
-                Match(self, language, match_list, players)
-                for match_list in bunched_matches.values()
-            ]
-            matches.extend(chunked_matches)
-        return matches
+            for match_id, match_list in bunched_matches.items():
+                matches[match_id] = Match(self, language, match_list, players)
+        # keep the order of the IDs requested, regardless of where the matches came from
+        return [matches[match_id] for match_id in ids_list if match_id in matches]
 
     async def get_matches_for_queue(
         self,
@@ -634,6 +749,9 @@ class PaladinsAPI(DataCache):
         Whole hour time slices are optimized to use a single request instead of
         6 individual, 10 minute ones.
 
+        Unless a different priority has been set using the `priority` context manager,
+        all requests made by this method use `Priority.Bulk` priority.
+
         Parameters
         ----------
         queue : Queue
@@ -674,17 +792,22 @@ class PaladinsAPI(DataCache):
             end = end.astimezone(timezone.utc)
         if language is None:
             language = self._default_language
+        # crawling is a background job, unless the caller says otherwise
+        priority = _current_priority.get() or Priority.Bulk
         # ensure we have champion information first
         await self._ensure_entry(language)
         logger.info(
-            f"api.get_matches_for_queue({queue=}, {language=}, {start=} UTC, {end=} UTC, "
-            f"{reverse=}, {local_time=}, {expand_players=})"
+            "api.get_matches_for_queue(queue=%r, language=%r, start=%r UTC, end=%r UTC, "
+            "reverse=%r, local_time=%r, expand_players=%r)",
+            queue, language, start, end, reverse, local_time, expand_players,
         )
 
         # Use the generated date and hour values to iterate over and fetch matches
         players: Dict[int, Player] = {}
         for date, hour in _date_gen(start, end, reverse=reverse):  # pragma: no branch
-            response = await self.request("getmatchidsbyqueue", queue.value, date, hour)
+            response = await self.request(
+                "getmatchidsbyqueue", queue.value, date, hour, priority=priority
+            )
             if reverse:
                 match_ids = [
                     int(e["Match"])
@@ -695,7 +818,7 @@ class PaladinsAPI(DataCache):
                 match_ids = [int(e["Match"]) for e in response if e["Active_Flag"] == 'n']
             for chunk_ids in chunk(match_ids, 10):  # pragma: no branch
                 response = await self.request(
-                    "getmatchdetailsbatch", ','.join(map(str, chunk_ids))
+                    "getmatchdetailsbatch", ','.join(map(str, chunk_ids)), priority=priority
                 )
                 bunched_matches: Dict[int, list] = defaultdict(list)
                 for p in response:
@@ -706,7 +829,8 @@ class PaladinsAPI(DataCache):
                         pid = int(p["playerId"])
                         if pid not in players:  # pragma: no branch
                             player_ids.append(pid)
-                    players_list = await self.get_players(player_ids)
+                    with self.priority(priority):
+                        players_list = await self.get_players(player_ids)
                     players.update({p.id: p for p in players_list})
                 chunked_matches = [
                     Match(self, language, match_list, players)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import logging
+from random import uniform
+from time import monotonic
+from collections import deque
+from typing import Optional, Deque, Tuple, Literal
+
+from .exceptions import Unavailable
+
+
+__all__ = ["CircuitBreaker"]
+logger = logging.getLogger(__package__)
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker, protecting the API from being flooded with requests while it's failing.
+
+    The breaker starts ``closed``, letting all requests through while keeping track of
+    their outcomes. Once the error rate within the ``window`` reaches ``error_rate``,
+    the breaker trips and becomes ``open`` - all requests then fail fast
+    with the `Unavailable` exception, without reaching the API. After ``reset_timeout``
+    seconds, the breaker becomes ``half-open`` and lets a single probe request through.
+    If it succeeds, the breaker closes again, otherwise it opens for twice as long as before,
+    up to ``max_reset_timeout``.
+
+    Only connection problems, timeouts and ``5xx`` HTTP status codes are considered errors.
+
+    You can find this on the `Endpoint.breaker` attribute.
+
+    Parameters
+    ----------
+    error_rate : float
+        The error rate (as a fraction) at which the breaker trips.\n
+        Defaults to ``0.5``.
+    min_requests : int
+        The minimum amount of requests within the window required for the breaker to trip.\n
+        Defaults to ``20``.
+    window : float
+        The length of the window the error rate is calculated over, in seconds.\n
+        Defaults to ``60`` seconds.
+    reset_timeout : float
+        The amount of time the breaker stays open after tripping for the first time,
+        in seconds.\n
+        Defaults to ``5`` seconds.
+    max_reset_timeout : float
+        The maximum amount of time the breaker can stay open for, in seconds.\n
+        Defaults to ``300`` seconds.
+    enabled : bool
+        When set to `False`, the breaker never trips, but still calculates the error rate
+        and the retry delays.\n
+        Defaults to `True`.
+
+    Attributes
+    ----------
+    error_rate_threshold : float
+        The error rate (as a fraction) at which the breaker trips.
+    min_requests : int
+        The minimum amount of requests within the window required for the breaker to trip.
+    window : float
+        The length of the window the error rate is calculated over, in seconds.
+    reset_timeout : float
+        The amount of time the breaker stays open after tripping for the first time, in seconds.
+    max_reset_timeout : float
+        The maximum amount of time the breaker can stay open for, in seconds.
+    enabled : bool
+        `True` if the breaker can trip, `False` otherwise.
+    trips : int
+        The amount of times this breaker has tripped so far.
+    """
+    # how long to wait for a probe request to report back, before letting another one through
+    _probe_timeout = 30
+
+    def __init__(
+        self,
+        *,
+        error_rate: float = 0.5,
+        min_requests: int = 20,
+        window: float = 60,
+        reset_timeout: float = 5,
+        max_reset_timeout: float = 300,
+        enabled: bool = True,
+    ):
+        self.error_rate_threshold = error_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.enabled = enabled
+        self.trips = 0
+        self._open = False
+        self._opened_until = 0.0
+        self._current_timeout = reset_timeout
+        self._probe_started: Optional[float] = None
+        # (timestamp, failed) pairs
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.state}, "
+            f"error rate: {round(self.error_rate * 100, 1)}%)"
+        )
+
+    @property
+    def state(self) -> Literal["closed", "open", "half-open"]:
+        """
+        The current state of the breaker.
+
+        :type: Literal["closed", "open", "half-open"]
+        """
+        if not self._open:
+            return "closed"
+        if monotonic() < self._opened_until:
+            return "open"
+        return "half-open"
+
+    @property
+    def error_rate(self) -> float:
+        """
+        The error rate (as a fraction) of the requests made within the current window.\n
+        ``0.0`` if there were no requests made.
+
+        :type: float
+        """
+        self._prune(monotonic())
+        if not self._outcomes:
+            return 0.0
+        return sum(failed for _, failed in self._outcomes) / len(self._outcomes)
+
+    @property
+    def retry_after(self) -> float:
+        """
+        The amount of seconds left until the breaker lets a probe request through.\n
+        ``0.0`` if the breaker isn't open.
+
+        :type: float
+        """
+        if not self._open:
+            return 0.0
+        return max(self._opened_until - monotonic(), 0.0)
+
+    def retry_delay(self, tries: int) -> float:
+        """
+        Calculates a jittered delay before the next retry, that grows exponentially
+        with the amount of tries made, as well as with the current error rate.
+
+        Parameters
+        ----------
+        tries : int
+            The amount of tries made so far, minus one.
+
+        Returns
+        -------
+        float
+            The delay, in seconds.
+        """
+        delay = min(0.25 * 2 ** tries * (1 + 3 * self.error_rate), 10)
+        return uniform(delay / 2, delay)
+
+    def report_health(self, healthy: bool):
+        """
+        Lets an external health signal affect the breaker. When the breaker is open and
+        the API is reported as healthy, a probe request is let through right away.
+
+        `PaladinsAPI.get_server_status` uses this automatically.
+
+        Parameters
+        ----------
+        healthy : bool
+            `True` if the API is deemed healthy, `False` otherwise.
+        """
+        if healthy and self._open:
+            self._opened_until = min(self._opened_until, monotonic())
+
+    def _prune(self, now: float):
+        cutoff = now - self.window
+        outcomes = self._outcomes
+        while outcomes and outcomes[0][0] < cutoff:
+            outcomes.popleft()
+
+    def _trip(self, now: float):
+        if self._open:
+            # failed while half-open - back off for longer
+            self._current_timeout = min(self._current_timeout * 2, self.max_reset_timeout)
+        else:
+            self._current_timeout = self.reset_timeout
+            self.trips += 1
+        self._open = True
+        self._opened_until = now + self._current_timeout
+        self._probe_started = None
+        logger.warning("Circuit breaker opened for %s seconds", self._current_timeout)
+
+    def _close(self):
+        self._open = False
+        self._probe_started = None
+        self._outcomes.clear()
+        logger.warning("Circuit breaker closed")
+
+    def _acquire(self) -> bool:
+        """
+        Checks if a request can be made, raising `Unavailable` if it can't.
+        Returns `True` if the request is a probe, `False` otherwise.
+        """
+        if not self._open:
+            return False
+        now = monotonic()
+        if now < self._opened_until:
+            raise Unavailable
+        # half-open - let only a single probe through at a time
+        if self._probe_started is not None and now - self._probe_started < self._probe_timeout:
+            raise Unavailable
+        self._probe_started = now
+        return True
+
+    def _record(self, outcome: Optional[bool], probe: bool):
+        """
+        Records the outcome of a request - `True` if it succeeded, `False` if it failed,
+        and `None` if it's unknown.
+        """
+        if outcome is None:
+            if probe:
+                # let another probe through
+                self._probe_started = None
+            return
+        now = monotonic()
+        self._prune(now)
+        self._outcomes.append((now, not outcome))
+        if probe:
+            if outcome:
+                self._close()
+            else:
+                self._trip(now)
+        elif (
+            not outcome
+            and not self._open
+            and self.enabled
+            and len(self._outcomes) >= self.min_requests
+            and self.error_rate >= self.error_rate_threshold
+        ):
+            self._trip(now)
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+import sys
 import asyncio
+import aiohttp
 import logging
 from itertools import chain
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union, List, Dict
+from typing import Any, Optional, Union, List, Dict, Tuple, Iterable, Iterator
 
 from .items import Device
 from .endpoint import Endpoint
 from .champion import Champion, Ability
 from .enums import Language, DeviceType
-from .utils import Lookup, WeakValueDefaultDict
+from .utils import Lookup, WeakValueDefaultDict, _SharedCores
+from .tracing import _span, _traced
 from .exceptions import Unavailable, HTTPException
 
 
 __all__ = [
     "DataCache",
     "CacheEntry",
+    "CacheChanges",
 ]
 logger = logging.getLogger(__package__)
 
@@ -47,6 +52,19 @@ class DataCache(Endpoint):
         Your developer's ID (devId).
     auth_key : str
         Your developer's authentication key (authKey).
+    credentials : Iterable[Tuple[Union[int, str], str]]
+        Additional developer's ID and authentication key pairs to use.\n
+        See `Endpoint` for more information.\n
+        Defaults to no additional pairs.
+    max_concurrent : Optional[int]
+        The maximum amount of requests that can be in flight at the same time,
+        for each developer's ID and authentication key pair.\n
+        Defaults to `None`, meaning no limit.
+    rate_limit : Optional[float]
+        The maximum amount of requests per second, for each developer's ID
+        and authentication key pair.\n
+        See `Endpoint` for more information.\n
+        Defaults to `None`, meaning no limit.
     enabled : bool
         When set to `False`, this disables the data cache. This makes most objects returned
         from the API be `CacheObject` instead of their respective data-rich counterparts.
@@ -57,9 +75,33 @@ class DataCache(Endpoint):
         Can be set to a `Language` instance, in which case that language will be set as default
         first, before initializing.\n
         Defaults to `False`, where no initialization occurs.
+    max_languages : Optional[int]
+        The maximum amount of languages to keep cached at the same time.
+        When exceeded, the least recently used language is evicted from the cache.
+        The default language is never evicted.\n
+        Defaults to `None`, meaning no limit.
+    max_cache_size : Optional[int]
+        The approximate memory budget of the cache, in bytes.
+        When exceeded, the least recently used languages are evicted from the cache,
+        until it fits within the budget again. The default language is never evicted.\n
+        See `cache_size` for more information.\n
+        Defaults to `None`, meaning no limit.
+    session : Optional[aiohttp.ClientSession]
+        An existing HTTP session to make the requests with.
+        See `Endpoint` for more information.\n
+        Defaults to `None`, meaning a new session is created.
     loop : Optional[asyncio.AbstractEventLoop]
         The event loop you want to use for this data cache.\n
         Default loop is used when not provided.
+
+    Attributes
+    ----------
+    max_languages : Optional[int]
+        The maximum amount of languages cached. Can be changed at any time,
+        and takes effect the next time an entry is cached.
+    max_cache_size : Optional[int]
+        The approximate memory budget of the cache, in bytes. Can be changed at any time,
+        and takes effect the next time an entry is cached.
     """
     def __init__(
         self,
@@ -67,22 +109,45 @@ class DataCache(Endpoint):
         dev_id: Union[int, str],
         auth_key: str,
         *,
+        credentials: Iterable[Tuple[Union[int, str], str]] = (),
+        max_concurrent: Optional[int] = None,
+        rate_limit: Optional[float] = None,
         enabled: bool = True,
         initialize: Union[bool, Language] = False,
+        max_languages: Optional[int] = None,
+        max_cache_size: Optional[int] = None,
+        session: Optional[aiohttp.ClientSession] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
     ):
-        super().__init__(url, dev_id, auth_key, loop=loop)
+        super().__init__(
+            url,
+            dev_id,
+            auth_key,
+            credentials=credentials,
+            max_concurrent=max_concurrent,
+            rate_limit=rate_limit,
+            session=session,
+            loop=loop,
+        )
         self._default_language: Language
         if isinstance(initialize, Language):  # pragma: no cover
             self._default_language = initialize
         else:
             self._default_language = Language.English
-        self._cache: Dict[Language, CacheEntry] = {}
+        # ordered from the least to the most recently used
+        self._cache: OrderedDict[Language, CacheEntry] = OrderedDict()
+        # case-folded localized name: (ID, language), across all cached entries
+        self._champion_names: Dict[str, Tuple[int, Language]] = {}
+        self._device_names: Dict[str, Tuple[int, Language]] = {}
+        # the language-independent data, shared between the entries
+        self._cores = _SharedCores()
         self._locks: WeakValueDefaultDict[Any, asyncio.Lock] = WeakValueDefaultDict(
             lambda: asyncio.Lock()
         )
         self.cache_enabled = enabled
         self.refresh_every = timedelta(hours=12)
+        self.max_languages: Optional[int] = max_languages
+        self.max_cache_size: Optional[int] = max_cache_size
         if initialize:  # pragma: no cover
             self.loop.create_task(self.initialize())
 
@@ -98,9 +163,61 @@ class DataCache(Endpoint):
             The new default language you want to set.
         """
         assert isinstance(language, Language)
-        logger.info(f"cache.set_default_language({language=})")
+        logger.info("cache.set_default_language(language=%r)", language)
         self._default_language = language
+        self._index_names()
+
+    @property
+    def cache_size(self) -> int:
+        """
+        The estimated memory usage of all currently cached entries, in bytes.
+
+        This is an approximation, counting the objects, their text and the lookup tables
+        of each entry, the language-independent data shared between the entries once,
+        as well as the cross-language name indexes.
 
+        :type: int
+        """
+        getsizeof = sys.getsizeof
+        index_size = sum(
+            getsizeof(index) + sum(map(getsizeof, index))
+            for index in (self._champion_names, self._device_names)
+            if index
+        )
+        # the cores shared between the entries are counted once
+        cores = {id(core): core for entry in self._cache.values() for core in entry._cores()}
+        core_size = sum(map(_object_size, cores.values()))
+        return (
+            index_size
+            + core_size
+            + sum(entry._estimate_size() for entry in self._cache.values())
+        )
+
+    def _get_cached(self, language: Language) -> Optional[CacheEntry]:
+        # returns a cached entry, marking it as the most recently used one
+        entry = self._cache.get(language)
+        if entry is not None:
+            self._cache.move_to_end(language)
+        return entry
+
+    def _evict(self):
+        # evict the least recently used entries, skipping the default language
+        while (
+            self.max_languages is not None and len(self._cache) > self.max_languages
+            or self.max_cache_size is not None and self.cache_size > self.max_cache_size
+        ):
+            for language in self._cache:
+                if language is not self._default_language:
+                    break
+            else:
+                # only the default language is left
+                return
+            del self._cache[language]
+            # drop the evicted names right away, so that the size estimate stays accurate
+            self._index_names()
+            logger.info("cache.evict(language=%r)", language)
+
+    @_traced
     async def initialize(self, *, language: Optional[Language] = None) -> bool:
         """
         Initializes the data cache, by pre-fetching and storing the `CacheEntry` for the default
@@ -124,7 +241,7 @@ class DataCache(Endpoint):
         """
         if language is None:
             language = self._default_language
-        logger.info(f"cache.initialize({language=})")
+        logger.info("cache.initialize(language=%r)", language)
         try:
             entry = await self._fetch_entry(language, force_refresh=True, cache=True)
         except (HTTPException, Unavailable):  # pragma: no cover
@@ -137,26 +254,144 @@ class DataCache(Endpoint):
         # Use a lock here to ensure no race condition between checking for an entry
         # and setting a new one. Use separate locks per each language.
         async with self._locks[f"cache_fetch_{language.name}"]:
-            now = datetime.utcnow()
-            entry = self._cache.get(language)
-            if entry is None or now >= entry._expires_at or force_refresh:
-                champions_data = await self.request("getgods", language.value)
-                items_data = await self.request("getitems", language.value)
-                if champions_data and items_data:
-                    expires_at = now + self.refresh_every
-                    entry = CacheEntry(
-                        language, expires_at, champions_data, items_data
-                    )
-                    if cache is None:
-                        cache = self.cache_enabled
-                    if cache:
-                        self._cache[language] = entry
+            with _span(
+                self.tracer, "DataCache.lookup", {"arez.language": language.name}
+            ) as span:
+                now = datetime.utcnow()
+                entry = self._get_cached(language)
+                hit = not (entry is None or now >= entry._expires_at or force_refresh)
+                span.set_attribute("arez.cache_hit", hit)
+                if not hit:
+                    champions_data = await self.request("getgods", language.value)
+                    items_data = await self.request("getitems", language.value)
+                    if champions_data and items_data:
+                        expires_at = now + self.refresh_every
+                        if cache is None:
+                            cache = self.cache_enabled
+                        # only an entry that's going to replace the cached one
+                        # can reuse it's objects
+                        previous = entry if cache else None
+                        entry = CacheEntry(
+                            language,
+                            expires_at,
+                            champions_data,
+                            items_data,
+                            cores=self._cores,
+                            previous=previous,
+                        )
+                        if entry.changes:
+                            logger.info(
+                                "cache.refresh(language=%r) -> %r", language, entry.changes
+                            )
+                        if cache:
+                            self._cache[language] = entry
+                            self._cache.move_to_end(language)
+                            self._index_names()
+                            self._evict()
         return entry
 
+    def _index_names(self):
+        # rebuild the cross-language name indexes, with the default language taking precedence
+        # for names shared between languages
+        champion_names: Dict[str, Tuple[int, Language]] = {}
+        device_names: Dict[str, Tuple[int, Language]] = {}
+        languages = sorted(self._cache, key=lambda lang: lang is not self._default_language)
+        for language in languages:
+            entry = self._cache[language]
+            for champion in entry.champions:
+                champion_names.setdefault(champion.name.casefold(), (champion.id, language))
+            for device in entry.devices:
+                device_names.setdefault(device.name.casefold(), (device.id, language))
+        self._champion_names = champion_names
+        self._device_names = device_names
+
+    def _find(
+        self, index: Dict[str, Tuple[int, Language]], name: str, language: Optional[Language]
+    ) -> Optional[Tuple[int, CacheEntry]]:
+        match = index.get(name.casefold())
+        if match is None:
+            return None
+        object_id, matched_language = match
+        if language is None:
+            language = self._default_language
+        # return the object in the language requested, or the matching one if it's not cached
+        entry = self._get_cached(language) or self._get_cached(matched_language)
+        if entry is None:
+            return None
+        return object_id, entry
+
+    def find_champion(
+        self, name: str, /, language: Optional[Language] = None
+    ) -> Optional[Champion]:
+        """
+        Returns a champion for the given Name, in any of the languages currently cached.
+        Case insensitive.
+
+        Unlike `get_champion`, which only searches the names in the language specified,
+        this lets you resolve the name typed by the user in any language,
+        using a single lookup into an index shared by all cached entries.
+
+        This method can return `None` or stale data if the entries haven't been fetched yet,
+        or haven't been updated in a while.
+
+        Parameters
+        ----------
+        name : str
+            The Name of the champion you want to get, in any of the cached languages.
+        language : Optional[Language]
+            The `Language` you want to get the champion in.\n
+            If the entry for this language hasn't been fetched yet, the champion is returned
+            in the language the name has matched instead.\n
+            Default language is used if not provided.
+
+        Returns
+        -------
+        Optional[Champion]
+            The champion you requested.\n
+            `None` is returned if a champion with this Name couldn't be found
+            in any of the cached entries.
+        """
+        found = self._find(self._champion_names, name, language)
+        if found is None:
+            return None
+        champion_id, entry = found
+        return entry.get_champion(champion_id)
+
+    def find_device(self, name: str, /, language: Optional[Language] = None) -> Optional[Device]:
+        """
+        Returns a device (shop item, card or talent) for the given Name,
+        in any of the languages currently cached.
+        Case insensitive.
+
+        See `find_champion` for more information.
+
+        Parameters
+        ----------
+        name : str
+            The Name of the device you want to get, in any of the cached languages.
+        language : Optional[Language]
+            The `Language` you want to get the device in.\n
+            If the entry for this language hasn't been fetched yet, the device is returned
+            in the language the name has matched instead.\n
+            Default language is used if not provided.
+
+        Returns
+        -------
+        Optional[Device]
+            The device you requested.\n
+            `None` is returned if a device with this Name couldn't be found
+            in any of the cached entries.
+        """
+        found = self._find(self._device_names, name, language)
+        if found is None:
+            return None
+        device_id, entry = found
+        return entry.get_device(device_id)
+
     async def _ensure_entry(self, language: Language):
         if not self.cache_enabled:
             return
-        logger.debug(f"cache.ensure_entry({language=})")
+        logger.debug("cache.ensure_entry(language=%r)", language)
         await self._fetch_entry(language)
 
     def get_entry(self, language: Optional[Language] = None) -> Optional[CacheEntry]:
@@ -181,8 +416,8 @@ class DataCache(Endpoint):
         """
         if language is None:
             language = self._default_language
-        logger.info(f"cache.get_entry({language=})")
-        return self._cache.get(language)
+        logger.info("cache.get_entry(language=%r)", language)
+        return self._get_cached(language)
 
     def get_champion(
         self,
@@ -220,7 +455,7 @@ class DataCache(Endpoint):
         """
         if language is None:
             language = self._default_language
-        entry = self._cache.get(language)
+        entry = self._get_cached(language)
         if entry:
             return entry.get_champion(champion, fuzzy=fuzzy)
         return None
@@ -261,7 +496,7 @@ class DataCache(Endpoint):
         """
         if language is None:
             language = self._default_language
-        entry = self._cache.get(language)
+        entry = self._get_cached(language)
         if entry:
             return entry.get_card(card, fuzzy=fuzzy)
         return None
@@ -302,7 +537,7 @@ class DataCache(Endpoint):
         """
         if language is None:
             language = self._default_language
-        entry = self._cache.get(language)
+        entry = self._get_cached(language)
         if entry:
             return entry.get_talent(talent, fuzzy=fuzzy)
         return None
@@ -343,7 +578,7 @@ class DataCache(Endpoint):
         """
         if language is None:
             language = self._default_language
-        entry = self._cache.get(language)
+        entry = self._get_cached(language)
         if entry:
             return entry.get_item(item, fuzzy=fuzzy)
         return None
@@ -384,12 +619,107 @@ class DataCache(Endpoint):
         """
         if language is None:
             language = self._default_language
-        entry = self._cache.get(language)
+        entry = self._get_cached(language)
         if entry:
             return entry.get_device(device, fuzzy=fuzzy)
         return None
 
 
+def _object_size(obj: Any) -> int:
+    # the object itself, with the text it holds - the slotted objects keep no __dict__
+    getsizeof = sys.getsizeof
+    size = getsizeof(obj)
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            value = getattr(obj, name, None)
+            if isinstance(value, str):
+                size += getsizeof(value)
+    return size
+
+
+def _fingerprint(data: Dict[str, Any]) -> int:
+    # the API returns the same keys in a stable order, so hashing the values is enough
+    # to detect changes, and is much faster than comparing the reprs
+    values = tuple(data.values())
+    try:
+        return hash(values)
+    except TypeError:
+        # champions have their abilities nested as dicts
+        return hash(tuple(
+            tuple(value.values()) if type(value) is dict else value for value in values
+        ))
+
+
+class CacheChanges:
+    """
+    Represents the changes between two consecutive cache entries of the same language,
+    usually caused by a game patch.
+
+    You can find this on the `CacheEntry.changes` attribute.
+
+    Attributes
+    ----------
+    added_champions : List[Champion]
+        Champions that have been added.
+    removed_champions : List[Champion]
+        Champions that have been removed. These come from the previous entry.
+    changed_champions : List[Champion]
+        Champions which information has changed - their new version.\n
+        Changes to a champion's cards or talents alone are listed under the devices instead.
+    added_devices : List[Device]
+        Devices (shop items, cards and talents) that have been added.
+    removed_devices : List[Device]
+        Devices that have been removed. These come from the previous entry.
+    changed_devices : List[Device]
+        Devices which information has changed - their new version.
+    """
+    def __init__(self, previous: CacheEntry, current: CacheEntry):
+        previous_champions = previous.champions._id_lookup
+        current_champions = current.champions._id_lookup
+        self.added_champions: List[Champion] = [
+            c for c in current.champions if c.id not in previous_champions
+        ]
+        self.removed_champions: List[Champion] = [
+            c for c in previous.champions if c.id not in current_champions
+        ]
+        self.changed_champions: List[Champion] = [
+            c for c in current.champions
+            if c.id in previous_champions
+            and current._champion_fingerprints[c.id] != previous._champion_fingerprints[c.id]
+        ]
+        previous_devices = previous.devices._id_lookup
+        current_devices = current.devices._id_lookup
+        self.added_devices: List[Device] = [
+            d for d in current.devices if d.id not in previous_devices
+        ]
+        self.removed_devices: List[Device] = [
+            d for d in previous.devices if d.id not in current_devices
+        ]
+        self.changed_devices: List[Device] = [
+            d for d in current.devices
+            if d.id in previous_devices
+            and current._device_fingerprints[d.id] != previous._device_fingerprints[d.id]
+        ]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(champions: +{len(self.added_champions)} "
+            f"-{len(self.removed_champions)} ~{len(self.changed_champions)}, "
+            f"devices: +{len(self.added_devices)} -{len(self.removed_devices)} "
+            f"~{len(self.changed_devices)})"
+        )
+
+    def __bool__(self) -> bool:
+        return any((
+            self.added_champions,
+            self.removed_champions,
+            self.changed_champions,
+            self.added_devices,
+            self.removed_devices,
+            self.changed_devices,
+        ))
+
+
 class CacheEntry:
     """
     Represents a collection of champions, cards, talents and shop items.
@@ -417,23 +747,84 @@ class CacheEntry:
     devices : Lookup[Device]
         An object that lets you iterate over all devices (shop items, cards and talents).\n
         Use ``list(...)`` to get a list instead.
+    changes : Optional[CacheChanges]
+        The changes from the previous entry of the same language, that this entry has replaced
+        during the cache refresh.\n
+        `None` if this entry wasn't created as a refresh.
     """
     def __init__(
-        self, language: Language, expires_at: datetime, champions_data: dict, items_data: dict
+        self,
+        language: Language,
+        expires_at: datetime,
+        champions_data: dict,
+        items_data: dict,
+        *,
+        cores: Optional[_SharedCores] = None,
+        previous: Optional[CacheEntry] = None,
     ):
         self.language = language
         self._expires_at = expires_at
+        # objects that haven't changed since the previous entry are reused as-is
+        previous_devices: Dict[int, Device] = {}
+        previous_champions: Dict[int, Champion] = {}
+        previous_device_fps: Dict[int, int] = {}
+        previous_champion_fps: Dict[int, int] = {}
+        if previous is not None:
+            previous_devices = previous.devices._id_lookup
+            previous_champions = previous.champions._id_lookup
+            previous_device_fps = previous._device_fingerprints
+            previous_champion_fps = previous._champion_fingerprints
+        self._device_fingerprints: Dict[int, int] = {}
+        self._champion_fingerprints: Dict[int, int] = {}
+        device_data_lookup: Dict[int, Dict[str, Any]] = {}
         sorted_devices: Dict[int, List[Device]] = {}
-        items = []
-        cards = []
-        talents = []
+        all_devices: List[Device] = []
         for device_data in items_data:
-            device = Device(device_data)
-            device_type = device.type
-            if device_type == DeviceType.Undefined:
+            device_id = device_data["ItemId"]
+            fingerprint = _fingerprint(device_data)
+            self._device_fingerprints[device_id] = fingerprint
+            reused_device = previous_devices.get(device_id)
+            if reused_device is not None and previous_device_fps[device_id] == fingerprint:
+                device = reused_device
+            else:
+                device = Device(device_data, cores=cores)
+            if device.type == DeviceType.Undefined:
                 # skip invalid / unknown devices
                 continue
+            device_data_lookup[device_id] = device_data
             sorted_devices.setdefault(device_data["champion_id"], []).append(device)
+            all_devices.append(device)
+        # a champion can be reused only if all of it's devices are reused too
+        reused_champions: Dict[int, Champion] = {}
+        for champion_data in champions_data:
+            champion_id = champion_data["id"]
+            fingerprint = _fingerprint(champion_data)
+            self._champion_fingerprints[champion_id] = fingerprint
+            reused_champion = previous_champions.get(champion_id)
+            if (
+                reused_champion is not None
+                and previous_champion_fps[champion_id] == fingerprint
+                and set(map(id, sorted_devices.get(champion_id, []))) == set(
+                    map(id, chain(reused_champion.talents, reused_champion.cards))
+                )
+            ):
+                reused_champions[champion_id] = reused_champion
+        # the remaining reused devices are linked to their previous champion,
+        # and have to be recreated instead, to leave the previous entry untouched
+        items = []
+        cards = []
+        talents = []
+        sorted_devices.clear()
+        for device in all_devices:
+            champion_id = device_data_lookup[device.id]["champion_id"]
+            if (
+                champion_id
+                and champion_id not in reused_champions
+                and previous_devices.get(device.id) is device
+            ):
+                device = Device(device_data_lookup[device.id], cores=cores)
+            sorted_devices.setdefault(champion_id, []).append(device)
+            device_type = device.type
             if device_type == DeviceType.Card:
                 cards.append(device)
             elif device_type == DeviceType.Talent:
@@ -444,18 +835,66 @@ class CacheEntry:
         self.cards: Lookup[Device] = Lookup(cards)
         self.talents: Lookup[Device] = Lookup(talents)
         self.devices: Lookup[Device] = Lookup(chain(items, talents, cards))
-        self.champions: Lookup[Champion] = Lookup(
-            Champion(sorted_devices.get(c["id"], []), c) for c in champions_data
-        )
+        champions = []
+        for champion_data in champions_data:
+            champion_id = champion_data["id"]
+            reused_champion = reused_champions.get(champion_id)
+            if reused_champion is not None:
+                champions.append(reused_champion)
+            else:
+                champions.append(
+                    Champion(sorted_devices.get(champion_id, []), champion_data, cores=cores)
+                )
+        self.champions: Lookup[Champion] = Lookup(champions)
         self.abilities: Lookup[Ability] = Lookup(
             a for c in self.champions for a in c.abilities
         )
-        logger.debug(
-            f"CacheEntry({language=}, expires_at={self._expires_at}, "
-            f"len(champions)={len(self.champions)}, len(devices)={len(self.devices)}, "
-            f"len(items)={len(self.items)}, len(cards)={len(self.cards)}, "
-            f"len(talents)={len(self.talents)}) -> created"
+        self.changes: Optional[CacheChanges] = None
+        if previous is not None:
+            self.changes = CacheChanges(previous, self)
+        self._size: Optional[int] = None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "CacheEntry(language=%r, expires_at=%s, len(champions)=%s, len(devices)=%s, "
+                "len(items)=%s, len(cards)=%s, len(talents)=%s) -> created",
+                language, self._expires_at, len(self.champions), len(self.devices),
+                len(self.items), len(self.cards), len(self.talents),
+            )
+
+    def _cores(self) -> Iterator[Any]:
+        # the language-independent cores of all objects
+        objects: Iterable[Union[Champion, Ability, Device]] = chain(
+            self.champions, self.abilities, self.devices
         )
+        for obj in objects:
+            yield obj._core
+
+    def _estimate_size(self) -> int:
+        # approximate the memory used by this entry - the objects with their text attributes,
+        # as well as all of the lookups
+        if self._size is not None:
+            return self._size
+        getsizeof = sys.getsizeof
+        size = 0
+        lookups: List[Lookup[Any]] = [
+            self.champions, self.abilities, self.items, self.cards, self.talents, self.devices
+        ]
+        objects: List[Any] = list(chain(self.champions, self.abilities, self.devices))
+        for champion in self.champions:
+            lookups.extend((champion.abilities, champion.talents, champion.cards))
+        for obj in objects:
+            # the cores are shared between the languages, and counted separately
+            size += _object_size(obj)
+        for lookup in lookups:
+            size += (
+                getsizeof(lookup._list_lookup)
+                + getsizeof(lookup._id_lookup)
+                + getsizeof(lookup._name_lookup)
+                + getsizeof(lookup._fuzzy_lookup)
+                + sum(map(getsizeof, lookup._fuzzy_lookup))
+            )
+        self._size = size
+        return size
 
     def get_champion(
         self, champion: Union[str, int], /, *, fuzzy: bool = False
@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from typing import Any, Optional, Union, List, Dict, Literal, TYPE_CHECKING
 
-from .utils import Lookup
+from .utils import Lookup, _Core, _SharedCores
 from .mixins import CacheObject
 from .enums import DeviceType, AbilityType
 
@@ -24,6 +24,26 @@ def _card_ability_sort(card: Device) -> str:
     return ability.name
 
 
+class _AbilityCore(_Core):
+    # the language-independent part of an ability
+    __slots__ = ("type", "cooldown", "icon_url")
+
+    def __init__(self, ability_data: Dict[str, Any]):
+        self.type = AbilityType(ability_data["damageType"], return_default=True)
+        self.cooldown: int = ability_data["rechargeSeconds"]
+        self.icon_url: str = ability_data["URL"]
+
+
+class _ChampionCore(_Core):
+    # the language-independent part of a champion
+    __slots__ = ("icon_url", "health", "speed")
+
+    def __init__(self, champion_data: Dict[str, Any]):
+        self.icon_url: str = champion_data["ChampionIcon_URL"]
+        self.health: int = champion_data["Health"]
+        self.speed: int = champion_data["Speed"]
+
+
 class Ability(CacheObject):
     """
     Represents a Champion's Ability.
@@ -42,23 +62,53 @@ class Ability(CacheObject):
         The champion this ability belongs to.
     description : str
         The description of the ability.
-    type : AbilityType
-        The type of the ability (currently only damage type).
-    cooldown : int
-        The ability's cooldown, in seconds.
-    icon_url : str
-        A URL of this ability's icon.
     """
+    __slots__ = ("_core", "champion", "description")
     _desc_pattern = re.compile(r" ?<br>(?:<br>)? ?")  # replace the <br> tags with a new line
 
-    def __init__(self, champion: Champion, ability_data: Dict[str, Any]):
+    def __init__(
+        self,
+        champion: Champion,
+        ability_data: Dict[str, Any],
+        *,
+        cores: Optional[_SharedCores] = None,
+    ):
         super().__init__(id=ability_data["Id"], name=ability_data["Summary"])
         self.champion = champion
         desc = ability_data["Description"].strip().replace('\r', '')
         self.description: str = self._desc_pattern.sub('\n', desc)
-        self.type = AbilityType(ability_data["damageType"], return_default=True)
-        self.cooldown: int = ability_data["rechargeSeconds"]
-        self.icon_url: str = ability_data["URL"]
+        core = _AbilityCore(ability_data)
+        # the halves of a composite ability share the ID, but not the icon
+        self._core: _AbilityCore = (
+            core if cores is None else cores((self.id, core.icon_url), core)
+        )
+
+    @property
+    def type(self) -> AbilityType:
+        """
+        The type of the ability (currently only damage type).
+
+        :type: AbilityType
+        """
+        return self._core.type
+
+    @property
+    def cooldown(self) -> int:
+        """
+        The ability's cooldown, in seconds.
+
+        :type: int
+        """
+        return self._core.cooldown
+
+    @property
+    def icon_url(self) -> str:
+        """
+        A URL of this ability's icon.
+
+        :type: str
+        """
+        return self._core.icon_url
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}: {self.name}({self.id})"
@@ -104,12 +154,6 @@ class Champion(CacheObject):
         The champion's role.
     lore : str
         The champion's lore.
-    icon_url : str
-        A URL of this champion's icon.
-    health : int
-        The amount of health points this champion has at base.
-    speed : int
-        The champion's speed.
     abilities : Lookup[Ability]
         An object that lets you iterate over all abilities this champion has.\n
         Use ``list(...)`` to get a list instead.
@@ -127,20 +171,26 @@ class Champion(CacheObject):
         An iterator that lets you iterate over all cards this champion has.\n
         Use ``list(...)`` to get a list instead.
     """
+    __slots__ = ("_core", "title", "role", "lore", "abilities", "talents", "cards")
     _name_pattern = re.compile(r'([a-z ]+)(?:/\w+)? \(([a-z ]+)\)', re.I)
     _desc_pattern = re.compile(r'([A-Z][a-zA-Z ]+): ([\w\s\-\'%,.]+)(?:<br><br>|(?:\r|\n)\n|$)')
     _url_pattern = re.compile(r'([a-z\-]+)(?=\.(?:jpg|png))')
 
-    def __init__(self, devices: List[Device], champion_data: Dict[str, Any]):
+    def __init__(
+        self,
+        devices: List[Device],
+        champion_data: Dict[str, Any],
+        *,
+        cores: Optional[_SharedCores] = None,
+    ):
         super().__init__(id=champion_data["id"], name=champion_data["Name"])
         self.title: str = champion_data["Title"]
         self.role: Literal[
             "Front Line", "Support", "Damage", "Flank"
         ] = champion_data["Roles"][9:].replace("er", "")
-        self.icon_url: str = champion_data["ChampionIcon_URL"]
         self.lore: str = champion_data["Lore"]
-        self.health: int = champion_data["Health"]
-        self.speed: int = champion_data["Speed"]
+        core = _ChampionCore(champion_data)
+        self._core: _ChampionCore = core if cores is None else cores(self.id, core)
 
         # Abilities
         abilities = []
@@ -169,10 +219,10 @@ class Champion(CacheObject):
                     ability_dict["damageType"] = ability_data["damageType"]
                     ability_dict["rechargeSeconds"] = ability_data["rechargeSeconds"]
                     # add the ability
-                    abilities.append(Ability(self, ability_dict))
+                    abilities.append(Ability(self, ability_dict, cores=cores))
             else:
                 # nope - just append it
-                abilities.append(Ability(self, ability_data))
+                abilities.append(Ability(self, ability_data, cores=cores))
         self.abilities: Lookup[Ability] = Lookup(abilities)
 
         # Talents and Cards
@@ -190,6 +240,33 @@ class Champion(CacheObject):
         self.talents: Lookup[Device] = Lookup(talents)
         self.cards: Lookup[Device] = Lookup(cards)
 
+    @property
+    def icon_url(self) -> str:
+        """
+        A URL of this champion's icon.
+
+        :type: str
+        """
+        return self._core.icon_url
+
+    @property
+    def health(self) -> int:
+        """
+        The amount of health points this champion has at base.
+
+        :type: int
+        """
+        return self._core.health
+
+    @property
+    def speed(self) -> int:
+        """
+        The champion's speed.
+
+        :type: int
+        """
+        return self._core.speed
+
     def __eq__(self, other) -> bool:
         return isinstance(other, self.__class__) and self.id == other.id
 
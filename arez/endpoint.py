@@ -1,22 +1,108 @@
 from __future__ import annotations
 
+import json
 import aiohttp
 import asyncio
 import logging
 from hashlib import md5
-from random import gauss
-from typing import Optional, Union
+from math import ceil
+from itertools import chain
+from time import perf_counter, monotonic
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from typing import Any, Optional, Union, List, Dict, Set, Tuple, Iterable, Iterator
 
-from .exceptions import HTTPException, Unauthorized, Unavailable
+from .enums import Priority
+from .breaker import CircuitBreaker
+from .tracing import _span, AttributeValue
+from .metrics import Metrics, RequestRecord
+from .scheduler import RequestScheduler, _current_priority
+from .usage import DataUsed, _Quota
+from .exceptions import HTTPException, Unauthorized, Unavailable, LimitReached
 
 
 __all__ = ["Endpoint"]
 session_lifetime = timedelta(minutes=15)
+# methods that work even when the API is down, and thus aren't guarded by the circuit breaker
+breaker_exempt = frozenset(("ping", "gethirezserverstatus"))
 timeout = aiohttp.ClientTimeout(total=20, connect=5)
 logger = logging.getLogger(__package__)
 
 
+class _TokenBucket:
+    """
+    A token bucket rate limiter, refilling at ``rate`` tokens per second,
+    and holding at most ``capacity`` of them.
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = monotonic()
+
+    def _refill(self):
+        now = monotonic()
+        self.tokens = min(self.tokens + (now - self.updated_at) * self.rate, self.capacity)
+        self.updated_at = now
+
+    @property
+    def ready(self) -> bool:
+        self._refill()
+        return self.tokens >= 1
+
+    def take(self):
+        self._refill()
+        self.tokens -= 1
+
+    def delay(self) -> float:
+        # the time until the next token is available, in seconds
+        self._refill()
+        return max((1 - self.tokens) / self.rate, 0)
+
+
+class _Credentials:
+    """
+    Represents a single developer ID and authorization key pair, together with the session
+    and the load information associated with it.
+    """
+    def __init__(
+        self,
+        dev_id: Union[int, str],
+        auth_key: str,
+        *,
+        max_concurrent: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+    ):
+        self.dev_id = str(dev_id)
+        self.auth_key = auth_key.upper()
+        self.max_concurrent = max_concurrent
+        self.bucket: Optional[_TokenBucket] = None
+        if rate_limit is not None:
+            self.bucket = _TokenBucket(rate_limit, max(ceil(rate_limit), 1))
+        self.session_key = ''
+        self.session_lock = asyncio.Lock()
+        self.session_expires = datetime.utcnow()
+        self.in_flight = 0
+        self.unauthorized = False
+        self.quota = _Quota()
+        self.reconcile_task: Optional[asyncio.Task] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.dev_id}: {self.in_flight} in flight)"
+
+    @property
+    def available(self) -> bool:
+        return (
+            (self.max_concurrent is None or self.in_flight < self.max_concurrent)
+            and (self.bucket is None or self.bucket.ready)
+        )
+
+    def get_signature(self, method_name: str, timestamp: str) -> str:
+        return md5(''.join((
+            self.dev_id, method_name, self.auth_key, timestamp
+        )).encode()).hexdigest()
+
+
 class Endpoint:
     """
     Represents a basic Hi-Rez endpoint URL wrapper, for handling response types and
@@ -41,9 +127,62 @@ class Endpoint:
         Your developer's ID (devId).
     auth_key : str
         Your developer's authentication key (authKey).
+    credentials : Iterable[Tuple[Union[int, str], str]]
+        Additional developer's ID and authentication key pairs to use.\n
+        Each pair keeps a separate session, and every request is made using the least loaded
+        one. Pairs that turn out to be invalid are skipped for as long as there are others
+        available. The ``max_concurrent`` and ``rate_limit`` limits apply to each pair
+        separately.\n
+        Defaults to no additional pairs.
+    max_concurrent : Optional[int]
+        The maximum amount of requests that can be in flight at the same time,
+        for each developer's ID and authentication key pair.\n
+        Defaults to `None`, meaning no limit.
+    rate_limit : Optional[float]
+        The maximum amount of requests per second, for each developer's ID
+        and authentication key pair. Requests are let through in short bursts of up to
+        one second worth of requests, after which they're spread out evenly.\n
+        Defaults to `None`, meaning no limit.
+    session : Optional[aiohttp.ClientSession]
+        An existing HTTP session to make the requests with, letting several clients
+        (like `StatusPage`) share the same connection pool. A session provided this way
+        isn't closed when this Endpoint is closed.\n
+        Defaults to `None`, meaning a new session is created.
     loop : Optional[asyncio.AbstractEventLoop]
         The event loop you want to use for this Endpoint.\n
         Default loop is used when not provided.
+
+    Attributes
+    ----------
+    scheduler : RequestScheduler
+        The scheduler all requests go through. Set it's ``max_concurrent`` attribute
+        to make requests with a higher `Priority` get handled first.
+    breaker : CircuitBreaker
+        The circuit breaker all requests go through, making them fail fast
+        with the `Unavailable` exception while the API is failing.
+    metrics : Metrics
+        The metrics collected from all requests made.
+    tracer : Optional[Any]
+        An OpenTelemetry tracer (or any object following it's ``Tracer`` interface),
+        used to open a span for each API method call, with a child span for each request made.
+        Request spans carry the method name, priority, batch chunk size, developer's ID used,
+        amount of tries made and the response size as attributes.
+        Cache lookups open a child span too, with the ``arez.cache_hit`` attribute, and the
+        requests made on a cache miss nested under it.\n
+        Defaults to `None`, meaning no tracing.
+    soft_budget : Optional[int]
+        The daily amount of requests each developer's ID can use, after which requests
+        with `Priority.Bulk` priority are rejected with the `LimitReached` exception.\n
+        Defaults to `None`, meaning no budget.
+    hard_budget : Optional[int]
+        The daily amount of requests each developer's ID can use, after which all requests
+        are rejected with the `LimitReached` exception.\n
+        Defaults to `None`, meaning no budget.
+    reconcile_every : Optional[datetime.timedelta]
+        How often the locally counted usage is reconciled with the one reported by the API,
+        for each developer's ID. Each reconciliation uses up a single request.\n
+        Set to `None` to disable reconciling.\n
+        Defaults to 10 minutes.
     """
     def __init__(
         self,
@@ -51,21 +190,42 @@ class Endpoint:
         dev_id: Union[int, str],
         auth_key: str,
         *,
+        credentials: Iterable[Tuple[Union[int, str], str]] = (),
+        max_concurrent: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        session: Optional[aiohttp.ClientSession] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
     ):
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit has to be positive")
         if loop is None:  # pragma: no cover
             loop = asyncio.get_event_loop()
         self.loop = loop
         self.url = url.rstrip('/')
-        self._session_key = ''
-        self._session_lock = asyncio.Lock()
-        self._session_expires = datetime.utcnow()
-        self._http_session = aiohttp.ClientSession(timeout=timeout, loop=loop)
-        self.__dev_id = str(dev_id)
-        self.__auth_key = auth_key.upper()
+        self._credentials: List[_Credentials] = [
+            _Credentials(
+                c_dev_id, c_auth_key, max_concurrent=max_concurrent, rate_limit=rate_limit
+            )
+            for c_dev_id, c_auth_key in chain([(dev_id, auth_key)], credentials)
+        ]
+        self._credentials_waiters: List[asyncio.Future] = []
+        self._reconcile_tasks: Set[asyncio.Task] = set()
+        self._owns_session = session is None
+        if session is None:
+            session = aiohttp.ClientSession(timeout=timeout, loop=loop)
+        self._http_session = session
+        self.scheduler = RequestScheduler()
+        self.breaker = CircuitBreaker()
+        self.metrics = Metrics()
+        self.tracer: Optional[Any] = None
+        self.soft_budget: Optional[int] = None
+        self.hard_budget: Optional[int] = None
+        self.reconcile_every: Optional[timedelta] = timedelta(minutes=10)
 
     def __del__(self):
-        self._http_session.detach()
+        # the attribute is missing if the initialization has failed
+        if getattr(self, "_owns_session", False):
+            self._http_session.detach()
 
     async def close(self):
         """
@@ -74,20 +234,229 @@ class Endpoint:
         Attempting to make a request after the connection is closed
         will result in a `RuntimeError`.
         """
-        await self._http_session.close()  # pragma: no cover
+        await self._close()  # pragma: no cover
 
     async def __aenter__(self) -> Endpoint:  # pragma: no cover
         return self
 
     async def __aexit__(self, exc_type, exc, traceback):
-        await self._http_session.close()
+        await self._close()
+
+    async def _close(self):
+        tasks = list(self._reconcile_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._owns_session:
+            await self._http_session.close()
+
+    @contextmanager
+    def priority(self, priority: Priority) -> Iterator[None]:
+        """
+        A context manager that sets the priority of all requests made within it,
+        that don't specify one explicitly. This includes requests made by other methods.
 
-    def _get_signature(self, method_name: str, timestamp: str):
-        return md5(''.join((
-            self.__dev_id, method_name, self.__auth_key, timestamp
-        )).encode()).hexdigest()
+        .. code-block:: py
+
+            with api.priority(arez.Priority.Interactive):
+                player = await api.get_player("DevilXD")
+
+        Parameters
+        ----------
+        priority : Priority
+            The priority you want to set.
+        """
+        assert isinstance(priority, Priority)
+        token = _current_priority.set(priority)
+        try:
+            yield
+        finally:
+            _current_priority.reset(token)
+
+    def get_data_used(self) -> List[DataUsed]:
+        """
+        Returns the current daily API usage, one for each developer's ID used.
 
-    async def request(self, method_name: str, *data: Union[int, str]):
+        The usage is counted locally, and reconciled with the one reported by the API
+        every `reconcile_every`. Use `fetch_data_used` to force reconciling.
+
+        Returns
+        -------
+        List[DataUsed]
+            A list of usage snapshots.
+        """
+        return [c.quota.snapshot(c.dev_id) for c in self._credentials]
+
+    async def fetch_data_used(self) -> List[DataUsed]:
+        """
+        Reconciles the locally counted API usage with the one reported by the API,
+        and returns the result, one for each developer's ID used.
+
+        Uses up a single request for each developer's ID.
+
+        Returns
+        -------
+        List[DataUsed]
+            A list of usage snapshots.
+        """
+        await asyncio.gather(*(self._reconcile(c) for c in self._credentials))
+        return self.get_data_used()
+
+    def _pick_credentials(
+        self, priority: Priority, reconciling: Optional[_Credentials] = None
+    ) -> Tuple[Optional[_Credentials], Optional[float]]:
+        # returns the credentials to use, or the time after which a rate limit lets
+        # one of them through, if that's what's holding them back
+        if reconciling is not None:
+            # the usage is reconciled regardless of the budget, as it's needed to enforce it
+            candidates = [reconciling]
+        else:
+            candidates = [
+                c for c in self._credentials
+                if c.quota.within_budget(priority, self.soft_budget, self.hard_budget)
+            ]
+            if not candidates:
+                raise LimitReached
+            if any(not c.unauthorized for c in candidates):
+                # while there are valid credentials, wait for them instead of using invalid ones
+                candidates = [c for c in candidates if not c.unauthorized]
+        available = [c for c in candidates if c.available]
+        if not available:
+            delays = [c.bucket.delay() for c in candidates if c.bucket is not None]
+            return None, min((d for d in delays if d > 0), default=None)
+        # pick the least loaded one
+        return min(available, key=lambda c: c.in_flight), None
+
+    async def _acquire_credentials(
+        self, priority: Priority, reconciling: Optional[_Credentials] = None
+    ) -> _Credentials:
+        while True:
+            creds, delay = self._pick_credentials(priority, reconciling)
+            if creds is not None:
+                creds.in_flight += 1
+                if creds.bucket is not None:
+                    creds.bucket.take()
+                return creds
+            # all credentials are at their limit - wait until one of them is released,
+            # or until the rate limit lets the next request through
+            waiter = self.loop.create_future()
+            self._credentials_waiters.append(waiter)
+            try:
+                await asyncio.wait((waiter,), timeout=delay)
+            except asyncio.CancelledError:
+                if waiter.done():
+                    # we've been woken up, but won't use it - pass the wakeup along
+                    self._wake_credentials_waiter()
+                raise
+            finally:
+                self._credentials_waiters.remove(waiter)
+
+    def _release_credentials(self, creds: _Credentials):
+        creds.in_flight -= 1
+        self._wake_credentials_waiter()
+
+    def _wake_credentials_waiter(self):
+        for waiter in self._credentials_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _http_get(self, req_url: str, record: Optional[RequestRecord] = None) -> Any:
+        start = perf_counter()
+        async with self._http_session.get(req_url, timeout=timeout) as response:
+            # Handle special HTTP status codes
+            if response.status == 503:
+                # '503: Service Unavailable'
+                raise Unavailable
+            else:
+                # Raise for any other error code
+                response.raise_for_status()
+            body = await response.read()
+        if record is not None:
+            record._add_phase("http", start)
+            record.payload_size = len(body)
+            start = perf_counter()
+        if not body.strip():
+            return None
+        data = json.loads(body)
+        if record is not None:
+            record._add_phase("decode", start)
+        return data
+
+    def _build_url(
+        self,
+        creds: _Credentials,
+        method_name: str,
+        session_key: str = '',
+        data: Tuple[Union[int, str], ...] = (),
+    ) -> str:
+        req_stack = [self.url, f"{method_name}json"]
+        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        if method_name == "createsession":
+            req_stack.extend(
+                (creds.dev_id, creds.get_signature(method_name, timestamp), timestamp)
+            )
+        elif method_name != "ping":
+            req_stack.extend((
+                creds.dev_id,
+                creds.get_signature(method_name, timestamp),
+                session_key,
+                timestamp,
+            ))
+        if data:
+            req_stack.extend(map(str, data))
+        return '/'.join(req_stack)
+
+    async def _ensure_session(self, creds: _Credentials) -> str:
+        async with creds.session_lock:
+            now = datetime.utcnow()
+            if now >= creds.session_expires:
+                session_url = self._build_url(creds, "createsession")
+                logger.debug("endpoint.request: createsession: %s", session_url)
+                session_response = await self._http_get(session_url)
+                session_id = session_response.get("session_id")
+                if not session_id:
+                    raise Unauthorized
+                creds.quota.add_session()
+                creds.session_key = session_id
+                creds.unauthorized = False
+            creds.session_expires = now + session_lifetime
+        return creds.session_key
+
+    def _schedule_reconcile(self, creds: _Credentials):
+        reconciled_at = creds.quota.reconciled_at
+        if (
+            self.reconcile_every is None
+            or creds.reconcile_task is not None
+            or reconciled_at is not None
+            and datetime.utcnow() - reconciled_at < self.reconcile_every
+        ):
+            return
+        task = self.loop.create_task(self._reconcile(creds))
+        creds.reconcile_task = task
+        self._reconcile_tasks.add(task)
+
+        def reconcile_done(task: asyncio.Task):
+            self._reconcile_tasks.discard(task)
+            creds.reconcile_task = None
+
+        task.add_done_callback(reconcile_done)
+
+    async def _reconcile(self, creds: _Credentials):
+        try:
+            response = await self._make_request(
+                "getdataused", (), Priority.Normal, reconciling=creds
+            )
+            if response and not response[0]["ret_msg"]:
+                creds.quota.reconcile(response[0])
+        except Exception:
+            logger.warning(
+                "Couldn't reconcile the data used for %s", creds.dev_id, exc_info=True
+            )
+
+    async def request(
+        self, method_name: str, *data: Union[int, str], priority: Optional[Priority] = None
+    ):
         """
         Makes a direct request to the HiRez API.
 
@@ -102,6 +471,11 @@ class Endpoint:
         *data : Union[int, str]
             Method parameters requested to add at the end of the request, if applicable.
             Those should be either integers or strings.
+        priority : Optional[Priority]
+            The priority of this request, used for scheduling and when enforcing
+            the daily request budgets.\n
+            Defaults to the priority set with the `priority` context manager,
+            or `Priority.Normal` if none was set.
 
         Returns
         -------
@@ -119,76 +493,121 @@ class Endpoint:
             are deemed invalid.
         Unavailable
             When the Hi-Rez API switches to emergency mode, and no data could be returned
-            at this time.
+            at this time, or when the circuit breaker is open.
+        LimitReached
+            When the daily request budget has been used up for all developer's IDs,
+            at the priority requested.
         """
-        last_exc = None
         method_name = method_name.lower()
+        if priority is None:
+            priority = _current_priority.get() or Priority.Normal
+        return await self._make_request(method_name, data, priority)
 
-        for tries in range(5):  # pragma: no branch
+    async def _make_request(
+        self,
+        method_name: str,
+        data: Tuple[Union[int, str], ...],
+        priority: Priority,
+        *,
+        reconciling: Optional[_Credentials] = None,
+    ):
+        record = RequestRecord(method_name, priority)
+        attributes: Dict[str, AttributeValue] = {
+            "arez.method": method_name, "arez.priority": priority.name
+        }
+        if method_name.endswith("batch") and data:
+            attributes["arez.chunk_size"] = str(data[-1]).count(',') + 1
+        with _span(self.tracer, "Endpoint.request", attributes) as span:
+            try:
+                return await self._request(method_name, data, priority, record, reconciling)
+            except BaseException as exc:
+                record.exception = exc
+                raise
+            finally:
+                self.metrics._record(record)
+                span.set_attribute("arez.tries", record.tries)
+                span.set_attribute("arez.payload_size", record.payload_size)
+                if record.dev_id is not None:
+                    span.set_attribute("arez.dev_id", record.dev_id)
+
+    async def _request(
+        self,
+        method_name: str,
+        data: Tuple[Union[int, str], ...],
+        priority: Priority,
+        record: RequestRecord,
+        reconciling: Optional[_Credentials] = None,
+    ):
+        # when reconciling, the request is made using the credentials provided,
+        # and isn't counted, as the usage reported by the API will include it already
+        last_exc = None
+        guarded = method_name not in breaker_exempt
+
+        tries = 0
+        while tries < 5:  # pragma: no branch
+            # fail fast while the API is failing, without waiting in the queue
+            probe = guarded and self.breaker._acquire()
+            record.tries += 1
+            start = perf_counter()
             try:
-                req_stack = [self.url, f"{method_name}json"]
+                await self.scheduler.acquire(priority)
+            except BaseException:
+                self.breaker._record(None, probe)
+                raise
+            try:
+                creds = await self._acquire_credentials(priority, reconciling)
+            except BaseException:
+                self.scheduler.release()
+                self.breaker._record(None, probe)
+                raise
+            record._add_phase("queue", start)
+            record.dev_id = creds.dev_id
+            # True if the API has responded, False if it failed, None if it's unknown
+            outcome: Optional[bool] = None
+            try:
+                session_key = ''
                 if method_name == "createsession":
-                    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-                    req_stack.extend(
-                        (self.__dev_id, self._get_signature(method_name, timestamp), timestamp)
-                    )
+                    creds.quota.add_session()
                 elif method_name != "ping":
-                    async with self._session_lock:
-                        now = datetime.utcnow()
-                        if now >= self._session_expires:
-                            session_response = await self.request("createsession")  # recursion
-                            session_id = session_response.get("session_id")
-                            if not session_id:
-                                raise Unauthorized
-                            self._session_key = session_id
-                        self._session_expires = now + session_lifetime
-                    # reacquire the current time
-                    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-                    req_stack.extend((
-                        self.__dev_id,
-                        self._get_signature(method_name, timestamp),
-                        self._session_key,
-                        timestamp,
-                    ))
-                if data:
-                    req_stack.extend(map(str, data))
-
-                req_url = '/'.join(req_stack)
-                logger.debug(f"endpoint.request: {method_name}: {req_url}")
-
-                async with self._http_session.get(req_url) as response:
-                    # Handle special HTTP status codes
-                    if response.status == 503:
-                        # '503: Service Unavailable'
-                        raise Unavailable
+                    start = perf_counter()
+                    session_key = await self._ensure_session(creds)
+                    record._add_phase("session", start)
+                    if reconciling is None:
+                        creds.quota.add_request(method_name)
+                        self._schedule_reconcile(creds)
                     else:
-                        # Raise for any other error code
-                        response.raise_for_status()
-
-                    res_data: Union[list, dict] = await response.json()
-
-                    if res_data:
-                        if isinstance(res_data, list) and isinstance(res_data[0], dict):
-                            error = res_data[0].get("ret_msg")
-                        elif isinstance(res_data, dict):
-                            error = res_data.get("ret_msg")
-                        else:
-                            error = None
-                        if error:
-                            # we've got some Hi-Rez API error, handle some of them here
+                        creds.quota.start_reconcile()
+                req_url = self._build_url(creds, method_name, session_key, data)
+                logger.debug("endpoint.request: %s: %s", method_name, req_url)
+
+                res_data: Union[list, dict] = await self._http_get(req_url, record)
+                outcome = True
+
+                if res_data:
+                    if isinstance(res_data, list) and isinstance(res_data[0], dict):
+                        error = res_data[0].get("ret_msg")
+                    elif isinstance(res_data, dict):
+                        error = res_data.get("ret_msg")
+                    else:
+                        error = None
+                    if error:
+                        # we've got some Hi-Rez API error, handle some of them here
 
-                            # Invalid session
-                            if error == "Invalid session id.":
-                                # Invalidate the current session by expiring it, then retry
-                                self._session_expires = datetime.utcnow()
-                                continue
+                        # Invalid session
+                        if error == "Invalid session id.":
+                            # Invalidate the current session by expiring it, then retry
+                            creds.session_expires = datetime.utcnow()
+                            tries += 1
+                            continue
 
-                    return res_data
+                return res_data
 
             # When connection problems happen, just give the api a short break and try again.
             except (
                 aiohttp.ClientConnectionError, asyncio.TimeoutError
             ) as exc:  # pragma: no cover
+                outcome = False
+                record.errors.append(type(exc).__name__)
                 last_exc = exc  # store for the last iteration raise
                 if isinstance(exc, asyncio.TimeoutError):
                     logger.warning("Timed out, retrying...")
@@ -199,23 +618,41 @@ class Endpoint:
                 # pass and retry on the next loop
             # When '.raise_for_status()' generates this one, just wrap it and raise
             except aiohttp.ClientResponseError as exc:
+                outcome = exc.status < 500
+                record.errors.append(type(exc).__name__)
                 logger.exception("Got a response error")
                 raise HTTPException(exc)
-            # For the case where 'createsession' raises it recursively,
+            # For the case where the session creation raises it,
             # or the Hi-Rez API is down - just pass it along
             except (Unauthorized, Unavailable) as exc:
+                record.errors.append(type(exc).__name__)
                 if isinstance(exc, Unauthorized):
+                    creds.unauthorized = True
+                    if reconciling is None and any(
+                        not c.unauthorized for c in self._credentials
+                    ):
+                        # fail over to the other credentials, without using up a try
+                        logger.warning("Credentials %s are invalid, failing over", creds.dev_id)
+                        continue
                     logger.error("You are Unauthorized")
                 elif isinstance(exc, Unavailable):  # pragma: no branch
+                    outcome = False
                     logger.warning("Hi-Rez API is Unavailable")
                 raise
             # Some other exception happened, so just wrap it and propagate along
             except Exception as exc:
+                record.errors.append(type(exc).__name__)
                 logger.exception("Got an unexpected exception")
                 raise HTTPException(exc)
+            finally:
+                self._release_credentials(creds)
+                self.scheduler.release()
+                if guarded:
+                    self.breaker._record(outcome, probe)
 
             # Sleep before retrying
-            await asyncio.sleep(tries * 0.5 * gauss(1, 0.1))  # pragma: no cover
+            await asyncio.sleep(self.breaker.retry_delay(tries))  # pragma: no cover
+            tries += 1  # pragma: no cover
 
         # we've run out of tries, so ¯\_(ツ)_/¯
         # we shouldn't ever end up here, this is a fail-safe
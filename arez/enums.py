@@ -13,6 +13,7 @@ __all__ = [
     "Platform",
     "DeviceType",
     "AbilityType",
+    "Priority",
     "PC_PLATFORMS",
 ]
 
@@ -804,5 +805,29 @@ class Activity(Enum, default_value=5):
     Unknown             = 5
 
 
+class Priority(Enum, default_value=2):
+    """
+    Priority enum. Represents the priority of a request made to the API.
+
+    Lower values mean a higher priority.
+
+    Inherits from `Enum`.
+
+    Attributes
+    ----------
+    Interactive
+        The request is made in direct response to a user action, and should be handled first.
+    Normal
+        The default priority of all requests.
+    Bulk
+        The request is a part of a larger, background job, like crawling through matches.
+        These are the first ones to be rejected when the daily request budget runs low.
+    """
+
+    Interactive = 1
+    Normal      = 2
+    Bulk        = 3
+
+
 # PC platforms constant
 PC_PLATFORMS = (Platform.PC, Platform.Steam, Platform.Discord)
@@ -8,6 +8,7 @@ __all__ = [
     "NotFound",
     "Unauthorized",
     "Unavailable",
+    "LimitReached",
 ]
 
 
@@ -84,3 +85,14 @@ class Unavailable(ArezException):
     """
     def __init__(self):
         super().__init__("Hi-Rez API is currently down!")
+
+
+class LimitReached(ArezException):
+    """
+    The exception raised when a request couldn't be made, because the daily request budget
+    set for all developer's IDs has been used up.
+
+    Inherits from `ArezException`.
+    """
+    def __init__(self):
+        super().__init__("Daily request budget has been reached!")
@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+import io
+import os
+import csv
+import bz2
+import gzip
+import json
+import lzma
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import (
+    Any, Optional, Union, List, Dict, Tuple, Callable, Iterable, AsyncIterable, IO, TYPE_CHECKING
+)
+
+from .enums import Region, Platform
+from .utils import _convert_timestamp, _convert_map_name
+
+_pyarrow: Optional[Any]
+_parquet: Optional[Any]
+try:
+    import pyarrow as _pyarrow  # type: ignore[no-redef]
+    import pyarrow.parquet as _parquet  # type: ignore[no-redef]
+except ImportError:  # pragma: no cover
+    _pyarrow = None
+    _parquet = None
+
+if TYPE_CHECKING:
+    from .match import Match
+
+
+__all__ = [
+    "MatchWriter",
+    "CSVMatchWriter",
+    "JSONLMatchWriter",
+    "ParquetMatchWriter",
+]
+# field name: field type
+FIELDS: Dict[str, str] = {
+    "match_id": "int",
+    "timestamp": "datetime",
+    "queue": "int",
+    "region": "str",
+    "map_name": "str",
+    "duration": "int",
+    "winning_team": "int",
+    "player_id": "int",
+    "player_name": "str",
+    "platform": "str",
+    "champion_id": "int",
+    "champion_name": "str",
+    "team": "int",
+    "winner": "bool",
+    "rank": "int",
+    "kills": "int",
+    "deaths": "int",
+    "assists": "int",
+    "damage_done": "int",
+    "damage_taken": "int",
+    "damage_mitigated": "int",
+    "healing_done": "int",
+    "healing_self": "int",
+    "objective_time": "int",
+    "credits": "int",
+    "account_level": "int",
+    "mastery_level": "int",
+}
+Row = Tuple[Any, ...]
+PathType = Union[str, "os.PathLike[str]"]
+_openers: Dict[Optional[str], Callable[..., IO[Any]]] = {
+    None: open,
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+
+def _match_rows(match: Match) -> List[Row]:
+    region = match.region.name
+    duration = int(match.duration.total_seconds())
+    return [
+        (
+            match.id,
+            match.timestamp,
+            match.queue.value,
+            region,
+            match.map_name,
+            duration,
+            match.winning_team,
+            mp.player.id,
+            mp.player.name,
+            mp.player.platform.name,
+            mp.champion.id,
+            mp._champion_name,
+            mp.team_number,
+            mp.winner,
+            mp.rank.value,
+            mp.kills,
+            mp.deaths,
+            mp.assists,
+            mp.damage_done,
+            mp.damage_taken,
+            mp.damage_mitigated,
+            mp.healing_done,
+            mp.healing_self,
+            mp.objective_time,
+            mp.credits,
+            mp.account_level,
+            mp.mastery_level,
+        )
+        for mp in match.players
+    ]
+
+
+def _raw_row(row: Dict[str, Any]) -> Row:
+    platform = row["playerPortalId"]
+    if isinstance(platform, str) and platform.isdecimal():
+        platform = int(platform)
+    return (
+        row["Match"],
+        _convert_timestamp(row["Entry_Datetime"]),
+        int(row["match_queue_id"]),
+        Region(row["Region"], return_default=True).name,
+        _convert_map_name(row["Map_Game"]),
+        row["Time_In_Match_Seconds"],
+        row["Winning_TaskForce"],
+        int(row["playerId"]),
+        row["playerName"],
+        Platform(platform, return_default=True).name,
+        row["ChampionId"],
+        row["Reference_Name"],
+        row["TaskForce"],
+        row["TaskForce"] == row["Winning_TaskForce"],
+        row["League_Tier"],
+        row["Kills_Player"],
+        row["Deaths"],
+        row["Assists"],
+        row["Damage_Done_Physical"],
+        row["Damage_Taken"],
+        row["Damage_Mitigated"],
+        row["Healing"],
+        row["Healing_Player_Self"],
+        row["Objective_Assists"],
+        row["Gold_Earned"],
+        row["Account_Level"],
+        row["Mastery_Level"],
+    )
+
+
+class MatchWriter(ABC):
+    """
+    The base class for all match writers, that stream matches into a file as flat rows,
+    one row per player.
+
+    Rows are kept in a buffer and written out in batches, so the memory used stays the same
+    regardless of how many matches are written. Use the writer as a context manager,
+    or call `close` once done, to write out the last batch and close the file.
+
+    The fields written, in order, are: ``match_id``, ``timestamp``, ``queue``
+    (the `Queue` value), ``region`` (the `Region` name), ``map_name``, ``duration``
+    (in seconds), ``winning_team``, ``player_id``, ``player_name``, ``platform``
+    (the `Platform` name), ``champion_id``, ``champion_name`` (always in English, regardless
+    of the language the matches were fetched in), ``team`` (``1`` or ``2``), ``winner``,
+    ``rank`` (the `Rank` value), ``kills``, ``deaths``, ``assists``, ``damage_done``,
+    ``damage_taken``, ``damage_mitigated``, ``healing_done``, ``healing_self``,
+    ``objective_time``, ``credits``, ``account_level`` and ``mastery_level``.
+
+    .. code-block:: py
+
+        with arez.CSVMatchWriter("matches.csv.gz", compression="gzip") as writer:
+            await writer.consume(api.get_matches_for_queue(queue, start=start, end=end))
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The path of the file to write into. An existing file is overwritten.
+    compression : Optional[str]
+        The compression to use.\n
+        Defaults to `None`, meaning no compression.
+    batch_size : int
+        The amount of rows to buffer, before writing them out.\n
+        Defaults to ``1000``.
+
+    Attributes
+    ----------
+    path : Union[str, os.PathLike]
+        The path of the file being written into.
+    rows_written : int
+        The amount of rows written so far, including the ones still in the buffer.
+    """
+    fields: Tuple[str, ...] = tuple(FIELDS)
+
+    def __init__(
+        self, path: PathType, *, compression: Optional[str] = None, batch_size: int = 1000
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size has to be at least 1")
+        self.path = path
+        self.rows_written = 0
+        self._batch_size = batch_size
+        self._buffer: List[Row] = []
+        self._closed = False
+        self._open(compression)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, rows_written={self.rows_written})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    @abstractmethod
+    def _open(self, compression: Optional[str]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write_batch(self, batch: List[Row]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def _close(self):
+        raise NotImplementedError
+
+    def _add(self, rows: Iterable[Row]):
+        if self._closed:
+            raise ValueError("The writer is closed")
+        buffer = self._buffer
+        for row in rows:
+            buffer.append(row)
+            self.rows_written += 1
+            if len(buffer) >= self._batch_size:
+                self.flush()
+
+    def write(self, match: Match):
+        """
+        Writes a single match.
+
+        Parameters
+        ----------
+        match : Match
+            The match to write.
+
+        Raises
+        ------
+        ValueError
+            The writer is closed.
+        """
+        self._add(_match_rows(match))
+
+    def extend(self, matches: Iterable[Match]):
+        """
+        Writes all matches from the iterable provided, like the list returned from
+        `PaladinsAPI.get_matches`.
+
+        Parameters
+        ----------
+        matches : Iterable[Match]
+            The matches to write.
+
+        Raises
+        ------
+        ValueError
+            The writer is closed.
+        """
+        for match in matches:
+            self._add(_match_rows(match))
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]):
+        """
+        Writes the raw per-player rows returned by the ``getmatchdetails``
+        and ``getmatchdetailsbatch`` API methods, skipping the creation of `Match` objects
+        entirely.
+
+        Parameters
+        ----------
+        rows : Iterable[Dict[str, Any]]
+            The raw rows to write.
+
+        Raises
+        ------
+        ValueError
+            The writer is closed.
+        """
+        self._add(_raw_row(row) for row in rows)
+
+    async def consume(self, matches: AsyncIterable[Match]) -> int:
+        """
+        Writes all matches from the async iterable provided, one at a time, as they arrive.
+
+        Parameters
+        ----------
+        matches : AsyncIterable[Match]
+            The matches to write, usually `PaladinsAPI.get_matches_for_queue`.
+
+        Returns
+        -------
+        int
+            The amount of matches written.
+
+        Raises
+        ------
+        ValueError
+            The writer is closed.
+        """
+        written = 0
+        async for match in matches:
+            self._add(_match_rows(match))
+            written += 1
+        return written
+
+    def flush(self):
+        """
+        Writes out all rows currently in the buffer.
+        """
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self._buffer.clear()
+
+    def close(self):
+        """
+        Writes out the remaining rows, and closes the file.\n
+        Closing an already closed writer does nothing.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._close()
+
+
+class _TextMatchWriter(MatchWriter):
+    # a writer operating on a text file
+    def _open(self, compression: Optional[str]):
+        opener = _openers.get(compression)
+        if opener is None:
+            raise ValueError(f"Unsupported compression: {compression!r}")
+        self._file: IO[str] = opener(self.path, "wt", encoding="utf8", newline='')
+
+    def _close(self):
+        self._file.close()
+
+
+class CSVMatchWriter(_TextMatchWriter):
+    """
+    A match writer that writes the rows in the CSV format, with a header row.
+    Timestamps are written in the ISO 8601 format.
+
+    Inherits from `MatchWriter`.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The path of the file to write into. An existing file is overwritten.
+    compression : Optional[Literal["gzip", "bz2", "xz"]]
+        The compression to use.\n
+        Defaults to `None`, meaning no compression.
+    batch_size : int
+        The amount of rows to buffer, before writing them out.\n
+        Defaults to ``1000``.
+
+    Raises
+    ------
+    ValueError
+        The compression isn't supported.
+    """
+    def _open(self, compression: Optional[str]):
+        super()._open(compression)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.fields)
+
+    def _write_batch(self, batch: List[Row]):
+        # the timestamp is the second field
+        self._writer.writerows(row[:1] + (row[1].isoformat(),) + row[2:] for row in batch)
+
+
+class JSONLMatchWriter(_TextMatchWriter):
+    """
+    A match writer that writes the rows in the JSON Lines format,
+    as one JSON object per line. Timestamps are written in the ISO 8601 format.
+
+    Inherits from `MatchWriter`.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The path of the file to write into. An existing file is overwritten.
+    compression : Optional[Literal["gzip", "bz2", "xz"]]
+        The compression to use.\n
+        Defaults to `None`, meaning no compression.
+    batch_size : int
+        The amount of rows to buffer, before writing them out.\n
+        Defaults to ``1000``.
+
+    Raises
+    ------
+    ValueError
+        The compression isn't supported.
+    """
+    @staticmethod
+    def _default(value: Any) -> str:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def _write_batch(self, batch: List[Row]):
+        fields = self.fields
+        buffer = io.StringIO()
+        for row in batch:
+            buffer.write(json.dumps(dict(zip(fields, row)), default=self._default))
+            buffer.write('\n')
+        self._file.write(buffer.getvalue())
+
+
+class ParquetMatchWriter(MatchWriter):
+    """
+    A match writer that writes the rows in the Apache Parquet format,
+    with every batch becoming a separate row group.
+
+    Inherits from `MatchWriter`.
+
+    .. note::
+
+        This requires PyArrow to be installed.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The path of the file to write into. An existing file is overwritten.
+    compression : Optional[str]
+        The compression codec to use, like ``snappy``, ``gzip`` or ``zstd``.
+        See `pyarrow.parquet.ParquetWriter` for all of the supported codecs.\n
+        Defaults to `None`, meaning no compression.
+    batch_size : int
+        The amount of rows to buffer, before writing them out.\n
+        Defaults to ``10000``.
+
+    Raises
+    ------
+    ImportError
+        PyArrow isn't installed.
+    """
+    def __init__(
+        self, path: PathType, *, compression: Optional[str] = None, batch_size: int = 10000
+    ):
+        super().__init__(path, compression=compression, batch_size=batch_size)
+
+    def _open(self, compression: Optional[str]):
+        if _pyarrow is None or _parquet is None:
+            raise ImportError(
+                "PyArrow is required for this writer - install it with: pip install aRez[parquet]"
+            )
+        pa = _pyarrow
+        types = {
+            "int": pa.int64(),
+            "str": pa.string(),
+            "bool": pa.bool_(),
+            "datetime": pa.timestamp('s'),
+        }
+        self._schema = pa.schema([(name, types[kind]) for name, kind in FIELDS.items()])
+        self._writer = _parquet.ParquetWriter(
+            self.path, self._schema, compression=compression or "none"
+        )
+
+    def _write_batch(self, batch: List[Row]):
+        assert _pyarrow is not None
+        columns = [_pyarrow.array(column, type=field.type) for column, field in zip(
+            zip(*batch), self._schema
+        )]
+        self._writer.write_table(_pyarrow.Table.from_arrays(columns, schema=self._schema))
+
+    def _close(self):
+        self._writer.close()
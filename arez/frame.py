@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Optional, Union, List, Dict, Tuple, Iterable, Sequence, TYPE_CHECKING
+
+_numpy: Optional[Any]
+try:
+    import numpy as _numpy
+except ImportError:  # pragma: no cover
+    _numpy = None
+
+if TYPE_CHECKING:
+    from .match import Match
+
+
+__all__ = [
+    "MatchFrame",
+    "MatchFrameGroups",
+]
+# column name: array typecode
+COLUMNS: Dict[str, str] = {
+    "match_id": 'q',
+    "player_id": 'q',
+    "champion_id": 'q',
+    "queue": 'h',
+    "duration": 'i',
+    "team": 'b',
+    "winner": 'b',
+    "rank": 'b',
+    "kills": 'h',
+    "deaths": 'h',
+    "assists": 'h',
+    "damage": 'i',
+    "healing": 'i',
+    "credits": 'i',
+}
+GroupKey = Union[int, Tuple[int, ...]]
+
+
+def _require_numpy():
+    if _numpy is None:
+        raise ImportError(
+            "NumPy is required for this operation - install it with: pip install aRez[numpy]"
+        )
+    return _numpy
+
+
+class MatchFrame:
+    """
+    A columnar container of per-player match data, allowing for fast aggregations
+    over large amounts of matches.
+
+    Every player of every match added becomes a single row, with each of the fields
+    stored in a separate, compact `array.array` column. If NumPy is installed,
+    the columns can be viewed as NumPy arrays without copying, and the group-by
+    aggregations are vectorized.
+
+    The available columns are: ``match_id``, ``player_id``, ``champion_id``, ``queue``,
+    ``duration`` (in seconds), ``team`` (``1`` or ``2``), ``winner`` (``1`` or ``0``),
+    ``rank`` (the `Rank` value), ``kills``, ``deaths``, ``assists``, ``damage``, ``healing``
+    and ``credits``.
+
+    Use ``len()`` on this object to get the number of rows.
+
+    .. code-block:: py
+
+        frame = arez.MatchFrame()
+        async for match in api.get_matches_for_queue(queue, start=start, end=end):
+            frame.append_match(match)
+        by_champion = frame.group_by("champion_id")
+        winrates = by_champion.mean("winner")
+        kills = by_champion.sum("kills")
+
+    Parameters
+    ----------
+    matches : Iterable[Match]
+        The matches to add to the frame initially.\n
+        Defaults to no matches.
+    """
+    columns: Tuple[str, ...] = tuple(COLUMNS)
+
+    def __init__(self, matches: Iterable[Match] = ()):
+        self._columns: Dict[str, array] = {
+            name: array(typecode) for name, typecode in COLUMNS.items()
+        }
+        for match in matches:
+            self.append_match(match)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rows={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._columns["match_id"])
+
+    def __getitem__(self, column: str) -> array:
+        """
+        Returns a column of this frame.
+
+        :type: array.array
+        """
+        return self._columns[column]
+
+    @classmethod
+    def from_matches(cls, matches: Iterable[Match]) -> MatchFrame:
+        """
+        Creates a new frame from the matches provided.
+
+        Parameters
+        ----------
+        matches : Iterable[Match]
+            The matches to add.
+
+        Returns
+        -------
+        MatchFrame
+            The new frame.
+        """
+        return cls(matches)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> MatchFrame:
+        """
+        Creates a new frame straight from the raw per-player rows returned by the
+        ``getmatchdetails`` and ``getmatchdetailsbatch`` API methods, skipping the creation
+        of `Match` objects entirely.
+
+        Parameters
+        ----------
+        rows : Iterable[Dict[str, Any]]
+            The raw rows to add.
+
+        Returns
+        -------
+        MatchFrame
+            The new frame.
+        """
+        frame = cls()
+        frame.append_rows(rows)
+        return frame
+
+    def append_match(self, match: Match):
+        """
+        Adds all players of the match provided to this frame.
+
+        Parameters
+        ----------
+        match : Match
+            The match to add.
+        """
+        columns = self._columns
+        queue = match.queue.value
+        duration = int(match.duration.total_seconds())
+        for mp in match.players:
+            columns["match_id"].append(match.id)
+            columns["player_id"].append(mp.player.id)
+            columns["champion_id"].append(mp.champion.id)
+            columns["queue"].append(queue)
+            columns["duration"].append(duration)
+            columns["team"].append(mp.team_number)
+            columns["winner"].append(mp.winner)
+            columns["rank"].append(mp.rank.value)
+            columns["kills"].append(mp.kills)
+            columns["deaths"].append(mp.deaths)
+            columns["assists"].append(mp.assists)
+            columns["damage"].append(mp.damage_done)
+            columns["healing"].append(mp.healing_done)
+            columns["credits"].append(mp.credits)
+
+    def append_rows(self, rows: Iterable[Dict[str, Any]]):
+        """
+        Adds the raw per-player rows provided to this frame.
+
+        See `from_rows` for more information.
+
+        Parameters
+        ----------
+        rows : Iterable[Dict[str, Any]]
+            The raw rows to add.
+        """
+        columns = self._columns
+        for row in rows:
+            team = row["TaskForce"]
+            columns["match_id"].append(row["Match"])
+            columns["player_id"].append(int(row["playerId"]))
+            columns["champion_id"].append(row["ChampionId"])
+            columns["queue"].append(int(row["match_queue_id"]))
+            columns["duration"].append(row["Time_In_Match_Seconds"])
+            columns["team"].append(team)
+            columns["winner"].append(team == row["Winning_TaskForce"])
+            columns["rank"].append(row["League_Tier"])
+            columns["kills"].append(row["Kills_Player"])
+            columns["deaths"].append(row["Deaths"])
+            columns["assists"].append(row["Assists"])
+            columns["damage"].append(row["Damage_Done_Physical"])
+            columns["healing"].append(row["Healing"])
+            columns["credits"].append(row["Gold_Earned"])
+
+    def extend(self, other: MatchFrame):
+        """
+        Appends all rows of another frame to this one.
+
+        Parameters
+        ----------
+        other : MatchFrame
+            The frame to add the rows of.
+        """
+        for name, column in self._columns.items():
+            column.extend(other._columns[name])
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Returns all columns of this frame as NumPy arrays. The arrays share the memory
+        with this frame, so no data is copied.
+
+        .. note::
+
+            This requires NumPy to be installed.
+
+        .. warning::
+
+            Rows can't be added to the frame for as long as these arrays exist,
+            as the underlying memory could be reallocated otherwise.
+            Use ``.copy()`` on them if you need to keep them around.
+
+        Returns
+        -------
+        Dict[str, numpy.ndarray]
+            A mapping of column names to their respective arrays.
+
+        Raises
+        ------
+        ImportError
+            NumPy isn't installed.
+        """
+        np = _require_numpy()
+        arrays = {}
+        for name, column in self._columns.items():
+            if column:
+                arrays[name] = np.frombuffer(column, dtype=column.typecode)
+            else:
+                # empty buffers can't be viewed
+                arrays[name] = np.empty(0, dtype=column.typecode)
+        return arrays
+
+    def group_by(self, by: Union[str, Sequence[str]]) -> MatchFrameGroups:
+        """
+        Groups the rows of this frame by the values of one or more columns.
+
+        Parameters
+        ----------
+        by : Union[str, Sequence[str]]
+            The name of the column to group by, or a sequence of names.
+
+        Returns
+        -------
+        MatchFrameGroups
+            An object that lets you aggregate the groups.
+        """
+        if isinstance(by, str):
+            by = (by,)
+        return MatchFrameGroups(self, tuple(by))
+
+
+class MatchFrameGroups:
+    """
+    Represents the rows of a `MatchFrame` grouped by one or more columns.
+
+    You can get this from the `MatchFrame.group_by` method.
+
+    All aggregations return a dictionary mapping the group's key to the aggregated value.
+    When grouping by a single column, the keys are the column values. When grouping by
+    several columns, they're tuples of the values, in the same order as the columns were given.
+    """
+    def __init__(self, frame: MatchFrame, by: Tuple[str, ...]):
+        self._frame = frame
+        self._by = by
+        self._keys: List[GroupKey] = []
+        self._inverse: Any
+        key_columns = [frame[name] for name in by]
+        if _numpy is not None:
+            np = _numpy
+            if len(by) == 1:
+                keys, inverse = np.unique(
+                    np.asarray(key_columns[0], dtype=np.int64), return_inverse=True
+                )
+                self._keys = keys.tolist()
+            else:
+                stacked = np.column_stack([np.asarray(c, dtype=np.int64) for c in key_columns])
+                keys, inverse = np.unique(stacked, axis=0, return_inverse=True)
+                self._keys = [tuple(k) for k in keys.tolist()]
+            self._inverse = inverse.reshape(-1)
+        else:
+            indexes: Dict[GroupKey, int] = {}
+            inverse_list: List[int] = []
+            values: Iterable[GroupKey] = (
+                key_columns[0] if len(by) == 1 else zip(*key_columns)
+            )
+            for key in values:
+                index = indexes.get(key)
+                if index is None:
+                    index = indexes[key] = len(indexes)
+                inverse_list.append(index)
+            self._keys = list(indexes)
+            self._inverse = inverse_list
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(by={self._by}, groups={len(self._keys)})"
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _sums(self, column: Optional[str]) -> List[float]:
+        group_count = len(self._keys)
+        if _numpy is not None:
+            weights = None if column is None else _numpy.asarray(self._frame[column])
+            return _numpy.bincount(
+                self._inverse, weights=weights, minlength=group_count
+            ).tolist()
+        sums: List[float] = [0] * group_count
+        if column is None:
+            for index in self._inverse:
+                sums[index] += 1
+        else:
+            for index, value in zip(self._inverse, self._frame[column]):
+                sums[index] += value
+        return sums
+
+    def count(self) -> Dict[GroupKey, int]:
+        """
+        Returns the number of rows in each group.
+
+        Returns
+        -------
+        Dict[Union[int, Tuple[int, ...]], int]
+            The mapping of the group keys to the row counts.
+        """
+        return {key: int(value) for key, value in zip(self._keys, self._sums(None))}
+
+    def sum(self, column: str) -> Dict[GroupKey, int]:
+        """
+        Returns the sum of the column's values in each group.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column to sum.
+
+        Returns
+        -------
+        Dict[Union[int, Tuple[int, ...]], int]
+            The mapping of the group keys to the sums.
+        """
+        return {key: int(value) for key, value in zip(self._keys, self._sums(column))}
+
+    def mean(self, column: str) -> Dict[GroupKey, float]:
+        """
+        Returns the average of the column's values in each group.\n
+        Using this on the ``winner`` column gives you the win rates.
+
+        Parameters
+        ----------
+        column : str
+            The name of the column to average.
+
+        Returns
+        -------
+        Dict[Union[int, Tuple[int, ...]], float]
+            The mapping of the group keys to the averages.
+        """
+        return {
+            key: total / count
+            for key, total, count in zip(self._keys, self._sums(column), self._sums(None))
+        }
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import (
+    Optional, Union, List, Dict, Set, Tuple, Iterable, AsyncGenerator, TYPE_CHECKING
+)
+
+from .exceptions import ArezException, Private, NotFound
+
+if TYPE_CHECKING:
+    from .api import PaladinsAPI
+    from .player import PartialPlayer, Player
+
+
+__all__ = [
+    "FriendEdge",
+    "FriendsCrawler",
+]
+logger = logging.getLogger(__package__)
+
+
+class FriendEdge:
+    """
+    Represents a single friendship found by the `FriendsCrawler`.
+
+    Friendships are mutual, so each one is found only once - ``source`` is the player
+    whose friend list has been fetched, and ``target`` is the friend found there.
+
+    Attributes
+    ----------
+    source : Union[PartialPlayer, Player]
+        The player whose friend list contained the ``target``.
+    target : PartialPlayer
+        The friend found.
+    depth : int
+        The level of the crawl the friendship was found at, which is the distance
+        of the ``source`` from the closest seed player, plus one.
+        Friendships found in the friend lists of the seed players have a depth of ``1``.
+    """
+    def __init__(self, source: Union[PartialPlayer, Player], target: PartialPlayer, depth: int):
+        self.source = source
+        self.target = target
+        self.depth = depth
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.source.id} -> {self.target.id}, depth={self.depth})"
+        )
+
+
+class FriendsCrawler:
+    """
+    Crawls the friends graph, breadth-first, starting from the seed players provided.
+
+    Each level of the graph is expanded concurrently, fetching the friend list of every player
+    in it, and the edges found are streamed out as soon as each friend list arrives.
+    Every player is expanded at most once, and every friendship is yielded only once.
+
+    When ``fetch_players`` is enabled, each level is first fetched as full `Player` objects,
+    using a single request for every 20 players. Private profiles are recognized this way,
+    and skipped without spending a request on their friend list.
+
+    .. code-block:: py
+
+        crawler = arez.FriendsCrawler(api, [clan_leader_id], depth=2, max_requests=500)
+        async for edge in crawler:
+            graph.add_edge(edge.source.id, edge.target.id)
+        print(f"{len(crawler.nodes)} players found using {crawler.requests_used} requests")
+
+    Parameters
+    ----------
+    api : PaladinsAPI
+        The API instance to make the requests with.
+    seeds : Iterable[Union[int, PartialPlayer]]
+        The players, or their Player IDs, to start the crawl from.
+        Private players are skipped.
+    depth : int
+        The maximum distance from the seed players to crawl to.\n
+        Defaults to ``1``, meaning only the friend lists of the seed players are fetched.
+    max_requests : Optional[int]
+        The maximum amount of requests the crawl can use up. The crawl stops early
+        once the budget is spent.\n
+        Defaults to `None`, meaning no limit.
+    max_concurrent : int
+        The maximum amount of friend lists fetched at the same time.\n
+        Defaults to ``5``.
+    fetch_players : bool
+        When set to `True`, the players are fetched in batches before being expanded,
+        skipping the private ones and making `nodes` contain `Player` objects.\n
+        Defaults to `False`.
+
+    Attributes
+    ----------
+    nodes : Dict[int, Union[PartialPlayer, Player]]
+        All players found so far, including the seed players, mapped by their Player IDs.
+    expanded : Set[int]
+        The Player IDs of the players whose friend lists have been fetched.
+    failed : Set[int]
+        The Player IDs of the players whose friend lists couldn't be fetched, because
+        their profile turned out to be private, or the request failed.\n
+        Their friendships can still be found from the other side, by expanding their friends.
+    requests_used : int
+        The amount of requests used up so far.
+    """
+    def __init__(
+        self,
+        api: PaladinsAPI,
+        seeds: Iterable[Union[int, PartialPlayer]],
+        *,
+        depth: int = 1,
+        max_requests: Optional[int] = None,
+        max_concurrent: int = 5,
+        fetch_players: bool = False,
+    ):
+        if depth < 1:
+            raise ValueError("The depth has to be at least 1")
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent has to be at least 1")
+        self._api = api
+        self.depth = depth
+        self.max_requests = max_requests
+        self.fetch_players = fetch_players
+        self.nodes: Dict[int, Union[PartialPlayer, Player]] = {}
+        self.expanded: Set[int] = set()
+        self.failed: Set[int] = set()
+        self.requests_used = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._seeds: List[int] = []
+        from .player import PartialPlayer  # noqa, cyclic imports
+        for seed in seeds:
+            if isinstance(seed, int):
+                seed = PartialPlayer(api, id=seed)
+            if seed.private or not seed.id or seed.id in self.nodes:
+                continue
+            self.nodes[seed.id] = seed
+            self._seeds.append(seed.id)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(nodes={len(self.nodes)}, "
+            f"expanded={len(self.expanded)}, failed={len(self.failed)}, "
+            f"requests_used={self.requests_used})"
+        )
+
+    def __aiter__(self) -> AsyncGenerator[FriendEdge, None]:
+        return self.crawl()
+
+    @property
+    def _budget(self) -> Optional[int]:
+        if self.max_requests is None:
+            return None
+        return max(self.max_requests - self.requests_used, 0)
+
+    def _affordable(self, frontier: List[int]) -> int:
+        # the amount of players from the frontier that can be expanded within the budget,
+        # including the batch requests needed to fetch them first
+        budget = self._budget
+        if budget is None:
+            return len(frontier)
+        count = min(len(frontier), budget)
+        if self.fetch_players:
+            while count and count + (count + 19) // 20 > budget:
+                count -= 1
+        return count
+
+    async def _fetch_players(self, frontier: List[int]) -> List[int]:
+        self.requests_used += (len(frontier) + 19) // 20
+        try:
+            players = await self._api.get_players(frontier, return_private=True)
+        except ArezException as exc:
+            # expand the partial players anyway
+            logger.warning("FriendsCrawler -> fetching the players failed: %r", exc)
+            return frontier
+        public = []
+        for player in players:
+            if player.private:
+                continue
+            self.nodes[player.id] = player
+            public.append(player.id)
+        return public
+
+    async def _expand(
+        self, player: Union[PartialPlayer, Player]
+    ) -> Tuple[Union[PartialPlayer, Player], Optional[List[PartialPlayer]]]:
+        # the friend list is None if it couldn't be fetched
+        async with self._semaphore:
+            try:
+                return player, await player.get_friends()
+            except (Private, NotFound):
+                return player, None
+            except ArezException as exc:
+                logger.warning(
+                    "FriendsCrawler -> fetching the friends of Player(id=%s) failed: %r",
+                    player.id,
+                    exc,
+                )
+                return player, None
+
+    async def crawl(self) -> AsyncGenerator[FriendEdge, None]:
+        """
+        Runs the crawl, yielding the friendships as they're found.\n
+        Iterating over the crawler does this automatically.
+
+        Stopping the iteration early cancels all friend list fetches still in progress.
+
+        Returns
+        -------
+        AsyncGenerator[FriendEdge, None]
+            An async generator yielding the edges of the friends graph.
+        """
+        frontier = [
+            player_id
+            for player_id in self._seeds
+            if player_id not in self.expanded and player_id not in self.failed
+        ]
+        for depth in range(1, self.depth + 1):
+            count = self._affordable(frontier)
+            if count < len(frontier):
+                logger.info(
+                    "FriendsCrawler -> request budget reached, skipping %s players",
+                    len(frontier) - count,
+                )
+                frontier = frontier[:count]
+            if not frontier:
+                break
+            if self.fetch_players:
+                frontier = await self._fetch_players(frontier)
+            self.requests_used += len(frontier)
+            tasks = [
+                asyncio.ensure_future(self._expand(self.nodes[player_id]))
+                for player_id in frontier
+            ]
+            next_frontier: List[int] = []
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    source, friends = await next_done
+                    if friends is None:
+                        # not expanded, so that the friends can still yield these friendships
+                        self.failed.add(source.id)
+                        continue
+                    self.expanded.add(source.id)
+                    for friend in friends:
+                        if friend.id in self.expanded:
+                            # already yielded from the other side
+                            continue
+                        if friend.id not in self.nodes:
+                            self.nodes[friend.id] = friend
+                            next_frontier.append(friend.id)
+                        yield FriendEdge(source, friend, depth)
+            finally:
+                for task in tasks:
+                    task.cancel()
+            frontier = next_frontier
@@ -4,6 +4,7 @@ import re
 from typing import Any, Optional, Union, List, Dict, TYPE_CHECKING
 
 from .enums import DeviceType, Language
+from .utils import _Core, _SharedCores
 from .mixins import APIClient, CacheObject
 
 if TYPE_CHECKING:
@@ -21,6 +22,41 @@ __all__ = [
 ]
 
 
+class _DeviceCore(_Core):
+    # the language-independent part of a device
+    __slots__ = ("type", "icon_url", "base", "scale", "cooldown", "price", "unlocked_at")
+    _card_pattern = re.compile(r'{scale=((?:0\.)?\d+)\|((?:0\.)?\d+)}|{(\d+)}')
+
+    def __init__(self, device_data: Dict[str, Any], description: str):
+        self.base: float = 0.0
+        self.scale: float = 0.0
+        match = self._card_pattern.search(description)
+        if match:
+            group3 = match.group(3)
+            if group3:
+                self.base = float(group3)
+                self.scale = float(group3)
+            else:
+                self.base = float(match.group(1))
+                self.scale = float(match.group(2))
+        item_type = device_data["item_type"]
+        if item_type == "Inventory Vendor - Talents":
+            self.type = DeviceType.Talent
+        elif (
+            item_type.startswith("Card Vendor Rank")
+            or item_type == "Inventory Vendor - Champion Cards"
+        ):
+            self.type = DeviceType.Card
+        elif item_type.startswith("Burn Card"):
+            self.type = DeviceType.Item
+        else:
+            self.type = DeviceType.Undefined
+        self.icon_url: str = device_data["itemIcon_URL"]
+        self.cooldown: int = device_data["recharge_seconds"]
+        self.price: int = device_data["Price"]
+        self.unlocked_at: int = device_data["talent_reward_level"]
+
+
 class Device(CacheObject):
     """
     Represents a Device - those are usually cards, talents and shop items.
@@ -35,12 +71,8 @@ class Device(CacheObject):
         ID of the device.
     name : str
         Name of the device.
-    type : DeviceType
-        The type of the device.
     description : str
         The device's description.
-    icon_url : str
-        The URL of this device's icon.
     ability : Union[Ability, CacheObject]
         The ability this device affects, or a `CacheObject` with only the name set,
         denoting the affected part of the champion.\n
@@ -50,26 +82,11 @@ class Device(CacheObject):
         The champion this device belongs to.\n
         This is a `CacheObject` with incomplete cache.
         `None` for shop items.
-    base : float
-        The base value of the card's or shop item's scaling.\n
-        ``0.0`` for talents.
-    scale : float
-        The scale value of the card's or shop item's scaling.\n
-        ``0.0`` for talents.
-    cooldown : int
-        The cooldown of this device, in seconds.
-        ``0`` if there is no cooldown.
-    price : int
-        The price of this device.
-        ``0`` if there's no price (it's free).
-    unlocked_at : int
-        The champion's mastery level required to unlock this device. Applies only to talents.
-        ``0`` means it's unlocked by default.
     """
+    __slots__ = ("_core", "description", "ability", "champion")
     _desc_pattern = re.compile(r'\[(.+?)\] (.*)')
-    _card_pattern = re.compile(r'{scale=((?:0\.)?\d+)\|((?:0\.)?\d+)}|{(\d+)}')
 
-    def __init__(self, device_data: Dict[str, Any]):
+    def __init__(self, device_data: Dict[str, Any], *, cores: Optional[_SharedCores] = None):
         super().__init__(id=device_data["ItemId"], name=device_data["DeviceName"])
         self.description: str = device_data["Description"].strip()
         self.ability: Union[Ability, CacheObject] = CacheObject()
@@ -77,39 +94,82 @@ class Device(CacheObject):
         if match:
             self.ability = CacheObject(name=match.group(1))
             self.description = match.group(2)
-        self.base: float = 0.0
-        self.scale: float = 0.0
-        match = self._card_pattern.search(self.description)
-        if match:
-            group3 = match.group(3)
-            if group3:
-                self.base = float(group3)
-                self.scale = float(group3)
-            else:
-                self.base = float(match.group(1))
-                self.scale = float(match.group(2))
-        item_type = device_data["item_type"]
-        if item_type == "Inventory Vendor - Talents":
-            self.type = DeviceType.Talent
-        elif (
-            item_type.startswith("Card Vendor Rank")
-            or item_type == "Inventory Vendor - Champion Cards"
-        ):
-            self.type = DeviceType.Card
-        elif item_type.startswith("Burn Card"):
-            self.type = DeviceType.Item
-        else:
-            self.type = DeviceType.Undefined
         # start with None by default
         self.champion: Optional[Union["Champion", CacheObject]] = None
         # if the champion ID is non-zero, replace it with a cache object
         if champion_id := device_data["champion_id"]:
             # later overwritten when the device is added to a champion
             self.champion = CacheObject(id=champion_id)
-        self.icon_url: str = device_data["itemIcon_URL"]
-        self.cooldown: int = device_data["recharge_seconds"]
-        self.price: int = device_data["Price"]
-        self.unlocked_at: int = device_data["talent_reward_level"]
+        core = _DeviceCore(device_data, self.description)
+        self._core: _DeviceCore = core if cores is None else cores(self.id, core)
+
+    @property
+    def type(self) -> DeviceType:
+        """
+        The type of the device.
+
+        :type: DeviceType
+        """
+        return self._core.type
+
+    @property
+    def icon_url(self) -> str:
+        """
+        The URL of this device's icon.
+
+        :type: str
+        """
+        return self._core.icon_url
+
+    @property
+    def base(self) -> float:
+        """
+        The base value of the card's or shop item's scaling.\n
+        ``0.0`` for talents.
+
+        :type: float
+        """
+        return self._core.base
+
+    @property
+    def scale(self) -> float:
+        """
+        The scale value of the card's or shop item's scaling.\n
+        ``0.0`` for talents.
+
+        :type: float
+        """
+        return self._core.scale
+
+    @property
+    def cooldown(self) -> int:
+        """
+        The cooldown of this device, in seconds.\n
+        ``0`` if there is no cooldown.
+
+        :type: int
+        """
+        return self._core.cooldown
+
+    @property
+    def price(self) -> int:
+        """
+        The price of this device.\n
+        ``0`` if there's no price (it's free).
+
+        :type: int
+        """
+        return self._core.price
+
+    @property
+    def unlocked_at(self) -> int:
+        """
+        The champion's mastery level required to unlock this device. Applies only to talents.\n
+        ``0`` means it's unlocked by default.
+
+        :type: int
+        """
+        return self._core.unlocked_at
 
     def __eq__(self, other) -> bool:
         return isinstance(other, self.__class__) and self.id == other.id
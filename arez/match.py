@@ -5,7 +5,7 @@ from itertools import count
 from typing import Any, Optional, Union, List, Dict, Generator, TYPE_CHECKING
 
 from .exceptions import NotFound
-from .utils import _convert_map_name
+from .utils import _convert_map_name, _raw_data
 from .enums import Queue, Language, Region, Rank
 from .mixins import APIClient, CacheObject, MatchMixin, MatchPlayerMixin, Expandable, WinLoseMixin
 
@@ -107,6 +107,7 @@ class PartialMatch(MatchPlayerMixin, MatchMixin, Expandable):
         MatchPlayerMixin.__init__(self, player, language, match_data)
         MatchMixin.__init__(self, match_data)
         self._language = language
+        self._raw: Optional[Dict[str, Any]] = match_data if self._api.keep_raw else None
 
     async def _expand(self) -> Match:
         """
@@ -124,7 +125,7 @@ class PartialMatch(MatchPlayerMixin, MatchMixin, Expandable):
         NotFound
             The match could not be found.
         """
-        logger.info(f"PartialMatch(id={self.id}).expand()")
+        logger.info("PartialMatch(id=%s).expand()", self.id)
         response = await self._api.request("getmatchdetails", self.id)
         if not response:
             raise NotFound("Match")
@@ -133,6 +134,48 @@ class PartialMatch(MatchPlayerMixin, MatchMixin, Expandable):
     def __repr__(self) -> str:
         return f"{self.queue.name}: {self.champion.name}: {self.kda_text}"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a JSON-serializable dictionary, that can be turned back into the match object
+        with `from_dict`, without making any requests.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The serialized match.
+
+        Raises
+        ------
+        ValueError
+            The raw data hasn't been kept, because ``keep_raw`` wasn't enabled on the API.
+        """
+        return {
+            "player": self.player.to_dict(),
+            "language": self._language.value,
+            "data": _raw_data(self),
+        }
+
+    @classmethod
+    def from_dict(cls, api: "PaladinsAPI", data: Dict[str, Any]) -> PartialMatch:
+        """
+        Recreates the match object from the dictionary returned by `to_dict`.
+
+        Parameters
+        ----------
+        api : PaladinsAPI
+            The API instance to bind the match to, used for the cache lookups.
+        data : Dict[str, Any]
+            The serialized match.
+
+        Returns
+        -------
+        PartialMatch
+            The recreated match.
+        """
+        from .player import PartialPlayer  # noqa, cyclic imports
+        player = PartialPlayer.from_dict(api, data["player"])
+        return cls(player, Language(data["language"]), data["data"])
+
     @property
     def disconnected(self) -> bool:
         """
@@ -210,6 +253,8 @@ class MatchPlayer(MatchPlayerMixin):
     party_number : int
         A number denoting the party the player belonged to.\n
         ``0`` means the player wasn't in a party.
+    rank : Rank
+        The player's ranked tier at the time of the match.
     """
     def __init__(
         self,
@@ -236,6 +281,7 @@ class MatchPlayer(MatchPlayerMixin):
         self.account_level: int = player_data["Account_Level"]
         self.mastery_level: int = player_data["Mastery_Level"]
         self.party_number: int = parties.get(player_data["PartyId"], 0)
+        self.rank = Rank(player_data["League_Tier"], return_default=True)
 
     @property
     def disconnected(self) -> bool:
@@ -301,9 +347,11 @@ class Match(APIClient, MatchMixin):
         players: Dict[int, Player],
     ):
         APIClient.__init__(self, api)
+        self._language = language
+        self._raw: Optional[List[Dict[str, Any]]] = match_data if api.keep_raw else None
         first_player = match_data[0]
         MatchMixin.__init__(self, first_player)
-        logger.debug(f"Match(id={self.id}) -> creating...")
+        logger.debug("Match(id=%s) -> creating...", self.id)
         self.replay_available: bool = first_player["hasReplay"] == "y"
         self.bans: List[Union[Champion, CacheObject]] = []
         for i in range(1, 5):
@@ -339,7 +387,7 @@ class Match(APIClient, MatchMixin):
                 self.team1.append(match_player)
             elif team_number == 2:  # pragma: no branch
                 self.team2.append(match_player)
-        logger.debug(f"Match(id={self.id}) -> created")
+        logger.debug("Match(id=%s) -> created", self.id)
 
     @property
     def players(self) -> Generator[MatchPlayer, None, None]:
@@ -351,6 +399,55 @@ class Match(APIClient, MatchMixin):
     def __repr__(self) -> str:
         return f"{self.queue.name}({self.id}): {self.score}"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a JSON-serializable dictionary, that can be turned back into the match object
+        with `from_dict`, without making any requests.\n
+        Any full `Player` objects of the match players are stored as well.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The serialized match.
+
+        Raises
+        ------
+        ValueError
+            The raw data hasn't been kept, because ``keep_raw`` wasn't enabled on the API.
+        """
+        from .player import Player  # noqa, cyclic imports
+        return {
+            "language": self._language.value,
+            "data": _raw_data(self),
+            "players": [
+                mp.player.to_dict() for mp in self.players if isinstance(mp.player, Player)
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, api: "PaladinsAPI", data: Dict[str, Any]) -> Match:
+        """
+        Recreates the match object from the dictionary returned by `to_dict`.
+
+        Parameters
+        ----------
+        api : PaladinsAPI
+            The API instance to bind the match to, used for the cache lookups.
+        data : Dict[str, Any]
+            The serialized match.
+
+        Returns
+        -------
+        Match
+            The recreated match.
+        """
+        from .player import Player  # noqa, cyclic imports
+        players: Dict[int, Player] = {}
+        for player_data in data["players"]:
+            player = Player(api, player_data["data"])
+            players[player.id] = player
+        return cls(api, Language(data["language"]), data["data"], players)
+
     async def expand_players(self):
         """
         Makes partial player objects in the containing match player objects be expanded into
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left
+from time import perf_counter
+from collections import Counter
+from typing import Optional, Union, List, Dict, Tuple, Callable, Iterable
+
+from .enums import Priority
+
+
+__all__ = [
+    "Histogram",
+    "MethodMetrics",
+    "Metrics",
+    "RequestRecord",
+]
+logger = logging.getLogger(__package__)
+# the request phases measured
+PHASES = ("queue", "session", "http", "decode")
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+class Histogram:
+    """
+    A simple histogram, counting the observed values into buckets.
+
+    Attributes
+    ----------
+    buckets : Tuple[Union[int, float], ...]
+        The upper bounds (inclusive) of the buckets, in ascending order.\n
+        There's an additional, implicit ``+Inf`` bucket at the end.
+    counts : List[int]
+        The amount of values observed within each bucket, including the ``+Inf`` one.\n
+        These aren't cumulative.
+    count : int
+        The total amount of values observed.
+    sum : float
+        The sum of all values observed.
+    """
+    def __init__(self, buckets: Iterable[Union[int, float]]):
+        self.buckets: Tuple[Union[int, float], ...] = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={self.count}, sum={round(self.sum, 3)})"
+
+    def observe(self, value: Union[int, float]):
+        """
+        Adds a value to the histogram.
+
+        Parameters
+        ----------
+        value : Union[int, float]
+            The value to add.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """
+        Returns the cumulative bucket counts, in the format Prometheus uses.
+
+        Returns
+        -------
+        List[Tuple[float, int]]
+            A list of (upper bound, count) pairs, ending with the ``+Inf`` bucket.
+        """
+        result: List[Tuple[float, int]] = []
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates the given quantile, as the upper bound of the bucket it falls into.
+
+        Parameters
+        ----------
+        q : float
+            The quantile to estimate, between ``0`` and ``1``.
+
+        Returns
+        -------
+        Optional[float]
+            The estimated quantile.\n
+            `None` is returned if no values were observed yet.
+        """
+        if not self.count:
+            return None
+        target = q * self.count
+        for bound, total in self.cumulative():
+            if total >= target:
+                return bound
+        return float("inf")  # pragma: no cover
+
+
+class RequestRecord:
+    """
+    Represents a single `Endpoint.request` call that has finished,
+    including all of it's retries.
+
+    These are passed to the listeners registered with `Metrics.add_listener`.
+
+    Attributes
+    ----------
+    method_name : str
+        The name of the method requested.
+    priority : Priority
+        The priority of the request.
+    dev_id : Optional[str]
+        The developer's ID used for the last try.\n
+        `None` if the request didn't get to pick one.
+    tries : int
+        The amount of tries made.
+    duration : float
+        The total time the request took, in seconds.
+    phases : Dict[str, float]
+        The time spent in each phase of the request, in seconds, summed over all tries.\n
+        The phases are: ``queue`` (waiting for the scheduler and the credentials),
+        ``session`` (creating the session), ``http`` (waiting for and reading the response)
+        and ``decode`` (decoding the JSON response).
+    payload_size : int
+        The size of the last response body, in bytes.
+    errors : List[str]
+        The class names of all exceptions encountered, including the ones that were
+        retried on.
+    exception : Optional[BaseException]
+        The exception the request has ultimately raised.\n
+        `None` if it has succeeded.
+    """
+    def __init__(self, method_name: str, priority: Priority):
+        self.method_name = method_name
+        self.priority = priority
+        self.dev_id: Optional[str] = None
+        self.tries = 0
+        self.duration = 0.0
+        self.phases: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.payload_size = 0
+        self.errors: List[str] = []
+        self.exception: Optional[BaseException] = None
+        self._start = perf_counter()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.method_name}: "
+            f"{round(self.duration * 1000, 1)}ms, {self.tries} tries)"
+        )
+
+    @property
+    def retries(self) -> int:
+        """
+        The amount of retries made.
+
+        :type: int
+        """
+        return max(self.tries - 1, 0)
+
+    def _add_phase(self, phase: str, start: float):
+        self.phases[phase] += perf_counter() - start
+
+    def _finish(self):
+        self.duration = perf_counter() - self._start
+
+
+class MethodMetrics:
+    """
+    Represents the metrics collected for a single API method.
+
+    Attributes
+    ----------
+    method_name : str
+        The name of the method these metrics are for.
+    requests : int
+        The amount of requests made.
+    failures : Dict[str, int]
+        The amount of requests that have raised an exception, broken down by it's class name.
+    errors : Dict[str, int]
+        The amount of exceptions encountered, including the ones that were retried on,
+        broken down by their class name.
+    retries : int
+        The total amount of retries made.
+    latency : Histogram
+        A histogram of the total request times, in seconds.
+    phases : Dict[str, Histogram]
+        Histograms of the time spent in each phase of the requests, in seconds.\n
+        See `RequestRecord.phases` for the phases available.
+    payload_size : Histogram
+        A histogram of the response body sizes, in bytes.
+    """
+    def __init__(self, method_name: str):
+        self.method_name = method_name
+        self.requests = 0
+        self.failures: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.retries = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.phases: Dict[str, Histogram] = {
+            phase: Histogram(LATENCY_BUCKETS) for phase in PHASES
+        }
+        self.payload_size = Histogram(SIZE_BUCKETS)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.method_name}: {self.requests} requests, "
+            f"{sum(self.failures.values())} failed)"
+        )
+
+    def _add(self, record: RequestRecord):
+        self.requests += 1
+        self.retries += record.retries
+        self.errors.update(record.errors)
+        if record.exception is not None:
+            self.failures[type(record.exception).__name__] += 1
+        self.latency.observe(record.duration)
+        for phase, duration in record.phases.items():
+            self.phases[phase].observe(duration)
+        if record.payload_size:
+            self.payload_size.observe(record.payload_size)
+
+
+class Metrics:
+    """
+    Collects the metrics of all requests made through the `Endpoint.request` method.
+
+    The collected metrics can be read at any time, and exported to a monitoring system
+    of your choice. Alternatively, a listener can be registered, to get notified about
+    every request that has finished.
+
+    You can find this on the `Endpoint.metrics` attribute.
+
+    Attributes
+    ----------
+    methods : Dict[str, MethodMetrics]
+        The metrics collected so far, for each method name requested.
+    """
+    def __init__(self):
+        self.methods: Dict[str, MethodMetrics] = {}
+        self._listeners: List[Callable[[RequestRecord], None]] = []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.methods)} methods)"
+
+    def add_listener(self, listener: Callable[[RequestRecord], None]):
+        """
+        Registers a listener, that'll be called with a `RequestRecord` each time
+        a request finishes. Exceptions raised by the listener are logged and ignored.
+
+        Parameters
+        ----------
+        listener : Callable[[RequestRecord], None]
+            The listener to register.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[RequestRecord], None]):
+        """
+        Unregisters a listener registered with `add_listener`.
+
+        Parameters
+        ----------
+        listener : Callable[[RequestRecord], None]
+            The listener to unregister.
+
+        Raises
+        ------
+        ValueError
+            The listener wasn't registered.
+        """
+        self._listeners.remove(listener)
+
+    def reset(self):
+        """
+        Clears all metrics collected so far. The listeners stay registered.
+        """
+        self.methods.clear()
+
+    def _record(self, record: RequestRecord):
+        record._finish()
+        method_metrics = self.methods.get(record.method_name)
+        if method_metrics is None:
+            method_metrics = self.methods[record.method_name] = MethodMetrics(record.method_name)
+        method_metrics._add(record)
+        for listener in self._listeners:
+            try:
+                listener(record)
+            except Exception:
+                logger.exception("A metrics listener has raised an exception")
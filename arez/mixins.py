@@ -49,6 +49,8 @@ class CacheObject:
         The object's name.\n
         Defaults to ``Unknown`` if not set.
     """
+    __slots__ = ("id", "name", "__weakref__")
+
     def __init__(self, *, id: int = 0, name: str = "Unknown"):
         self.id: int = id
         self.name: str = name
@@ -325,6 +327,8 @@ class MatchPlayerMixin(APIClient, KDAMixin):
         if champion is None:
             champion = CacheObject(id=champion_id, name=champion_name)
         self.champion: Union[Champion, CacheObject] = champion
+        # the English name returned by the API, regardless of the language
+        self._champion_name: str = champion_name
         self.credits: int = creds
         self.damage_done: int = damage
         self.damage_bot: int = match_data["Damage_Bot"]
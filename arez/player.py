@@ -3,14 +3,14 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from functools import cached_property
-from typing import Optional, Union, List, SupportsInt, TYPE_CHECKING
+from typing import Any, Optional, Union, List, Dict, SupportsInt, TYPE_CHECKING
 
 from .items import Loadout
 from .match import PartialMatch
 from .status import PlayerStatus
 from .exceptions import Private, NotFound
 from .mixins import APIClient, Expandable
-from .utils import _convert_timestamp, Duration
+from .utils import _convert_timestamp, _raw_data, Duration
 from .enums import Language, Platform, Region, Queue
 from .stats import Stats, RankedStats, ChampionStats
 
@@ -63,8 +63,8 @@ class PartialPlayer(APIClient, Expandable):
         self._platform = Platform(platform, return_default=True)
         self._private = bool(private)
         logger.debug(
-            f"Player(id={self._id}, name={self._name}, platform={self._platform.name}, "
-            f"private={self._private}) -> created"
+            "Player(id=%s, name=%s, platform=%s, private=%s) -> created",
+            self._id, self._name, self._platform.name, self._private,
         )
 
     async def _expand(self) -> Player:
@@ -87,7 +87,7 @@ class PartialPlayer(APIClient, Expandable):
         """
         if self.private:
             raise Private
-        logger.info(f"Player(id={self._id}).expand()")
+        logger.info("Player(id=%s).expand()", self._id)
         player_list = await self._api.request("getplayer", self._id)
         if not player_list:
             raise NotFound("Player")
@@ -106,6 +106,52 @@ class PartialPlayer(APIClient, Expandable):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}: {self.name}({self.id} / {self.platform.name})"
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a JSON-serializable dictionary, that can be turned back into the player object
+        with `from_dict`, without making any requests.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The serialized player.
+        """
+        return {
+            "id": self._id,
+            "name": self._name,
+            "platform": self._platform.value,
+            "private": self._private,
+        }
+
+    @classmethod
+    def from_dict(cls, api: "PaladinsAPI", data: Dict[str, Any]) -> Union[PartialPlayer, Player]:
+        """
+        Recreates the player object from the dictionary returned by `to_dict`.\n
+        A `Player` is returned for serialized `Player` objects,
+        and a `PartialPlayer` otherwise.
+
+        Parameters
+        ----------
+        api : PaladinsAPI
+            The API instance to bind the player to.
+        data : Dict[str, Any]
+            The serialized player.
+
+        Returns
+        -------
+        Union[PartialPlayer, Player]
+            The recreated player.
+        """
+        if "data" in data:
+            return Player(api, data["data"])
+        return PartialPlayer(
+            api,
+            id=data["id"],
+            name=data["name"],
+            platform=data["platform"],
+            private=data["private"],
+        )
+
     @property
     def id(self) -> int:
         """
@@ -169,7 +215,7 @@ class PartialPlayer(APIClient, Expandable):
         """
         if self.private:
             raise Private
-        logger.info(f"Player(id={self._id}).get_status()")
+        logger.info("Player(id=%s).get_status()", self._id)
         response = await self._api.request("getplayerstatus", self._id)
         if not response or response[0]["status"] == 5:
             raise NotFound("Player status")
@@ -194,7 +240,7 @@ class PartialPlayer(APIClient, Expandable):
         """
         if self.private:
             raise Private
-        logger.info(f"Player(id={self._id}).get_friends()")
+        logger.info("Player(id=%s).get_friends()", self._id)
         response = await self._api.request("getfriends", self._id)
         return [
             PartialPlayer(self._api, id=p["player_id"], name=p["name"], platform=p["portal_id"])
@@ -231,7 +277,7 @@ class PartialPlayer(APIClient, Expandable):
             language = self._api._default_language
         # ensure we have champion information first
         await self._api._ensure_entry(language)
-        logger.info(f"Player(id={self._id}).get_loadouts({language=})")
+        logger.info("Player(id=%s).get_loadouts(language=%r)", self._id, language)
         response = await self._api.request("getplayerloadouts", self._id, language.value)
         if not response or response and not response[0]["playerId"]:
             return []
@@ -271,7 +317,7 @@ class PartialPlayer(APIClient, Expandable):
             language = self._api._default_language
         # ensure we have champion information first
         await self._api._ensure_entry(language)
-        logger.info(f"Player(id={self._id}).get_champion_stats({language=})")
+        logger.info("Player(id=%s).get_champion_stats(language=%r)", self._id, language)
         if queue is None:
             response = await self._api.request("getgodranks", self._id)
         else:
@@ -307,7 +353,7 @@ class PartialPlayer(APIClient, Expandable):
             language = self._api._default_language
         # ensure we have champion information first
         await self._api._ensure_entry(language)
-        logger.info(f"Player(id={self._id}).get_match_history({language=})")
+        logger.info("Player(id=%s).get_match_history(language=%r)", self._id, language)
         response = await self._api.request("getmatchhistory", self._id)
         if not response or response and response[0]["ret_msg"]:
             return []
@@ -369,7 +415,8 @@ class Player(PartialPlayer):
     ranked_controller : RankedStats
         Player's ranked controller statistics.
     """
-    def __init__(self, api: "PaladinsAPI", player_data):
+    def __init__(self, api: "PaladinsAPI", player_data: Dict[str, Any]):
+        self._raw: Optional[Dict[str, Any]] = player_data if api.keep_raw else None
         player_name: str = player_data["hz_player_name"]
         gamer_tag: str = player_data["hz_gamer_tag"]
         name: str = player_data["Name"]
@@ -415,6 +462,23 @@ class Player(PartialPlayer):
         self.ranked_keyboard = RankedStats("Keyboard", player_data["RankedKBM"])
         self.ranked_controller = RankedStats("Controller", player_data["RankedController"])
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a JSON-serializable dictionary, that can be turned back into the player object
+        with `from_dict`, without making any requests.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The serialized player.
+
+        Raises
+        ------
+        ValueError
+            The raw data hasn't been kept, because ``keep_raw`` wasn't enabled on the API.
+        """
+        return {"data": _raw_data(self)}
+
     @cached_property
     def ranked_best(self) -> RankedStats:
         """
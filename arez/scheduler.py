@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from collections import deque
+from contextvars import ContextVar
+from typing import Optional, Dict, Deque, Tuple
+
+from .enums import Priority
+
+
+__all__ = ["RequestScheduler"]
+# the priority set for the current context, used by requests that don't specify one
+_current_priority: ContextVar[Optional[Priority]] = ContextVar("priority", default=None)
+
+
+class RequestScheduler:
+    """
+    A request scheduler, limiting the amount of requests that can be in flight at the same time,
+    and letting the waiting ones through in the order of their `Priority`.
+
+    Requests of the same priority are let through in the order they've arrived.
+    To prevent starvation, the longer a request waits, the higher it's priority becomes -
+    after waiting for ``aging`` seconds, it's treated as if it was one priority level higher.
+
+    You can find this on the `Endpoint.scheduler` attribute.
+
+    Parameters
+    ----------
+    max_concurrent : Optional[int]
+        The maximum amount of requests that can be in flight at the same time.\n
+        Defaults to `None`, meaning no limit, in which case priorities have no effect.
+    aging : float
+        The amount of seconds after which a waiting request is promoted by one priority level.\n
+        Defaults to ``5`` seconds.
+
+    Attributes
+    ----------
+    in_flight : int
+        The amount of requests currently in flight.
+    aging : float
+        The amount of seconds after which a waiting request is promoted by one priority level.
+    """
+    def __init__(self, max_concurrent: Optional[int] = None, *, aging: float = 5):
+        self._max_concurrent = max_concurrent
+        self.aging = aging
+        self.in_flight = 0
+        self._waiters: Dict[Priority, Deque[Tuple[float, asyncio.Future]]] = {
+            priority: deque() for priority in Priority
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.in_flight}/{self._max_concurrent} in flight, "
+            f"{sum(self.queued.values())} queued)"
+        )
+
+    @property
+    def max_concurrent(self) -> Optional[int]:
+        """
+        The maximum amount of requests that can be in flight at the same time.\n
+        `None` means no limit. This can be changed at any time.
+
+        :type: Optional[int]
+        """
+        return self._max_concurrent
+
+    @max_concurrent.setter
+    def max_concurrent(self, max_concurrent: Optional[int]):
+        self._max_concurrent = max_concurrent
+        self._wake()
+
+    @property
+    def queued(self) -> Dict[Priority, int]:
+        """
+        The amount of requests currently waiting, for each priority.
+
+        :type: Dict[Priority, int]
+        """
+        return {
+            priority: sum(1 for _, waiter in waiters if not waiter.done())
+            for priority, waiters in self._waiters.items()
+        }
+
+    def _can_run(self) -> bool:
+        return self._max_concurrent is None or self.in_flight < self._max_concurrent
+
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        now = monotonic()
+        best_waiters: Optional[Deque[Tuple[float, asyncio.Future]]] = None
+        best_key: Optional[Tuple[float, float]] = None
+        for priority, waiters in self._waiters.items():
+            # skip the cancelled ones
+            while waiters and waiters[0][1].done():
+                waiters.popleft()
+            if not waiters:
+                continue
+            # the oldest waiter of each priority is always the first one
+            queued_at = waiters[0][0]
+            effective = float(priority.value)
+            if self.aging > 0:
+                effective -= (now - queued_at) // self.aging
+            key = (effective, queued_at)
+            if best_key is None or key < best_key:
+                best_key = key
+                best_waiters = waiters
+        if best_waiters is None:
+            return None
+        return best_waiters.popleft()[1]
+
+    def _wake(self):
+        while self._can_run():
+            waiter = self._next_waiter()
+            if waiter is None:
+                break
+            # the slot is handed over to the waiter here
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    async def acquire(self, priority: Priority = Priority.Normal):
+        """
+        Waits until a request of the given priority can be made.
+
+        Each call has to be paired with a `release` call afterwards.
+
+        Parameters
+        ----------
+        priority : Priority
+            The priority of the request.\n
+            Defaults to `Priority.Normal`.
+        """
+        if self._can_run() and not any(self._waiters.values()):
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters[priority].append((monotonic(), waiter))
+        # there might be a free slot already, with only cancelled waiters queued up
+        self._wake()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if not waiter.cancelled():
+                # we've been given the slot, but won't use it
+                self.release()
+            raise
+
+    def release(self):
+        """
+        Releases the slot acquired with `acquire`, letting the next waiting request through.
+        """
+        self.in_flight -= 1
+        self._wake()
@@ -2,10 +2,11 @@ from datetime import datetime
 from typing import Any, Optional, Union, Dict, Literal, TYPE_CHECKING, cast
 
 from .enums import Rank, Language, Queue
-from .utils import Duration, _convert_timestamp
+from .utils import Duration, _convert_timestamp, _raw_data
 from .mixins import CacheObject, WinLoseMixin, KDAMixin
 
 if TYPE_CHECKING:
+    from .api import PaladinsAPI
     from .champion import Champion
     from .player import PartialPlayer, Player
 
@@ -135,7 +136,9 @@ class ChampionStats(WinLoseMixin, KDAMixin):
             deaths=stats_data["Deaths"],
             assists=stats_data["Assists"],
         )
+        self._language = language
         self.player: Union[PartialPlayer, Player] = player
+        self._raw: Optional[Dict[str, Any]] = stats_data if player._api.keep_raw else None
         self.queue: Optional[Queue] = queue
         if queue is None:
             champion_id = int(stats_data["champion_id"])
@@ -158,3 +161,49 @@ class ChampionStats(WinLoseMixin, KDAMixin):
 
     def __repr__(self) -> str:
         return f"{self.champion.name}({self.level}): ({self.wins}/{self.losses}) {self.kda_text}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a JSON-serializable dictionary, that can be turned back into the stats object
+        with `from_dict`, without making any requests.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The serialized stats.
+
+        Raises
+        ------
+        ValueError
+            The raw data hasn't been kept, because ``keep_raw`` wasn't enabled on the API.
+        """
+        return {
+            "player": self.player.to_dict(),
+            "language": self._language.value,
+            "queue": None if self.queue is None else self.queue.value,
+            "data": _raw_data(self),
+        }
+
+    @classmethod
+    def from_dict(cls, api: "PaladinsAPI", data: Dict[str, Any]) -> "ChampionStats":
+        """
+        Recreates the stats object from the dictionary returned by `to_dict`.
+
+        Parameters
+        ----------
+        api : PaladinsAPI
+            The API instance to bind the stats to, used for the cache lookups.
+        data : Dict[str, Any]
+            The serialized stats.
+
+        Returns
+        -------
+        ChampionStats
+            The recreated stats.
+        """
+        from .player import PartialPlayer  # noqa, cyclic imports
+        player = PartialPlayer.from_dict(api, data["player"])
+        queue = data["queue"]
+        if queue is not None:
+            queue = Queue(queue, return_default=True)
+        return cls(player, Language(data["language"]), data["data"], queue)
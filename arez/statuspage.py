@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+import copy
+import json
+import asyncio
+import hashlib
+import logging
 import aiohttp
+from time import perf_counter
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Literal, cast
+from typing import Any, Optional, List, Dict, Literal, cast
+
+from .enums import Priority
+from .endpoint import Endpoint, timeout
+from .tracing import _span, AttributeValue
+from .metrics import Metrics, RequestRecord
+from .scheduler import _current_priority
+
+
+logger = logging.getLogger(__package__)
 
 
 def _convert_timestamp(stamp: str) -> datetime:
@@ -424,28 +439,187 @@ class CurrentStatus:
         return self._groups.get(group)
 
 
+class _CachedResponse:
+    # the last response received for a single endpoint
+    __slots__ = ("etag", "last_modified", "digest", "data")
+
+    def __init__(
+        self, etag: Optional[str], last_modified: Optional[str], digest: bytes, data: Any
+    ):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+        self.data = data
+
+
 class StatusPage:
-    def __init__(self, url: str):
+    """
+    The status page client.
+
+    Requests are conditional - the ``ETag`` and ``Last-Modified`` headers of the previous
+    response are sent back to the server, and the previous response is reused if the server
+    reports no changes, or the body received hashes the same as before.
+    In both cases, `get_status` returns the previous `CurrentStatus` object again,
+    instead of parsing a new one.
+
+    Every request uses the same timeouts as the API requests, and is retried on connection
+    problems and timeouts, waiting exponentially longer between each try.
+
+    .. code-block:: py
+
+        api = arez.PaladinsAPI(dev_id, auth_key)
+        # share the HTTP session, metrics and tracer with the API
+        status_page = arez.StatusPage("http://status.hirezstudios.com", api=api)
+
+    Parameters
+    ----------
+    url : str
+        The URL of the status page.
+    api : Optional[Endpoint]
+        The API instance to share the HTTP session, `Endpoint.metrics`
+        and `Endpoint.tracer` with.\n
+        Defaults to `None`, meaning the status page uses it's own.
+    session : Optional[aiohttp.ClientSession]
+        An existing HTTP session to make the requests with. Takes precedence over
+        the session of the ``api``. A session provided either way isn't closed when
+        the status page is closed.\n
+        Defaults to `None`, meaning a new session is created, unless an ``api`` was provided.
+    max_retries : int
+        The maximum amount of retries made for each request.\n
+        Defaults to ``3``.
+
+    Attributes
+    ----------
+    metrics : Metrics
+        The metrics collected from all requests made. This is the API's `Endpoint.metrics`,
+        if an ``api`` was provided. Methods are recorded as ``statuspage:<endpoint>``.
+    tracer : Optional[Any]
+        An OpenTelemetry tracer, used to open a span for each request made.\n
+        Defaults to `None`, meaning the tracer of the ``api`` is used if one was provided,
+        and no tracing is done otherwise.
+    max_retries : int
+        The maximum amount of retries made for each request.
+    """
+    def __init__(
+        self,
+        url: str,
+        *,
+        api: Optional[Endpoint] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_retries: int = 3,
+    ):
         self.url = f"{url.rstrip('/')}/api/v2"
-        self._session = aiohttp.ClientSession(raise_for_status=True)
+        self._api = api
+        if session is None and api is not None:
+            session = api._http_session
+        self._owns_session = session is None
+        if session is None:
+            session = aiohttp.ClientSession(timeout=timeout)
+        self._session = session
+        self.metrics: Metrics = api.metrics if api is not None else Metrics()
+        self.tracer: Optional[Any] = None
+        self.max_retries = max_retries
+        self._responses: Dict[str, _CachedResponse] = {}
+        self._status: Optional[CurrentStatus] = None
+        self._status_digest: Optional[bytes] = None
 
     def __del__(self):
-        self._session.detach()
+        if self._owns_session:
+            self._session.detach()
 
     async def close(self):
-        await self._session.close()  # pragma: no cover
+        """
+        Closes the underlying HTTP session, unless it has been provided from the outside.
+        """
+        if self._owns_session:  # pragma: no branch
+            await self._session.close()
 
     # async with integration
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc, traceback):
-        await self._session.close()
+        await self.close()
 
-    async def request(self, endpoint: str):
+    async def _fetch(self, endpoint: str) -> _CachedResponse:
+        record = RequestRecord(
+            f"statuspage:{endpoint}", _current_priority.get() or Priority.Normal
+        )
+        tracer = self.tracer
+        if tracer is None and self._api is not None:
+            tracer = self._api.tracer
+        attributes: Dict[str, AttributeValue] = {"arez.endpoint": endpoint}
+        with _span(tracer, "StatusPage.request", attributes) as span:
+            try:
+                return await self._fetch_retrying(endpoint, record)
+            except BaseException as exc:
+                record.exception = exc
+                raise
+            finally:
+                self.metrics._record(record)
+                span.set_attribute("arez.tries", record.tries)
+                span.set_attribute("arez.payload_size", record.payload_size)
+
+    async def _fetch_retrying(self, endpoint: str, record: RequestRecord) -> _CachedResponse:
+        for tries in range(self.max_retries + 1):  # pragma: no branch
+            record.tries += 1
+            try:
+                return await self._fetch_once(endpoint, record)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                record.errors.append(type(exc).__name__)
+                if tries >= self.max_retries:
+                    raise
+                logger.warning("StatusPage -> %s: %r, retrying...", endpoint, exc)
+            except aiohttp.ClientResponseError as exc:
+                record.errors.append(type(exc).__name__)
+                raise
+            await asyncio.sleep(min(0.5 * 2 ** tries, 10))
+        raise RuntimeError("Ran out of retries")  # pragma: no cover
+
+    async def _fetch_once(self, endpoint: str, record: RequestRecord) -> _CachedResponse:
         route = f"{self.url}/{endpoint}"
-        async with self._session.get(route) as response:
-            return await response.json()
+        cached = self._responses.get(endpoint)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        start = perf_counter()
+        async with self._session.get(route, headers=headers, timeout=timeout) as response:
+            if response.status == 304:
+                if cached is None:
+                    # nothing to reuse - the request wasn't even conditional
+                    raise aiohttp.ClientResponseError(
+                        response.request_info,
+                        response.history,
+                        status=response.status,
+                        message="Not Modified received without a cached response",
+                        headers=response.headers,
+                    )
+                record._add_phase("http", start)
+                return cached
+            response.raise_for_status()
+            body = await response.read()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+        record._add_phase("http", start)
+        record.payload_size = len(body)
+        start = perf_counter()
+        digest = hashlib.sha1(body).digest()
+        if cached is not None and cached.digest == digest:
+            # the server doesn't support conditional requests, but nothing has changed
+            cached.etag = etag
+            cached.last_modified = last_modified
+            return cached
+        cached = _CachedResponse(etag, last_modified, digest, json.loads(body))
+        self._responses[endpoint] = cached
+        record._add_phase("decode", start)
+        return cached
+
+    async def request(self, endpoint: str):
+        # the cached data is shared between requests - don't let the caller modify it
+        return copy.deepcopy((await self._fetch(endpoint)).data)
 
     async def get_status(self) -> CurrentStatus:
         """
@@ -454,12 +628,18 @@ class StatusPage:
         Returns
         -------
         CurrentStatus
-            The current status requested.
+            The current status requested.\n
+            If nothing has changed since the last fetch, the same object is returned again.
 
         Raises
         ------
         aiohttp.ClientError
             When there was an error while fetching the current status.
+        asyncio.TimeoutError
+            When the status page didn't respond in time, after all retries.
         """
-        response = await self.request("summary.json")
-        return CurrentStatus(response)
+        response = await self._fetch("summary.json")
+        if self._status is None or response.digest != self._status_digest:
+            self._status = CurrentStatus(response.data)
+            self._status_digest = response.digest
+        return self._status
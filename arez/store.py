@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import os
+import json
+import sqlite3
+import logging
+from datetime import datetime, timezone
+from typing import (
+    Any, Optional, Union, List, Dict, Iterable, Collection, TYPE_CHECKING
+)
+
+from .match import Match
+from .enums import Language, Queue
+from .utils import _convert_timestamp, _raw_data
+
+if TYPE_CHECKING:
+    from .api import PaladinsAPI
+    from .player import PartialPlayer
+
+
+__all__ = ["MatchStore"]
+logger = logging.getLogger(__package__)
+PathType = Union[str, "os.PathLike[str]"]
+RawMatch = List[Dict[str, Any]]
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    queue INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_queue_timestamp ON matches (queue, timestamp);
+CREATE INDEX IF NOT EXISTS matches_timestamp ON matches (timestamp);
+CREATE TABLE IF NOT EXISTS match_players (
+    player_id INTEGER NOT NULL,
+    match_id INTEGER NOT NULL,
+    queue INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    PRIMARY KEY (player_id, match_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS match_players_player_queue_timestamp
+    ON match_players (player_id, queue, timestamp);
+"""
+
+
+def _to_unix(timestamp: datetime) -> int:
+    # naive timestamps are assumed to be in UTC, just like the ones returned from the API
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp())
+
+
+class MatchStore:
+    """
+    A local, SQLite-backed store of full matches.
+
+    Matches are stored as the raw data returned from the API, so they can be recreated
+    at any time later, without making any requests - even after Hi-Rez removes them
+    from the server, which happens after 30 days. Each match is written only once.
+
+    The store is indexed by the match ID, as well as the player ID, queue and timestamp,
+    allowing for fast local queries.
+
+    Passing the store to `PaladinsAPI` via the ``match_store`` parameter makes
+    `PaladinsAPI.get_match` and `PaladinsAPI.get_matches` look up the store before making
+    any requests, and save the matches fetched into it.
+
+    .. code-block:: py
+
+        store = arez.MatchStore("matches.db")
+        api = arez.PaladinsAPI(dev_id, auth_key, match_store=store)
+        match = await api.get_match(match_id)  # fetched and stored
+        match = await api.get_match(match_id)  # read from the store
+        # all ranked matches of a player during the last week
+        matches = store.query(
+            api,
+            player=player_id,
+            queue=arez.Queue.Competitive_Keyboard,
+            start=datetime.utcnow() - timedelta(days=7),
+        )
+
+    .. note::
+
+        The store uses the standard `sqlite3` module, which blocks while reading
+        and writing. This is usually negligible for a local database file.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike]
+        The path to the database file. It's created if it doesn't exist.\n
+        Defaults to ``":memory:"``, meaning the store is kept in memory only.
+
+    Attributes
+    ----------
+    path : Union[str, os.PathLike]
+        The path to the database file.
+    """
+    def __init__(self, path: PathType = ":memory:"):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def __enter__(self) -> MatchStore:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+
+    def __contains__(self, match_id: object) -> bool:
+        return self._connection.execute(
+            "SELECT 1 FROM matches WHERE id = ?", (match_id,)
+        ).fetchone() is not None
+
+    def close(self):
+        """
+        Closes the underlying database connection.
+        """
+        self._connection.close()
+
+    def _add_raw(self, raw_matches: Iterable[RawMatch]) -> int:
+        match_rows = []
+        player_rows = []
+        for rows in raw_matches:
+            first_player = rows[0]
+            match_id: int = first_player["Match"]
+            queue = int(first_player["match_queue_id"])
+            stamp = _convert_timestamp(first_player["Entry_Datetime"])
+            timestamp = _to_unix(stamp) if stamp is not None else 0
+            match_rows.append(
+                (match_id, queue, timestamp, json.dumps(rows, separators=(',', ':')))
+            )
+            for row in rows:
+                player_id = int(row["playerId"])
+                if player_id:
+                    # skip private players
+                    player_rows.append((player_id, match_id, queue, timestamp))
+        if not match_rows:
+            return 0
+        with self._connection as connection:
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO matches VALUES (?, ?, ?, ?)", match_rows
+            )
+            added = connection.total_changes - before
+            connection.executemany(
+                "INSERT OR IGNORE INTO match_players VALUES (?, ?, ?, ?)", player_rows
+            )
+        logger.debug("MatchStore -> added %s out of %s matches", added, len(match_rows))
+        return added
+
+    def _get_raw(self, match_ids: Collection[int]) -> Dict[int, RawMatch]:
+        raw: Dict[int, RawMatch] = {}
+        ids_list = list(match_ids)
+        # stay below the default SQLite limit of bound parameters
+        for i in range(0, len(ids_list), 500):
+            chunk_ids = ids_list[i:i+500]
+            placeholders = ','.join('?' * len(chunk_ids))
+            for match_id, data in self._connection.execute(
+                f"SELECT id, data FROM matches WHERE id IN ({placeholders})", chunk_ids
+            ):
+                raw[match_id] = json.loads(data)
+        return raw
+
+    def add(self, match: Match) -> bool:
+        """
+        Stores the match provided.
+
+        Parameters
+        ----------
+        match : Match
+            The match to store.
+
+        Returns
+        -------
+        bool
+            `True` if the match was stored, `False` if it was already present in the store.
+
+        Raises
+        ------
+        ValueError
+            The match doesn't keep its raw data, because ``keep_raw`` wasn't enabled on the API.
+        """
+        return self._add_raw((_raw_data(match),)) > 0
+
+    def add_many(self, matches: Iterable[Match]) -> int:
+        """
+        Stores all matches provided, in a single transaction.
+
+        Parameters
+        ----------
+        matches : Iterable[Match]
+            The matches to store.
+
+        Returns
+        -------
+        int
+            The amount of matches stored, excluding the ones already present in the store.
+
+        Raises
+        ------
+        ValueError
+            Any of the matches doesn't keep its raw data, because ``keep_raw`` wasn't enabled
+            on the API.
+        """
+        return self._add_raw(_raw_data(match) for match in matches)
+
+    def get(
+        self, api: PaladinsAPI, match_id: int, language: Optional[Language] = None
+    ) -> Optional[Match]:
+        """
+        Recreates a stored match, for the given Match ID.
+
+        Parameters
+        ----------
+        api : PaladinsAPI
+            The API instance to bind the match to, used for the cache lookups.
+        match_id : int
+            The Match ID of the match you want to get.
+        language : Optional[Language]
+            The `Language` you want to get the match in.\n
+            Default language is used if not provided.
+
+        Returns
+        -------
+        Optional[Match]
+            The stored match.\n
+            `None` is returned if the match isn't present in the store.
+        """
+        matches = self.get_many(api, (match_id,), language)
+        return matches[0] if matches else None
+
+    def get_many(
+        self, api: PaladinsAPI, match_ids: Iterable[int], language: Optional[Language] = None
+    ) -> List[Match]:
+        """
+        Recreates multiple stored matches, for the given Match IDs.
+
+        Parameters
+        ----------
+        api : PaladinsAPI
+            The API instance to bind the matches to, used for the cache lookups.
+        match_ids : Iterable[int]
+            The Match IDs of the matches you want to get.
+        language : Optional[Language]
+            The `Language` you want to get the matches in.\n
+            Default language is used if not provided.
+
+        Returns
+        -------
+        List[Match]
+            A list of the stored matches, in the same order as the Match IDs provided.\n
+            Matches not present in the store are skipped.
+        """
+        if language is None:
+            language = api._default_language
+        ids_list = list(dict.fromkeys(match_ids))  # remove duplicates
+        raw = self._get_raw(ids_list)
+        return [
+            Match(api, language, raw[match_id], {}) for match_id in ids_list if match_id in raw
+        ]
+
+    def query_ids(
+        self,
+        *,
+        player: Optional[Union[int, PartialPlayer]] = None,
+        queue: Optional[Queue] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Returns the Match IDs of the stored matches satisfying all of the conditions provided,
+        ordered from the newest to the oldest.
+
+        Parameters
+        ----------
+        player : Optional[Union[int, PartialPlayer]]
+            The player, or their Player ID, that had to participate in the match.\n
+            Defaults to `None`, meaning any player.
+        queue : Optional[Queue]
+            The queue the match had to be played in.\n
+            Defaults to `None`, meaning any queue.
+        start : Optional[datetime.datetime]
+            The earliest time the match could have been played at, inclusive.
+            Naive datetime objects are assumed to be in UTC.\n
+            Defaults to `None`, meaning no limit.
+        end : Optional[datetime.datetime]
+            The latest time the match could have been played at, exclusive.
+            Naive datetime objects are assumed to be in UTC.\n
+            Defaults to `None`, meaning no limit.
+        limit : Optional[int]
+            The maximum amount of Match IDs to return.\n
+            Defaults to `None`, meaning no limit.
+
+        Returns
+        -------
+        List[int]
+            A list of the Match IDs found.
+        """
+        conditions = []
+        params: List[int] = []
+        if player is not None:
+            table, id_column = "match_players", "match_id"
+            conditions.append("player_id = ?")
+            params.append(player if isinstance(player, int) else player.id)
+        else:
+            table, id_column = "matches", "id"
+        if queue is not None:
+            conditions.append("queue = ?")
+            params.append(queue.value)
+        if start is not None:
+            conditions.append("timestamp >= ?")
+            params.append(_to_unix(start))
+        if end is not None:
+            conditions.append("timestamp < ?")
+            params.append(_to_unix(end))
+        query = f"SELECT {id_column} FROM {table}"
+        if conditions:
+            query += f" WHERE {' AND '.join(conditions)}"
+        query += f" ORDER BY timestamp DESC, {id_column} DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [match_id for match_id, in self._connection.execute(query, params)]
+
+    def query(
+        self,
+        api: PaladinsAPI,
+        *,
+        player: Optional[Union[int, PartialPlayer]] = None,
+        queue: Optional[Queue] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        language: Optional[Language] = None,
+    ) -> List[Match]:
+        """
+        Recreates the stored matches satisfying all of the conditions provided,
+        ordered from the newest to the oldest.
+
+        See `query_ids` for the description of the conditions.
+
+        Parameters
+        ----------
+        api : PaladinsAPI
+            The API instance to bind the matches to, used for the cache lookups.
+        language : Optional[Language]
+            The `Language` you want to get the matches in.\n
+            Default language is used if not provided.
+
+        Returns
+        -------
+        List[Match]
+            A list of the matches found.
+        """
+        match_ids = self.query_ids(player=player, queue=queue, start=start, end=end, limit=limit)
+        return self.get_many(api, match_ids, language)
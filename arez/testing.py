@@ -0,0 +1,1038 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from uuid import uuid4
+from hashlib import md5
+from random import Random
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from typing import Any, Optional, Union, List, Dict, Tuple, Deque, Callable
+
+from aiohttp import web
+
+
+__all__ = ["FakeServer"]
+logger = logging.getLogger(__package__)
+# the point in time match IDs and timestamps are generated from
+EPOCH = datetime(2020, 1, 1)
+SLOT = timedelta(minutes=10)
+TIMESTAMP_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+SESSION_LIFETIME = timedelta(minutes=15)
+QUEUES = (424, 469, 452, 486, 428, 445)
+REGIONS = ("North America", "Europe", "Brazil", "Southeast Asia", "Australia", "Japan")
+MAPS = (
+    "LIVE Frog Isle", "LIVE Jaguar Falls", "LIVE Serpent Beach", "LIVE Frozen Guard",
+    "LIVE Ice Mines", "LIVE Fish Market", "LIVE Timber Mill", "LIVE Stone Keep",
+)
+ROLES = ("Paladins Front Line", "Paladins Support", "Paladins Damage", "Paladins Flanker")
+PLATFORMS = ((1, "Hirez"), (5, "Steam"), (9, "PSN"), (10, "XboxLive"), (22, "Nintendo Switch"))
+ITEMS = (
+    "Blast Shields", "Haven", "Nimble", "Master Riding", "Chronos", "Deft Hands",
+    "Illuminate", "Kill to Heal", "Life Rip", "Cauterize", "Wrecker", "Bulldozer",
+    "Morale Boost", "Veteran", "Rejuvenate", "Resilience",
+)
+
+
+def _timestamp(dt: datetime) -> str:
+    return dt.strftime(TIMESTAMP_FORMAT)
+
+
+class FakeServer:
+    """
+    A local stand-in for the Hi-Rez API, serving synthetic but schema-correct data.
+
+    All data served is generated deterministically from the ``seed`` and the IDs requested,
+    so that the same request always returns the same response. This makes it suitable
+    for offline testing and benchmarking, while also letting you inject latency, errors
+    and rate limits.
+
+    .. code-block:: py
+
+        async with arez.testing.FakeServer(latency=0.05) as server:
+            async with arez.PaladinsAPI(1004, "AUTHKEY") as api:
+                api.url = server.url
+                player = await api.get_player(server.player_ids[0])
+
+    Supported methods: ``ping``, ``testsession``, ``createsession``, ``getdataused``,
+    ``gethirezserverstatus``, ``getgods``, ``getitems``, ``getplayer``, ``getplayerbatch``,
+    ``getplayeridbyname``, ``getplayeridsbygamertag``, ``getplayeridbyportaluserid``,
+    ``searchplayers``, ``getplayerstatus``, ``getfriends``, ``getplayerloadouts``,
+    ``getgodranks``, ``getqueuestats``, ``getmatchhistory``, ``getmatchdetails``,
+    ``getmatchdetailsbatch``, ``getmatchidsbyqueue`` and ``getmatchplayerdetails``.
+
+    Parameters
+    ----------
+    seed : int
+        The seed used to generate all data.\n
+        Defaults to ``0``.
+    latency : float
+        The amount of time each response is delayed by, in seconds.\n
+        Defaults to ``0``.
+    jitter : float
+        The maximum amount of additional, random delay added to each response, in seconds.\n
+        Defaults to ``0``.
+    error_rate : float
+        The fraction of requests that are responded to with the ``503: Service Unavailable``
+        HTTP status code.\n
+        Defaults to ``0``.
+    rate_limit : Optional[int]
+        The maximum amount of requests per second, after which requests are responded to
+        with the ``429: Too Many Requests`` HTTP status code.\n
+        Defaults to `None`, meaning no limit.
+    request_limit : int
+        The daily amount of requests each developer's ID can make, after which an error
+        message is returned instead of the data.\n
+        Defaults to ``7500``.
+    credentials : Optional[Dict[Union[int, str], str]]
+        A mapping of developer's IDs to their authorization keys, used to validate
+        the request signatures.\n
+        Defaults to `None`, meaning all credentials are accepted.
+    players : int
+        The amount of players available.\n
+        Defaults to ``1000``.
+    matches_per_hour : int
+        The amount of matches played in each queue per hour, at most ``594``.\n
+        Defaults to ``60``.
+    champions : int
+        The amount of champions available.\n
+        Defaults to ``10``.
+    private_ratio : float
+        The fraction of players with a private profile.\n
+        Defaults to ``0.05``.
+    live_ratio : float
+        The fraction of players that are currently in a live match.\n
+        Defaults to ``0.1``.
+
+    Attributes
+    ----------
+    url : Optional[str]
+        The base URL the server is available at, to set as the `Endpoint.url`.\n
+        `None` if the server isn't running.
+    calls : Counter[str]
+        The amount of requests made, broken down by the method name.
+    player_ids : List[int]
+        The IDs of all players available.
+    """
+    first_player_id = 100000
+    first_champion_id = 2000
+
+    def __init__(
+        self,
+        *,
+        seed: int = 0,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        rate_limit: Optional[int] = None,
+        request_limit: int = 7500,
+        credentials: Optional[Dict[Union[int, str], str]] = None,
+        players: int = 1000,
+        matches_per_hour: int = 60,
+        champions: int = 10,
+        private_ratio: float = 0.05,
+        live_ratio: float = 0.1,
+    ):
+        assert 0 < matches_per_hour <= 594
+        self.seed = seed
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.request_limit = request_limit
+        self.credentials: Optional[Dict[str, str]] = None
+        if credentials is not None:
+            self.credentials = {str(k): v.upper() for k, v in credentials.items()}
+        self.private_ratio = private_ratio
+        self.live_ratio = live_ratio
+        self.matches_per_slot = max(matches_per_hour // 6, 1)
+        self.player_ids: List[int] = list(
+            range(self.first_player_id, self.first_player_id + players)
+        )
+        self.champion_ids: List[int] = list(
+            range(self.first_champion_id, self.first_champion_id + champions)
+        )
+        self.url: Optional[str] = None
+        self.calls: Counter[str] = Counter()
+        self._random = Random(seed)
+        self._recent: Deque[float] = deque()
+        # session_id: (dev_id, expires_at)
+        self._sessions: Dict[str, Tuple[str, datetime]] = {}
+        # dev_id: (requests, sessions)
+        self._usage: Dict[str, List[int]] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self._methods: Dict[str, Callable[..., Any]] = {
+            "getdataused": self._get_data_used,
+            "gethirezserverstatus": self._get_server_status,
+            "getgods": self._get_gods,
+            "getitems": self._get_items,
+            "getplayer": self._get_player,
+            "getplayerbatch": self._get_player_batch,
+            "getplayeridbyname": self._get_player_id_by_name,
+            "getplayeridsbygamertag": self._get_player_ids_by_gamertag,
+            "getplayeridbyportaluserid": self._get_player_id_by_portal_user_id,
+            "searchplayers": self._search_players,
+            "getplayerstatus": self._get_player_status,
+            "getfriends": self._get_friends,
+            "getplayerloadouts": self._get_player_loadouts,
+            "getgodranks": self._get_god_ranks,
+            "getqueuestats": self._get_queue_stats,
+            "getmatchhistory": self._get_match_history,
+            "getmatchdetails": self._get_match_details,
+            "getmatchdetailsbatch": self._get_match_details_batch,
+            "getmatchidsbyqueue": self._get_match_ids_by_queue,
+            "getmatchplayerdetails": self._get_match_player_details,
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.url or 'not running'})"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Starts the server.
+
+        Parameters
+        ----------
+        host : str
+            The host to listen on.\n
+            Defaults to ``127.0.0.1``.
+        port : int
+            The port to listen on.\n
+            Defaults to ``0``, meaning a random free port is used.
+
+        Returns
+        -------
+        str
+            The base URL the server is available at.
+        """
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def close(self):
+        """
+        Stops the server.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        self.url = None
+
+    async def __aenter__(self) -> FakeServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
+
+    def match_ids(self, queue: int, start: datetime, end: datetime) -> List[int]:
+        """
+        Returns the IDs of all matches played in the given queue, between the timestamps
+        provided.
+
+        Parameters
+        ----------
+        queue : int
+            The queue ID.
+        start : datetime.datetime
+            The start timestamp, in UTC.
+        end : datetime.datetime
+            The end timestamp, in UTC.
+
+        Returns
+        -------
+        List[int]
+            The list of match IDs.
+        """
+        # both timestamps are floored to 10 minutes, same as get_matches_for_queue does
+        first = (start - EPOCH) // SLOT
+        last = (end - EPOCH) // SLOT
+        return [
+            match_id for slot in range(first, last) for match_id in self._slot_matches(queue, slot)
+        ]
+
+    # request handling
+
+    def _rng(self, *key: Any) -> Random:
+        return Random(':'.join(map(str, (self.seed, *key))))
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        parts = request.match_info["path"].split('/')
+        method = parts[0].lower()
+        if not method.endswith("json"):
+            raise web.HTTPNotFound
+        method = method[:-4]
+        self.calls[method] += 1
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.rate_limit is not None:
+            now = asyncio.get_event_loop().time()
+            recent = self._recent
+            while recent and now - recent[0] >= 1:
+                recent.popleft()
+            if len(recent) >= self.rate_limit:
+                raise web.HTTPTooManyRequests
+            recent.append(now)
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise web.HTTPServiceUnavailable
+        if method == "ping":
+            return web.json_response(
+                f"Paladins API (ver 3.6.1.0) [PATCH - 3.6] - Ping successful. "
+                f"Server Date:{_timestamp(datetime.utcnow())}"
+            )
+        if method == "createsession":
+            return web.json_response(self._create_session(parts[1:]))
+        if len(parts) < 5:
+            raise web.HTTPNotFound
+        dev_id, signature, session_id, timestamp, *args = parts[1:]
+        session = self._sessions.get(session_id)
+        if session is None or session[1] < datetime.utcnow() or session[0] != dev_id:
+            return web.json_response([{"ret_msg": "Invalid session id."}])
+        if not self._check_signature(dev_id, method, signature, timestamp):
+            return web.json_response([{"ret_msg": "Invalid signature."}])
+        usage = self._usage.setdefault(dev_id, [0, 0])
+        if usage[0] >= self.request_limit:
+            return web.json_response(
+                [{"ret_msg": f"Daily request limit reached ({self.request_limit})"}]
+            )
+        usage[0] += 1
+        if method == "testsession":
+            return web.json_response(
+                f"This was a successful test with the following parameters added: "
+                f"developer: {dev_id} time: {_timestamp(datetime.utcnow())} "
+                f"signature: {signature} session: {session_id}"
+            )
+        handler = self._methods.get(method)
+        if handler is None:
+            raise web.HTTPNotFound
+        try:
+            data = handler(dev_id, *args)
+        except (TypeError, ValueError):
+            # missing or invalid arguments
+            raise web.HTTPBadRequest
+        return web.json_response(data)
+
+    def _check_signature(self, dev_id: str, method: str, signature: str, timestamp: str) -> bool:
+        if self.credentials is None:
+            return True
+        auth_key = self.credentials.get(dev_id)
+        if auth_key is None:
+            return False
+        expected = md5(''.join((dev_id, method, auth_key, timestamp)).encode()).hexdigest()
+        return signature == expected
+
+    def _create_session(self, args: List[str]) -> Dict[str, Any]:
+        now = datetime.utcnow()
+        response: Dict[str, Any] = {
+            "ret_msg": "Approved", "session_id": None, "timestamp": _timestamp(now)
+        }
+        if len(args) != 3:
+            response["ret_msg"] = "Invalid request."
+            return response
+        dev_id, signature, timestamp = args
+        if self.credentials is not None and dev_id not in self.credentials:
+            response["ret_msg"] = "Invalid Developer Id"
+        elif not self._check_signature(dev_id, "createsession", signature, timestamp):
+            response["ret_msg"] = "Invalid signature. Your session request cannot be completed"
+        else:
+            session_id = uuid4().hex.upper()
+            self._sessions[session_id] = (dev_id, now + SESSION_LIFETIME)
+            self._usage.setdefault(dev_id, [0, 0])[1] += 1
+            response["session_id"] = session_id
+        return response
+
+    # data generation
+
+    def _language_name(self, name: str, language: int) -> str:
+        if language == 1:
+            return name
+        return f"{name} #{language}"
+
+    def _ability_name(self, champion_id: int, slot: int) -> str:
+        return f"Ability {chr(ord('A') + slot - 1)} {champion_id}"
+
+    def _champion_name(self, champion_id: int) -> str:
+        return f"Champion {champion_id - self.first_champion_id + 1}"
+
+    def _champion_devices(self, champion_id: int) -> List[Tuple[int, str, str]]:
+        # (ItemId, DeviceName, item_type) - 16 cards and 3 talents
+        devices = []
+        base = champion_id * 100
+        for i in range(16):
+            devices.append((base + i, f"Card {i + 1} {champion_id}", "Card Vendor Rank 1 Rare"))
+        for i in range(3):
+            devices.append(
+                (base + 50 + i, f"Talent {i + 1} {champion_id}", "Inventory Vendor - Talents")
+            )
+        return devices
+
+    def _get_data_used(self, dev_id: str) -> List[Dict[str, Any]]:
+        requests, sessions = self._usage.get(dev_id, (0, 0))
+        now = datetime.utcnow()
+        return [{
+            "Active_Sessions": sum(
+                1 for d, e in self._sessions.values() if d == dev_id and e >= now
+            ),
+            "Concurrent_Sessions": 50,
+            "Request_Limit_Daily": self.request_limit,
+            "Session_Cap": 500,
+            "Session_Time_Limit": 15,
+            "Total_Requests_Today": requests,
+            "Total_Sessions_Today": sessions,
+            "ret_msg": None,
+        }]
+
+    def _get_server_status(self, dev_id: str) -> List[Dict[str, Any]]:
+        now = _timestamp(datetime.utcnow())
+        return [
+            {
+                "entry_datetime": now,
+                "environment": environment,
+                "limited_access": False,
+                "platform": platform,
+                "ret_msg": None,
+                "status": "UP",
+                "version": "3.6.1.0",
+            }
+            for platform, environment in (
+                ("pc", "live"), ("ps4", "live"), ("xbox", "live"), ("switch", "live"),
+                ("pc", "pts"),
+            )
+        ]
+
+    def _get_gods(self, dev_id: str, language: str) -> List[Dict[str, Any]]:
+        lang = int(language)
+        champions = []
+        for champion_id in self.champion_ids:
+            rng = self._rng("champion", champion_id)
+            name = self._language_name(self._champion_name(champion_id), lang)
+            champion: Dict[str, Any] = {
+                "id": champion_id,
+                "Name": name,
+                "Name_English": self._champion_name(champion_id),
+                "Title": self._language_name(f"The {rng.choice(ITEMS)}", lang),
+                "Roles": ROLES[champion_id % len(ROLES)],
+                "ChampionIcon_URL": (
+                    f"https://web2.hirez.com/paladins/champion-icons/champion-{champion_id}.jpg"
+                ),
+                "Lore": self._language_name(f"Lore of {name}.", lang),
+                "Health": rng.choice((1900, 2000, 2200, 2400, 4000, 4500)),
+                "Speed": rng.choice((350, 370, 380, 390, 400)),
+                "latestChampion": "n",
+                "ret_msg": None,
+            }
+            for slot in range(1, 6):
+                ability_id = champion_id * 100 + 80 + slot
+                ability_name = self._ability_name(champion_id, slot)
+                champion[f"Ability_{slot}"] = {
+                    "Id": ability_id,
+                    "Summary": self._language_name(ability_name, lang),
+                    "Description": self._language_name(f"Description of {ability_name}.", lang),
+                    "URL": f"https://web2.hirez.com/paladins/champion-abilities/{ability_id}.jpg",
+                    "damageType": rng.choice(("Direct Damage", "AoE Damage", "True Damage")),
+                    "rechargeSeconds": rng.choice((0, 0, 5, 8, 12, 15)),
+                }
+            champions.append(champion)
+        return champions
+
+    def _get_items(self, dev_id: str, language: str) -> List[Dict[str, Any]]:
+        lang = int(language)
+        devices = []
+
+        def device(
+            item_id: int, name: str, item_type: str, champion_id: int, description: str, **kwargs
+        ) -> Dict[str, Any]:
+            data = {
+                "ItemId": item_id,
+                "DeviceName": self._language_name(name, lang),
+                "Description": self._language_name(description, lang),
+                "ShortDesc": "",
+                "item_type": item_type,
+                "champion_id": champion_id,
+                "itemIcon_URL": f"https://web2.hirez.com/paladins/champion-cards/{item_id}.jpg",
+                "recharge_seconds": 0,
+                "Price": 0,
+                "talent_reward_level": 0,
+                "ret_msg": None,
+            }
+            data.update(kwargs)
+            return data
+
+        for i, item_name in enumerate(ITEMS):
+            devices.append(device(
+                i + 1,
+                item_name,
+                "Burn Card Damage Vendor",
+                0,
+                "Increases your stats by {scale=10|10}%.",
+                Price=300,
+            ))
+        for champion_id in self.champion_ids:
+            for item_id, name, item_type in self._champion_devices(champion_id):
+                is_talent = item_type.endswith("Talents")
+                slot = item_id % 5 + 1
+                description = (
+                    f"[{self._ability_name(champion_id, slot)}] "
+                    "Increases the damage dealt by {scale=5|5}%."
+                )
+                devices.append(device(
+                    item_id,
+                    name,
+                    item_type,
+                    champion_id,
+                    description,
+                    recharge_seconds=0 if is_talent else slot,
+                    talent_reward_level=(item_id % 50) * 4 if is_talent else 0,
+                ))
+        return devices
+
+    def _player_private(self, player_id: int) -> bool:
+        return self._rng("private", player_id).random() < self.private_ratio
+
+    def _player_data(self, player_id: int) -> Dict[str, Any]:
+        if self._player_private(player_id):
+            return {
+                "Id": 0,
+                "Name": None,
+                "ret_msg": (
+                    f"Player Privacy Flag set for: playerIdStr={player_id}; "
+                    f"playerIdType=1; playerId={player_id}"
+                ),
+            }
+        rng = self._rng("player", player_id)
+        portal_id, platform = rng.choice(PLATFORMS)
+        created = EPOCH - timedelta(days=rng.randrange(1, 1500))
+        wins = rng.randrange(0, 2000)
+        losses = rng.randrange(0, 2000)
+        name = f"Player{player_id}"
+
+        def ranked() -> Dict[str, Any]:
+            tier = rng.randrange(0, 27)
+            return {
+                "Leaves": rng.randrange(0, 20),
+                "Losses": rng.randrange(0, 200),
+                "Name": "Ranked",
+                "Points": rng.randrange(0, 100) if tier else 0,
+                "PrevRank": 0,
+                "Rank": 0,
+                "Season": 3,
+                "Tier": tier,
+                "Trend": 0,
+                "Wins": rng.randrange(0, 200),
+                "player_id": None,
+                "ret_msg": None,
+            }
+
+        return {
+            "ActivePlayerId": player_id,
+            "AvatarId": 0,
+            "AvatarURL": None,
+            "Created_Datetime": _timestamp(created),
+            "HoursPlayed": (wins + losses) // 4,
+            "Id": player_id,
+            "Last_Login_Datetime": _timestamp(
+                datetime.utcnow() - timedelta(hours=rng.randrange(1, 500))
+            ),
+            "Leaves": rng.randrange(0, 50),
+            "Level": rng.randrange(1, 300),
+            "LoadingFrame": "Default",
+            "Losses": losses,
+            "MasteryLevel": rng.randrange(1, len(self.champion_ids) + 1),
+            "MergedPlayers": None,
+            "MinutesPlayed": (wins + losses) * 15,
+            "Name": name,
+            "Personal_Status_Message": "",
+            "Platform": platform,
+            "RankedConquest": ranked(),
+            "RankedController": ranked(),
+            "RankedKBM": ranked(),
+            "Region": rng.choice(REGIONS),
+            "TeamId": 0,
+            "Team_Name": "",
+            "Tier_Conquest": 0,
+            "Tier_RankedController": 0,
+            "Tier_RankedKBM": 0,
+            "Title": "",
+            "Total_Achievements": rng.randrange(0, 60),
+            "Total_Worshippers": rng.randrange(0, 10_000_000),
+            "Total_XP": 0,
+            "Wins": wins,
+            "hz_gamer_tag": None,
+            "hz_player_name": name,
+            "portal_id": portal_id,
+            "ret_msg": None,
+        }
+
+    def _valid_player(self, player_id: int) -> bool:
+        return 0 <= player_id - self.first_player_id < len(self.player_ids)
+
+    def _find_player(self, player: str) -> Optional[int]:
+        if player.isdecimal():
+            player_id = int(player)
+        elif player.lower().startswith("player") and player[6:].isdecimal():
+            player_id = int(player[6:])
+        else:
+            return None
+        if not self._valid_player(player_id):
+            return None
+        return player_id
+
+    def _get_player(self, dev_id: str, player: str, *args: str) -> List[Dict[str, Any]]:
+        player_id = self._find_player(player)
+        if player_id is None:
+            return []
+        return [self._player_data(player_id)]
+
+    def _get_player_batch(self, dev_id: str, player_ids: str) -> List[Dict[str, Any]]:
+        return [
+            self._player_data(int(player_id))
+            for player_id in player_ids.split(',')
+            if self._valid_player(int(player_id))
+        ]
+
+    def _player_id_data(self, player_id: int) -> Dict[str, Any]:
+        rng = self._rng("player", player_id)
+        portal_id, _ = rng.choice(PLATFORMS)
+        name = f"Player{player_id}"
+        return {
+            "Name": name,
+            "hz_player_name": name,
+            "player_id": player_id,
+            "portal_id": portal_id,
+            "privacy_flag": 'y' if self._player_private(player_id) else 'n',
+            "ret_msg": None,
+        }
+
+    def _get_player_id_by_name(self, dev_id: str, player_name: str) -> List[Dict[str, Any]]:
+        player_id = self._find_player(player_name)
+        if player_id is None or player_name.isdecimal():
+            return []
+        return [self._player_id_data(player_id)]
+
+    def _get_player_ids_by_gamertag(
+        self, dev_id: str, portal_id: str, player_name: str
+    ) -> List[Dict[str, Any]]:
+        return [
+            p for p in self._get_player_id_by_name(dev_id, player_name)
+            if str(p["portal_id"]) == portal_id
+        ]
+
+    def _get_player_id_by_portal_user_id(
+        self, dev_id: str, portal_id: str, portal_user_id: str
+    ) -> List[Dict[str, Any]]:
+        # map the platform ID onto the player pool
+        player_id = self.player_ids[int(portal_user_id) % len(self.player_ids)]
+        data = self._player_id_data(player_id)
+        data["portal_id"] = int(portal_id)
+        return [data]
+
+    def _search_players(self, dev_id: str, player_name: str) -> List[Dict[str, Any]]:
+        return self._get_player_id_by_name(dev_id, player_name)
+
+    def _live_match_id(self, player_id: int) -> int:
+        rng = self._rng("live", player_id)
+        if rng.random() >= self.live_ratio:
+            return 0
+        slot = (datetime.utcnow() - EPOCH) // SLOT
+        queue = rng.choice(QUEUES)
+        return self._match_id(queue, slot, rng.randrange(self.matches_per_slot))
+
+    def _get_player_status(self, dev_id: str, player: str) -> List[Dict[str, Any]]:
+        player_id = self._find_player(player)
+        if player_id is None:
+            return [{
+                "Match": 0, "match_queue_id": 0, "personal_status_message": "",
+                "ret_msg": None, "status": 5, "status_string": "Unknown",
+            }]
+        match_id = self._live_match_id(player_id)
+        if match_id:
+            status, status_string = 3, "In Match"
+        else:
+            status, status_string = self._rng("status", player_id).choice(
+                ((0, "Offline"), (0, "Offline"), (1, "In Lobby"), (4, "Online"))
+            )
+        return [{
+            "Match": match_id,
+            "match_queue_id": match_id % 1000 if match_id else 0,
+            "personal_status_message": "",
+            "ret_msg": None,
+            "status": status,
+            "status_string": status_string,
+        }]
+
+    def _friend_ids(self, player_id: int) -> List[int]:
+        # friendships are symmetric, and chosen among players with nearby IDs
+        friends = []
+        pool = self.player_ids
+        count = len(pool)
+        index = player_id - self.first_player_id
+        for offset in range(-50, 51):
+            if not offset:
+                continue
+            other = pool[(index + offset) % count]
+            if other == player_id:
+                continue
+            low, high = sorted((player_id, other))
+            if self._rng("friends", low, high).random() < 0.1:
+                friends.append(other)
+        return sorted(set(friends))
+
+    def _get_friends(self, dev_id: str, player: str) -> List[Dict[str, Any]]:
+        player_id = self._find_player(player)
+        if player_id is None:
+            return []
+        friends = []
+        for friend_id in self._friend_ids(player_id):
+            data = self._player_id_data(friend_id)
+            friends.append({
+                "account_id": str(friend_id),
+                "friend_flags": "1",
+                "name": data["Name"],
+                "player_id": str(friend_id),
+                "portal_id": str(data["portal_id"]),
+                "ret_msg": None,
+                "status": "Friend",
+            })
+        return friends
+
+    def _get_player_loadouts(
+        self, dev_id: str, player: str, language: str
+    ) -> List[Dict[str, Any]]:
+        player_id = self._find_player(player)
+        if player_id is None:
+            return [{"playerId": 0, "ret_msg": None}]
+        lang = int(language)
+        rng = self._rng("loadouts", player_id)
+        loadouts = []
+        for champion_id in self.champion_ids:
+            cards = [d for d in self._champion_devices(champion_id) if d[0] % 100 < 50]
+            for deck in range(rng.randrange(0, 3)):
+                chosen = rng.sample(cards, 5)
+                loadouts.append({
+                    "ChampionId": champion_id,
+                    "ChampionName": self._language_name(self._champion_name(champion_id), lang),
+                    "DeckId": player_id * 1000 + champion_id % 1000 * 10 + deck,
+                    "DeckName": f"Deck {deck + 1}",
+                    "LoadoutItems": [
+                        {
+                            "ItemId": item_id,
+                            "ItemName": self._language_name(name, lang),
+                            "Points": points,
+                        }
+                        for (item_id, name, _), points in zip(chosen, (5, 4, 3, 2, 1))
+                    ],
+                    "playerId": player_id,
+                    "playerName": f"Player{player_id}",
+                    "ret_msg": None,
+                })
+        return loadouts
+
+    def _champion_stats(self, player_id: int, champion_id: int, queue: int) -> Dict[str, Any]:
+        rng = self._rng("stats", player_id, champion_id, queue)
+        wins = rng.randrange(0, 300)
+        losses = rng.randrange(0, 300)
+        matches = wins + losses
+        return {
+            "Assists": matches * rng.randrange(2, 10),
+            "Deaths": matches * rng.randrange(2, 8),
+            "Gold": matches * rng.randrange(1000, 4000),
+            "Kills": matches * rng.randrange(2, 15),
+            "LastPlayed": _timestamp(datetime.utcnow() - timedelta(hours=rng.randrange(1, 2000))),
+            "Losses": losses,
+            "Matches": matches,
+            "Minutes": matches * 15,
+            "Wins": wins,
+            "player_id": str(player_id),
+            "ret_msg": None,
+        }
+
+    def _get_god_ranks(self, dev_id: str, player: str) -> List[Dict[str, Any]]:
+        player_id = self._find_player(player)
+        if player_id is None:
+            return []
+        stats = []
+        for champion_id in self.champion_ids:
+            data = self._champion_stats(player_id, champion_id, 0)
+            data.update({
+                "MinionKills": 0,
+                "Rank": data["Matches"] // 20,
+                "Worshippers": data["Matches"] * 2000,
+                "champion": self._champion_name(champion_id),
+                "champion_id": str(champion_id),
+            })
+            del data["Matches"]
+            stats.append(data)
+        return stats
+
+    def _get_queue_stats(self, dev_id: str, player: str, queue: str) -> List[Dict[str, Any]]:
+        player_id = self._find_player(player)
+        if player_id is None:
+            return []
+        stats = []
+        for champion_id in self.champion_ids:
+            data = self._champion_stats(player_id, champion_id, int(queue))
+            data.update({
+                "Champion": self._champion_name(champion_id),
+                "ChampionId": champion_id,
+                "Queue": queue,
+            })
+            stats.append(data)
+        return stats
+
+    # matches
+
+    def _match_id(self, queue: int, slot: int, index: int) -> int:
+        return (slot * 600 + index) * 1000 + queue
+
+    def _decode_match_id(self, match_id: int) -> Optional[Tuple[int, int, int]]:
+        rest, queue = divmod(match_id, 1000)
+        slot, index = divmod(rest, 600)
+        if queue not in QUEUES or slot <= 0 or index >= self.matches_per_slot:
+            return None
+        return queue, slot, index
+
+    def _slot_matches(self, queue: int, slot: int) -> List[int]:
+        if queue not in QUEUES:
+            return []
+        # no matches in the future
+        if EPOCH + slot * SLOT > datetime.utcnow():
+            return []
+        return [self._match_id(queue, slot, index) for index in range(self.matches_per_slot)]
+
+    def _match_players(self, match_id: int) -> List[int]:
+        return self._rng("match players", match_id).sample(self.player_ids, 10)
+
+    def _match_rows(self, match_id: int) -> List[Dict[str, Any]]:
+        decoded = self._decode_match_id(match_id)
+        if decoded is None:
+            return []
+        queue, slot, _ = decoded
+        entry_datetime = EPOCH + slot * SLOT
+        if entry_datetime + SLOT > datetime.utcnow():
+            # still in progress
+            return []
+        rng = self._rng("match", match_id)
+        duration = rng.randrange(300, 1500)
+        winning_team = rng.choice((1, 2))
+        # TDM scores are offset by -36, so that the winning team always has 4 points
+        score = [4, 4]
+        score[2 - winning_team] = rng.randrange(-36 if queue == 469 else 0, 4)
+        map_name = rng.choice(MAPS)
+        region = rng.choice(REGIONS)
+        bans = rng.sample(self.champion_ids, 4) if queue == 486 else [0, 0, 0, 0]
+        champions = rng.sample(self.champion_ids * 2, 10)
+        parties = [rng.choice((0, 0, 0, 1, 2)) for _ in range(10)]
+        rows = []
+        for i, player_id in enumerate(self._match_players(match_id)):
+            team = 1 if i < 5 else 2
+            champion_id = champions[i]
+            private = self._player_private(player_id)
+            devices = self._champion_devices(champion_id)
+            cards = rng.sample(devices[:16], 5)
+            talent = rng.choice(devices[16:])
+            items = rng.sample(range(1, len(ITEMS) + 1), 4)
+            kills = rng.randrange(0, 40)
+            row: Dict[str, Any] = {
+                "Account_Level": rng.randrange(1, 300),
+                "Assists": rng.randrange(0, 40),
+                "Camps_Cleared": 0,
+                "ChampionId": champion_id,
+                "Damage_Bot": 0,
+                "Damage_Done_In_Hand": 0,
+                "Damage_Done_Magical": 0,
+                "Damage_Done_Physical": rng.randrange(10_000, 200_000),
+                "Damage_Mitigated": rng.randrange(0, 100_000),
+                "Damage_Player": 0,
+                "Damage_Taken": rng.randrange(10_000, 200_000),
+                "Deaths": rng.randrange(0, 20),
+                "Entry_Datetime": _timestamp(entry_datetime),
+                "Gold_Earned": rng.randrange(3000, 15_000),
+                "Healing": rng.randrange(0, 150_000),
+                "Healing_Bot": 0,
+                "Healing_Player_Self": rng.randrange(0, 30_000),
+                "Kills_Bot": 0,
+                "Kills_Fire_Giant": 0,
+                "Kills_Gold_Fury": 0,
+                "Kills_Player": kills,
+                "League_Losses": 0,
+                "League_Points": 0,
+                "League_Tier": rng.randrange(1, 27) if queue == 486 else 0,
+                "League_Wins": 0,
+                "Map_Game": map_name,
+                "Mastery_Level": rng.randrange(1, 100),
+                "Match": match_id,
+                "Match_Duration": duration,
+                "Multi_kill_Max": min(kills, rng.randrange(0, 5)),
+                "Objective_Assists": rng.randrange(0, 300),
+                "PartyId": match_id * 10 + parties[i] if parties[i] else 0,
+                "Platform": "Steam",
+                "Reference_Name": self._champion_name(champion_id),
+                "Region": region,
+                "Skin": "Default",
+                "SkinId": 0,
+                "TaskForce": team,
+                "Team1Score": score[0],
+                "Team2Score": score[1],
+                "Time_In_Match_Seconds": duration,
+                "Winning_TaskForce": winning_team,
+                "hasReplay": "n",
+                "match_queue_id": queue,
+                "playerId": "0" if private else str(player_id),
+                "playerName": "" if private else f"Player{player_id}",
+                "playerPortalId": "5",
+                "ret_msg": None,
+            }
+            for n in range(1, 5):
+                row[f"ActiveId{n}"] = items[n - 1]
+                row[f"Item_Active_{n}"] = ITEMS[items[n - 1] - 1]
+                row[f"ActiveLevel{n}"] = rng.randrange(0, 3)
+                row[f"BanId{n}"] = bans[n - 1]
+                row[f"Ban_{n}"] = self._champion_name(bans[n - 1]) if bans[n - 1] else ""
+            for n, ((item_id, name, _), points) in enumerate(zip(cards, (5, 4, 3, 2, 1)), 1):
+                row[f"ItemId{n}"] = item_id
+                row[f"Item_Purch_{n}"] = name
+                row[f"ItemLevel{n}"] = points
+            row["ItemId6"] = talent[0]
+            row["Item_Purch_6"] = talent[1]
+            row["ItemLevel6"] = 1
+            rows.append(row)
+        return rows
+
+    def _get_match_details(self, dev_id: str, match_id: str) -> List[Dict[str, Any]]:
+        return self._match_rows(int(match_id))
+
+    def _get_match_details_batch(self, dev_id: str, match_ids: str) -> List[Dict[str, Any]]:
+        rows = []
+        for match_id in match_ids.split(','):
+            rows.extend(self._match_rows(int(match_id)))
+        return rows
+
+    def _get_match_ids_by_queue(
+        self, dev_id: str, queue: str, date: str, hour: str
+    ) -> List[Dict[str, Any]]:
+        day = datetime.strptime(date, "%Y%m%d")
+        if hour == "-1":
+            start, end = day, day + timedelta(days=1)
+        elif ',' in hour:
+            hours, minutes = map(int, hour.split(','))
+            start = day.replace(hour=hours, minute=minutes)
+            end = start + SLOT
+        else:
+            start = day.replace(hour=int(hour))
+            end = start + timedelta(hours=1)
+        now = datetime.utcnow()
+        return [
+            {
+                "Active_Flag": 'y' if self._match_rows_pending(match_id, now) else 'n',
+                "Match": str(match_id),
+                "ret_msg": None,
+            }
+            for match_id in self.match_ids(int(queue), start, end)
+        ]
+
+    def _match_rows_pending(self, match_id: int, now: datetime) -> bool:
+        decoded = self._decode_match_id(match_id)
+        return decoded is not None and EPOCH + (decoded[1] + 1) * SLOT > now
+
+    def _get_match_history(self, dev_id: str, player: str) -> List[Dict[str, Any]]:
+        player_id = self._find_player(player)
+        if player_id is None:
+            return [{"ret_msg": f"No Match History for: {player}"}]
+        rng = self._rng("history", player_id)
+        last_slot = (datetime.utcnow() - EPOCH) // SLOT - 1
+        history = []
+        for n in range(rng.randrange(1, 20)):
+            slot = last_slot - n * rng.randrange(1, 30)
+            match_id = self._match_id(rng.choice(QUEUES), slot, 0)
+            # reuse one of the full match rows, converted into the history format
+            full = self._match_rows(match_id)[rng.randrange(10)]
+            row = {
+                "Assists": full["Assists"],
+                "Champion": full["Reference_Name"],
+                "ChampionId": full["ChampionId"],
+                "Creeps": 0,
+                "Damage": full["Damage_Done_Physical"],
+                "Damage_Bot": full["Damage_Bot"],
+                "Damage_Mitigated": full["Damage_Mitigated"],
+                "Damage_Structure": 0,
+                "Damage_Taken": full["Damage_Taken"],
+                "Deaths": full["Deaths"],
+                "Gold": full["Gold_Earned"],
+                "Healing": full["Healing"],
+                "Healing_Bot": full["Healing_Bot"],
+                "Healing_Player_Self": full["Healing_Player_Self"],
+                "Kills": full["Kills_Player"],
+                "Map_Game": full["Map_Game"],
+                "Match": match_id,
+                "Match_Queue_Id": full["match_queue_id"],
+                "Match_Time": full["Entry_Datetime"],
+                "Minutes": full["Time_In_Match_Seconds"] // 60,
+                "Multi_kill_Max": full["Multi_kill_Max"],
+                "Objective_Assists": full["Objective_Assists"],
+                "Queue": "",
+                "Region": full["Region"],
+                "Skin": full["Skin"],
+                "SkinId": full["SkinId"],
+                "Surrendered": 0,
+                "TaskForce": full["TaskForce"],
+                "Team1Score": full["Team1Score"],
+                "Team2Score": full["Team2Score"],
+                "Time_In_Match_Seconds": full["Time_In_Match_Seconds"],
+                "Win_Status": "Win" if full["TaskForce"] == full["Winning_TaskForce"] else "Loss",
+                "Winning_TaskForce": full["Winning_TaskForce"],
+                "playerId": player_id,
+                "playerName": f"Player{player_id}",
+                "ret_msg": None,
+            }
+            for i in range(1, 5):
+                row[f"ActiveId{i}"] = full[f"ActiveId{i}"]
+                row[f"Active_{i}"] = full[f"Item_Active_{i}"]
+                row[f"ActiveLevel{i}"] = full[f"ActiveLevel{i}"] * 4
+            for i in range(1, 7):
+                row[f"ItemId{i}"] = full[f"ItemId{i}"]
+                row[f"Item_{i}"] = full[f"Item_Purch_{i}"]
+                row[f"ItemLevel{i}"] = full[f"ItemLevel{i}"]
+            history.append(row)
+        return history
+
+    def _get_match_player_details(self, dev_id: str, match_id: str) -> List[Dict[str, Any]]:
+        decoded = self._decode_match_id(int(match_id))
+        if decoded is None or not self._match_rows_pending(int(match_id), datetime.utcnow()):
+            return []
+        queue = decoded[0]
+        rng = self._rng("live match", match_id)
+        map_name = rng.choice(MAPS)
+        region = rng.choice(REGIONS)
+        rows = []
+        for i, player_id in enumerate(self._match_players(int(match_id))):
+            champion_id = rng.choice(self.champion_ids)
+            rows.append({
+                "Account_Level": rng.randrange(1, 300),
+                "ChampionId": champion_id,
+                "ChampionName": self._champion_name(champion_id),
+                "Mastery_Level": rng.randrange(1, 100),
+                "Match": int(match_id),
+                "Queue": str(queue),
+                "Skin": "Default",
+                "SkinId": 0,
+                "Tier": rng.randrange(0, 27),
+                "mapGame": map_name,
+                "playerCreated": _timestamp(EPOCH),
+                "playerId": str(player_id),
+                "playerName": f"Player{player_id}",
+                "playerRegion": region,
+                "ret_msg": None,
+                "taskForce": 1 if i < 5 else 2,
+                "tierLosses": rng.randrange(0, 100),
+                "tierWins": rng.randrange(0, 100),
+            })
+        return rows
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from functools import wraps
+from contextlib import contextmanager
+from typing import Any, Optional, Dict, List, Union, Iterator, Callable, TypeVar, cast
+
+
+__all__: List[str] = []
+AttributeValue = Union[str, bool, int, float]
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: AttributeValue):
+        pass
+
+
+_noop_span = _NoopSpan()
+
+
+@contextmanager
+def _span(
+    tracer: Optional[Any], name: str, attributes: Optional[Dict[str, AttributeValue]] = None
+) -> Iterator[Any]:
+    """
+    Opens a span using the tracer provided, and makes it the current one.
+    The tracer has to follow the OpenTelemetry ``Tracer`` interface.
+
+    Yields a no-op span if the tracer is `None`.
+    """
+    if tracer is None:
+        yield _noop_span
+        return
+    with tracer.start_as_current_span(name, attributes=attributes) as span:
+        yield span
+
+
+def _traced(func: F) -> F:
+    """
+    A decorator for `Endpoint` subclasses' methods, that opens a span for each call,
+    using the `Endpoint.tracer` set.
+    """
+    name = func.__qualname__
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if self.tracer is None:
+            return await func(self, *args, **kwargs)
+        with _span(self.tracer, name):
+            return await func(self, *args, **kwargs)
+    return cast(F, wrapper)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, date
+from typing import Any, Optional, Dict
+
+from .enums import Priority
+
+
+__all__ = ["DataUsed"]
+
+
+class DataUsed:
+    """
+    Represents a snapshot of the daily API usage, for a single developer's ID.
+
+    You can get these from the `Endpoint.get_data_used` method.
+
+    Attributes
+    ----------
+    dev_id : str
+        The developer's ID this usage is for.
+    day : datetime.date
+        The UTC day this usage is for. The API limits reset at UTC midnight.
+    requests_used : int
+        The amount of requests used today.
+    requests_limit : int
+        The daily limit of requests.
+    sessions_used : int
+        The amount of sessions created today.
+    sessions_limit : int
+        The daily limit of sessions.
+    active_sessions : int
+        The amount of sessions currently active.
+    concurrent_sessions : int
+        The limit of sessions that can be active at the same time.
+    method_requests : Dict[str, int]
+        The amount of requests made today, broken down by the method name.\n
+        This is tracked locally only, and doesn't include requests made elsewhere.
+    reconciled_at : Optional[datetime.datetime]
+        A UTC timestamp of the last time these numbers were reconciled with the ones
+        returned by the API.\n
+        `None` if that didn't happen yet.
+    """
+    def __init__(
+        self,
+        dev_id: str,
+        day: date,
+        *,
+        requests_used: int,
+        requests_limit: int,
+        sessions_used: int,
+        sessions_limit: int,
+        active_sessions: int,
+        concurrent_sessions: int,
+        method_requests: Dict[str, int],
+        reconciled_at: Optional[datetime],
+    ):
+        self.dev_id = dev_id
+        self.day = day
+        self.requests_used = requests_used
+        self.requests_limit = requests_limit
+        self.sessions_used = sessions_used
+        self.sessions_limit = sessions_limit
+        self.active_sessions = active_sessions
+        self.concurrent_sessions = concurrent_sessions
+        self.method_requests = method_requests
+        self.reconciled_at = reconciled_at
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.dev_id}: "
+            f"{self.requests_used}/{self.requests_limit} requests, "
+            f"{self.sessions_used}/{self.sessions_limit} sessions)"
+        )
+
+    @property
+    def requests_left(self) -> int:
+        """
+        The amount of requests left for today.
+
+        :type: int
+        """
+        return max(self.requests_limit - self.requests_used, 0)
+
+    @property
+    def sessions_left(self) -> int:
+        """
+        The amount of sessions left for today.
+
+        :type: int
+        """
+        return max(self.sessions_limit - self.sessions_used, 0)
+
+
+class _Quota:
+    """
+    Keeps track of the daily API usage of a single developer's ID, locally.
+    """
+    def __init__(self):
+        self.day = datetime.utcnow().date()
+        self.requests_used = 0
+        self.sessions_used = 0
+        self.active_sessions = 0
+        # defaults as documented by Hi-Rez, updated when reconciling
+        self.requests_limit = 7500
+        self.sessions_limit = 500
+        self.concurrent_sessions = 50
+        self.method_requests: Counter[str] = Counter()
+        self.reconciled_at: Optional[datetime] = None
+        # requests counted since the last reconciliation has been started
+        self._pending = 0
+
+    def _rollover(self):
+        today = datetime.utcnow().date()
+        if today != self.day:
+            self.day = today
+            self.requests_used = 0
+            self.sessions_used = 0
+            self.method_requests.clear()
+            self._pending = 0
+
+    def add_request(self, method_name: str):
+        self._rollover()
+        self.requests_used += 1
+        self.method_requests[method_name] += 1
+        self._pending += 1
+
+    def add_session(self):
+        self._rollover()
+        self.sessions_used += 1
+        # we know of at least this one, until we reconcile
+        self.active_sessions = max(self.active_sessions, 1)
+
+    def within_budget(
+        self, priority: Priority, soft_budget: Optional[int], hard_budget: Optional[int]
+    ) -> bool:
+        self._rollover()
+        if hard_budget is not None and self.requests_used >= hard_budget:
+            return False
+        if (
+            soft_budget is not None
+            and self.requests_used >= soft_budget
+            and priority == Priority.Bulk
+        ):
+            return False
+        return True
+
+    def start_reconcile(self):
+        self._rollover()
+        self.reconciled_at = datetime.utcnow()
+        self._pending = 0
+
+    def reconcile(self, usage_data: Dict[str, Any]):
+        self._rollover()
+        # the API numbers don't include the requests we've made since asking for them
+        self.requests_used = usage_data["Total_Requests_Today"] + self._pending
+        self.sessions_used = usage_data["Total_Sessions_Today"]
+        self.active_sessions = usage_data["Active_Sessions"]
+        self.requests_limit = usage_data["Request_Limit_Daily"]
+        self.sessions_limit = usage_data["Session_Cap"]
+        self.concurrent_sessions = usage_data["Concurrent_Sessions"]
+
+    def snapshot(self, dev_id: str) -> DataUsed:
+        self._rollover()
+        return DataUsed(
+            dev_id,
+            self.day,
+            requests_used=self.requests_used,
+            requests_limit=self.requests_limit,
+            sessions_used=self.sessions_used,
+            sessions_limit=self.sessions_limit,
+            active_sessions=self.active_sessions,
+            concurrent_sessions=self.concurrent_sessions,
+            method_requests=dict(self.method_requests),
+            reconciled_at=self.reconciled_at,
+        )
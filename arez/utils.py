@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import re
+from sys import intern
 from math import floor
+from array import array
+from heapq import nsmallest
+from bisect import bisect_left
+from collections import Counter
 from functools import partialmethod
 from weakref import WeakValueDictionary
 from datetime import datetime, timedelta
@@ -88,6 +94,34 @@ def _convert_map_name(map_name: str) -> str:
     return map_name
 
 
+def _raw_data(obj: Any) -> Any:
+    """
+    Returns the raw API data the object provided has been created from.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to return the raw data of.
+
+    Returns
+    -------
+    Any
+        The raw data.
+
+    Raises
+    ------
+    ValueError
+        The raw data hasn't been kept, because ``keep_raw`` wasn't enabled on the API.
+    """
+    raw = obj._raw
+    if raw is None:
+        raise ValueError(
+            f"{obj.__class__.__name__} doesn't keep the raw API data, "
+            "set keep_raw to True on the API to enable this"
+        )
+    return raw
+
+
 # Generates API-valid series of date and hour parameters for the 'getmatchidsbyqueue' endpoint
 def _date_gen(
     start: datetime, end: datetime, *, reverse: bool = False
@@ -226,6 +260,117 @@ def get(iterable: Iterable[X], **attrs) -> Optional[X]:
     return None
 
 
+_non_word = re.compile(r"[^\w\s]+")
+
+
+def _normalize(name: str) -> str:
+    # casefold, drop punctuation and squash whitespace, so that "Makoa's" matches "makoas"
+    return ' '.join(_non_word.sub('', name.casefold()).split())
+
+
+def _trigrams(name: str) -> Dict[str, int]:
+    padded = f"  {name} "
+    trigrams: Dict[str, int] = {}
+    for i in range(len(padded) - 2):
+        # the same trigrams repeat across the indexes of every language
+        trigram = intern(padded[i:i + 3])
+        trigrams[trigram] = trigrams.get(trigram, 0) + 1
+    return trigrams
+
+
+class _SearchIndex:
+    """
+    A prefix and trigram index over the names of a `Lookup`'s elements.
+    """
+    # scores of the prefix matches - trigram matches are scored below them
+    EXACT = 1.0
+    NAME_PREFIX = 0.9
+    WORD_PREFIX = 0.8
+    TRIGRAM_WEIGHT = 0.7
+
+    def __init__(self, names: List[str]):
+        # the same names are indexed by multiple lookups - interning shares them
+        self._names: List[str] = [intern(_normalize(name)) for name in names]
+        # sorted (key, position) pairs, for the whole names and the words of multi-word names
+        whole_names: List[Tuple[str, int]] = []
+        words: List[Tuple[str, int]] = []
+        # trigram: the positions of the names containing it, packed together with the amount
+        # of times it appears in each, as (position << 8 | count)
+        index: Dict[str, array[int]] = {}
+        for position, name in enumerate(self._names):
+            whole_names.append((name, position))
+            name_words = name.split()
+            if len(name_words) > 1:
+                words.extend((intern(word), position) for word in name_words)
+            for trigram, count in _trigrams(name).items():
+                postings = index.get(trigram)
+                if postings is None:
+                    postings = index[trigram] = array('I')
+                postings.append(position << 8 | min(count, 0xFF))
+        whole_names.sort()
+        words.sort()
+        self._name_keys: List[str] = [key for key, _ in whole_names]
+        self._name_positions: List[int] = [position for _, position in whole_names]
+        self._word_keys: List[str] = [key for key, _ in words]
+        self._word_positions: List[int] = [position for _, position in words]
+        self._trigrams = index
+        # the amount of trigrams in each name, padding included
+        self._sizes: List[int] = [len(name) + 1 for name in self._names]
+
+    @staticmethod
+    def _prefix_range(keys: List[str], query: str) -> Tuple[int, int]:
+        # the slice of the sorted keys that start with the query
+        start = bisect_left(keys, query)
+        end = bisect_left(keys, query[:-1] + chr(ord(query[-1]) + 1), start)
+        return start, end
+
+    def search(self, query: str, cutoff: float, limit: int) -> List[Tuple[float, int]]:
+        query = _normalize(query)
+        if not query or limit < 1:
+            return []
+        # prefix matches on the whole name, with the exact matches sorted first
+        start, end = self._prefix_range(self._name_keys, query)
+        positions = self._name_positions
+        scores: Dict[int, float] = dict.fromkeys(positions[start:end], self.NAME_PREFIX)
+        keys = self._name_keys
+        while start < end and keys[start] == query:
+            scores[positions[start]] = self.EXACT
+            start += 1
+        # prefix matches on any of the words
+        start, end = self._prefix_range(self._word_keys, query)
+        for position in self._word_positions[start:end]:
+            scores.setdefault(position, self.WORD_PREFIX)
+        # typo-tolerant matches, scored by the Dice coefficient of the trigrams shared -
+        # these always rank below the prefix matches, so they're needed only if there's
+        # not enough of those already
+        if len(scores) < limit:
+            query_trigrams = _trigrams(query)
+            query_size = sum(query_trigrams.values())
+            shared: Counter[int] = Counter()
+            for trigram, query_count in query_trigrams.items():
+                postings = self._trigrams.get(trigram, ())
+                if query_count == 1:
+                    # the usual case - any name containing the trigram shares one of it
+                    for packed in postings:
+                        shared[packed >> 8] += 1
+                else:
+                    for packed in postings:
+                        shared[packed >> 8] += min(query_count, packed & 0xFF)
+            for position, count in shared.items():
+                if position in scores:
+                    # prefix matches always score higher
+                    continue
+                similarity = 2 * count / (query_size + self._sizes[position])
+                if similarity >= cutoff:
+                    scores[position] = similarity * self.TRIGRAM_WEIGHT
+        # keep only the best ones - ties are broken by the shorter name, then the position
+        sizes = self._sizes
+        best = nsmallest(
+            limit, ((-score, sizes[position], position) for position, score in scores.items())
+        )
+        return [(-score, position) for score, _, position in best]
+
+
 class Lookup(Iterable[LookupType]):
     """
     A helper class utilizing an internal list and three dictionaries, allowing for easy indexing
@@ -243,7 +388,8 @@ class Lookup(Iterable[LookupType]):
             self._list_lookup.append(e)
             self._id_lookup[e.id] = e
             self._name_lookup[e.name] = e
-            self._fuzzy_lookup[e.name.lower()] = e
+            self._fuzzy_lookup[intern(e.name.lower())] = e
+        self._search_index = _SearchIndex([e.name for e in self._list_lookup])
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self._list_lookup.__repr__()})"
@@ -291,6 +437,35 @@ class Lookup(Iterable[LookupType]):
             return self._fuzzy_lookup.get(name_or_id)
         return self._name_lookup.get(name_or_id)
 
+    def search(self, query: str, *, limit: int = 5, cutoff: float = 0.4) -> List[LookupType]:
+        """
+        Searches for elements with a name similar to the query provided.
+
+        The search is case insensitive, ignores punctuation, and tolerates typos.
+        Results are ranked - exact matches come first, followed by names starting with the query,
+        names with a word starting with the query, and lastly names that are only similar to it.
+
+        Parameters
+        ----------
+        query : str
+            The (partial) name you want to search for.
+        limit : int
+            The maximum amount of elements to return.\n
+            Defaults to ``5``.
+        cutoff : float
+            The minimum similarity (between ``0`` and ``1``) a name has to have with the query,
+            to be returned as a typo-tolerant match. Doesn't apply to prefix matches.\n
+            Defaults to ``0.4``.
+
+        Returns
+        -------
+        List[LookupType]
+            A list of up to ``limit`` elements, ordered from the best match to the worst.\n
+            The list will be empty if nothing matched the query.
+        """
+        results = self._search_index.search(query, cutoff, limit)
+        return [self._list_lookup[position] for _, position in results]
+
 
 def chunk(list_to_chunk: List[X], chunk_length: int) -> Generator[List[X], None, None]:
     """
@@ -625,3 +800,50 @@ class WeakValueDefaultDict(WeakValueDictionary, Mapping[X, Y]):
             item = self.default_factory()
             self.__setitem__(key, item)
             return item
+
+
+class _Core:
+    """
+    Base class for the language-independent part of a cached object, shared between
+    the objects of all cached languages.
+
+    Subclasses list their attributes in ``__slots__``, and are compared by their values.
+    """
+    __slots__ = ("__weakref__",)
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, self.__class__):
+            return self._values() == other._values()
+        return NotImplemented
+
+    # the cores are looked up by ID instead
+    __hash__ = None  # type: ignore[assignment]
+
+
+CoreType = TypeVar("CoreType", bound=_Core)
+
+
+class _SharedCores:
+    """
+    Keeps a single core for every champion, ability and device ID, that the cache entries
+    of every language share.
+
+    A core is replaced only when the data behind it changes - the entries still using
+    the previous one keep it, and it's dropped together with the last of them.
+    """
+    def __init__(self):
+        self._cores: WeakValueDictionary[Tuple[type, Any], _Core] = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._cores)
+
+    def __call__(self, key: Any, core: CoreType) -> CoreType:
+        full_key = (core.__class__, key)
+        existing = self._cores.get(full_key)
+        if existing is not None and existing == core:
+            return cast(CoreType, existing)
+        self._cores[full_key] = core
+        return core
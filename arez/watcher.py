@@ -0,0 +1,782 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import aiohttp
+from time import monotonic
+from abc import ABC, abstractmethod
+from typing import Optional, Union, List, Dict, Set, Iterable, AsyncGenerator, TYPE_CHECKING
+
+from .enums import Activity, Language
+from .exceptions import ArezException, Private, NotFound
+
+if TYPE_CHECKING:
+    from .api import PaladinsAPI
+    from .match import LiveMatch
+    from .status import Status, ServerStatus, PlayerStatus
+    from .statuspage import (
+        StatusPage,
+        CurrentStatus,
+        Component,
+        ComponentGroup,
+        Incident,
+        ScheduledMaintenance,
+        Update,
+    )
+    from .player import PartialPlayer, Player
+
+
+__all__ = [
+    "WatcherEvent",
+    "PlayerOnline",
+    "PlayerOffline",
+    "LiveMatchStarted",
+    "LiveMatchEnded",
+    "LiveMatchWatcher",
+    "ServerStatusChanged",
+    "ComponentStatusChanged",
+    "IncidentCreated",
+    "IncidentUpdated",
+    "IncidentResolved",
+    "MaintenanceChanged",
+    "MaintenanceEnded",
+    "StatusWatcher",
+]
+logger = logging.getLogger(__package__)
+_OFFLINE = (Activity.Offline, Activity.Unknown)
+
+
+class WatcherEvent:
+    """
+    The base class for all events emitted by the watchers.
+    """
+    def __repr__(self) -> str:
+        attrs = ", ".join(f"{name}={value!r}" for name, value in vars(self).items())
+        return f"{self.__class__.__name__}({attrs})"
+
+
+class PlayerOnline(WatcherEvent):
+    """
+    Emitted by the `LiveMatchWatcher` when a watched player goes online.
+    This is also emitted for every player that's already online when the watching starts.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    player : Union[PartialPlayer, Player]
+        The player that went online.
+    status : PlayerStatus
+        The player's current status.
+    """
+    def __init__(self, status: PlayerStatus):
+        self.player: Union[PartialPlayer, Player] = status.player
+        self.status = status
+
+
+class PlayerOffline(WatcherEvent):
+    """
+    Emitted by the `LiveMatchWatcher` when a watched player goes offline.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    player : Union[PartialPlayer, Player]
+        The player that went offline.
+    status : PlayerStatus
+        The player's current status.
+    """
+    def __init__(self, status: PlayerStatus):
+        self.player: Union[PartialPlayer, Player] = status.player
+        self.status = status
+
+
+class LiveMatchStarted(WatcherEvent):
+    """
+    Emitted by the `LiveMatchWatcher` when a live match with at least one of the watched
+    players in it is discovered. This is also emitted for every match that's already in progress
+    when the watching starts.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    match_id : int
+        The ID of the live match.
+    match : Optional[LiveMatch]
+        The live match.\n
+        `None` if the match couldn't be fetched, the match is played in an unsupported
+        queue (customs), or fetching the matches has been disabled on the watcher.
+    players : List[Union[PartialPlayer, Player]]
+        The watched players that are playing in this match.
+    """
+    def __init__(
+        self,
+        match_id: int,
+        match: Optional[LiveMatch],
+        players: List[Union[PartialPlayer, Player]],
+    ):
+        self.match_id = match_id
+        self.match = match
+        self.players = players
+
+
+class LiveMatchEnded(WatcherEvent):
+    """
+    Emitted by the `LiveMatchWatcher` when none of the watched players are in a live match
+    anymore, which usually means the match has ended.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    match_id : int
+        The ID of the live match. You can use it with `PaladinsAPI.get_match` to fetch
+        the full match, once it becomes available.
+    match : Optional[LiveMatch]
+        The live match, as it was fetched when it started.\n
+        `None` if it wasn't fetched.
+    """
+    def __init__(self, match_id: int, match: Optional[LiveMatch]):
+        self.match_id = match_id
+        self.match = match
+
+
+class _Watcher(ABC):
+    # the polling loop shared by all watchers
+    def __init__(self, min_interval: float, max_interval: float):
+        if min_interval > max_interval:
+            raise ValueError("min_interval can't be larger than max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._wakeup = asyncio.Event()
+        self._running = True
+
+    def __aiter__(self) -> AsyncGenerator[WatcherEvent, None]:
+        return self.events()
+
+    @abstractmethod
+    async def poll(self) -> List[WatcherEvent]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _next_poll(self) -> float:
+        raise NotImplementedError
+
+    def stop(self):
+        """
+        Stops the iteration over the events, after the current poll finishes.\n
+        Stopping the watcher before the iteration starts makes it end right away.
+        """
+        self._running = False
+        self._wakeup.set()
+
+    async def events(self) -> AsyncGenerator[WatcherEvent, None]:
+        """
+        Creates an async generator that polls continuously, and yields the events
+        as they happen, until `stop` is called.\n
+        Iterating over the watcher itself does the same.
+
+        Returns
+        -------
+        AsyncGenerator[WatcherEvent, None]
+            An async generator yielding the events.
+        """
+        while self._running:
+            self._wakeup.clear()
+            for event in await self.poll():
+                yield event
+            if not self._running:
+                break
+            delay = self._next_poll() - monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+
+class _WatchedPlayer:
+    # the polling state of a single watched player
+    __slots__ = ("player", "status", "match_over", "interval", "next_poll")
+
+    def __init__(self, player: Union[PartialPlayer, Player], interval: float):
+        self.player = player
+        self.status: Optional[PlayerStatus] = None
+        # set when the live match in the last known status is known to be over already
+        self.match_over = False
+        self.interval = interval
+        self.next_poll = 0.0
+
+    @property
+    def live_match_id(self) -> Optional[int]:
+        if self.status is None or self.match_over:
+            return None
+        return self.status.live_match_id
+
+
+class LiveMatchWatcher(_Watcher):
+    """
+    Watches the in-game status of a set of players, and the live matches they're playing in.
+
+    Every player is polled separately, with an adaptive interval: it starts at ``min_interval``,
+    and doubles each time the player's status turns out to be unchanged, up to
+    ``max_interval``. Any change resets the interval back to ``min_interval``.
+    When several watched players are known to be in the same live match, only one of them
+    is polled until the match ends for them, and each live match is fetched only once,
+    no matter how many of the watched players are in it.
+
+    Iterate over the watcher to poll the players continuously, and receive the events
+    as they happen:
+
+    .. code-block:: py
+
+        watcher = arez.LiveMatchWatcher(api, [player_id1, player_id2, player_id3])
+        async for event in watcher:
+            if isinstance(event, arez.LiveMatchStarted):
+                print(f"{event.players} started playing in {event.match}")
+            elif isinstance(event, arez.LiveMatchEnded):
+                print(f"Match {event.match_id} has ended")
+
+    Parameters
+    ----------
+    api : PaladinsAPI
+        The API instance to use for the requests.
+    players : Iterable[Union[int, PartialPlayer]]
+        The players, or their Player IDs, to watch. Private players are skipped.\n
+        Defaults to no players.
+    min_interval : float
+        The shortest interval between polls of a single player, in seconds.\n
+        Defaults to ``30``.
+    max_interval : float
+        The longest interval between polls of a single player, in seconds.\n
+        Defaults to ``300``.
+    max_concurrent : int
+        The maximum amount of status requests made at the same time.\n
+        Defaults to ``5``.
+    fetch_matches : bool
+        When set to `False`, the live matches aren't fetched, and the
+        `LiveMatchStarted.match` attribute is always `None`.\n
+        Defaults to `True`.
+    language : Optional[Language]
+        The `Language` to fetch the live matches in.\n
+        Default language is used if not provided.
+
+    Attributes
+    ----------
+    live_matches : Dict[int, Optional[LiveMatch]]
+        The live matches the watched players are currently playing in, mapped by their IDs.\n
+        The value is `None` for the matches that weren't fetched.
+    """
+    def __init__(
+        self,
+        api: PaladinsAPI,
+        players: Iterable[Union[int, PartialPlayer]] = (),
+        *,
+        min_interval: float = 30,
+        max_interval: float = 300,
+        max_concurrent: int = 5,
+        fetch_matches: bool = True,
+        language: Optional[Language] = None,
+    ):
+        super().__init__(min_interval, max_interval)
+        self._api = api
+        self.fetch_matches = fetch_matches
+        self.language = language
+        self.live_matches: Dict[int, Optional[LiveMatch]] = {}
+        self._players: Dict[int, _WatchedPlayer] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        for player in players:
+            self.add(player)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(players={len(self._players)}, "
+            f"live_matches={len(self.live_matches)})"
+        )
+
+    @property
+    def statuses(self) -> Dict[int, PlayerStatus]:
+        """
+        The last known status of each of the watched players, mapped by their Player IDs.\n
+        Players that weren't polled yet are missing.
+
+        :type: Dict[int, PlayerStatus]
+        """
+        return {
+            player_id: watched.status
+            for player_id, watched in self._players.items()
+            if watched.status is not None
+        }
+
+    def add(self, player: Union[int, PartialPlayer]):
+        """
+        Adds a player to the watched ones. They'll be polled during the next poll.\n
+        Adding a private player, or one that's already being watched, does nothing.
+
+        Parameters
+        ----------
+        player : Union[int, PartialPlayer]
+            The player, or their Player ID, to watch.
+        """
+        if isinstance(player, int):
+            from .player import PartialPlayer  # noqa, cyclic imports
+            player = PartialPlayer(self._api, id=player)
+        if player.private or not player.id or player.id in self._players:
+            return
+        self._players[player.id] = _WatchedPlayer(player, self.min_interval)
+        self._wakeup.set()
+
+    def remove(self, player: Union[int, PartialPlayer]):
+        """
+        Removes a player from the watched ones.\n
+        Removing a player that isn't being watched does nothing.
+
+        Parameters
+        ----------
+        player : Union[int, PartialPlayer]
+            The player, or their Player ID, to stop watching.
+        """
+        player_id = player if isinstance(player, int) else player.id
+        self._players.pop(player_id, None)
+
+    def _next_poll(self) -> float:
+        if not self._players:
+            return monotonic() + self.max_interval
+        return min(w.next_poll for w in self._players.values())
+
+    async def _fetch_status(self, watched: _WatchedPlayer) -> Optional[PlayerStatus]:
+        async with self._semaphore:
+            try:
+                return await watched.player.get_status()
+            except (Private, NotFound):
+                return None
+            except ArezException as exc:
+                # keep the last known status, and retry during the next poll
+                logger.warning(
+                    "LiveMatchWatcher -> polling Player(id=%s) failed: %r", watched.player.id, exc
+                )
+                return watched.status
+
+    async def _fetch_match(self, match_id: int, status: PlayerStatus) -> Optional[LiveMatch]:
+        if not self.fetch_matches:
+            return None
+        try:
+            return await status.get_live_match(self.language)
+        except ArezException as exc:
+            logger.warning(
+                "LiveMatchWatcher -> fetching LiveMatch(id=%s) failed: %r", match_id, exc
+            )
+            return None
+
+    async def poll(self) -> List[WatcherEvent]:
+        """
+        Polls all of the watched players that are due, and returns the events that happened
+        since the last poll.\n
+        Iterating over the watcher does this automatically - use this only if you want to
+        drive the polling yourself.
+
+        Returns
+        -------
+        List[WatcherEvent]
+            A list of the events, in the order they happened in.
+        """
+        now = monotonic()
+        polled: List[_WatchedPlayer] = []
+        # live match ID: the only player polled in it
+        representatives: Dict[int, _WatchedPlayer] = {}
+        # live match ID: the players riding along with the representative
+        followers: Dict[int, List[_WatchedPlayer]] = {}
+        for watched in self._players.values():
+            if watched.next_poll > now:
+                continue
+            match_id = watched.live_match_id
+            if match_id:
+                if match_id in representatives:
+                    followers.setdefault(match_id, []).append(watched)
+                    continue
+                representatives[match_id] = watched
+            polled.append(watched)
+        statuses = await asyncio.gather(*(self._fetch_status(w) for w in polled))
+        events: List[WatcherEvent] = []
+        for watched, status in zip(polled, statuses):
+            previous = watched.status
+            watched.status = status
+            watched.match_over = False
+            if previous is None or status is None:
+                unchanged = previous is status
+            else:
+                unchanged = (
+                    previous.status == status.status
+                    and previous.live_match_id == status.live_match_id
+                )
+            if unchanged:
+                watched.interval = min(watched.interval * 2, self.max_interval)
+            else:
+                watched.interval = self.min_interval
+            watched.next_poll = now + watched.interval
+            was_online = previous is not None and previous.status not in _OFFLINE
+            is_online = status is not None and status.status not in _OFFLINE
+            if status is not None and is_online != was_online:
+                events.append(PlayerOnline(status) if is_online else PlayerOffline(status))
+        for match_id, riders in followers.items():
+            representative = representatives[match_id]
+            for watched in riders:
+                if representative.live_match_id == match_id:
+                    # still in the match - follow the representative's schedule
+                    watched.interval = representative.interval
+                    watched.next_poll = representative.next_poll
+                else:
+                    # the match has ended for the representative - it's over for these too,
+                    # so drop their stale match ID now, and poll them next time
+                    watched.match_over = True
+                    watched.next_poll = now
+        # figure out which live matches have started and ended
+        active: Dict[int, List[_WatchedPlayer]] = {}
+        for watched in self._players.values():
+            match_id = watched.live_match_id
+            if match_id:
+                active.setdefault(match_id, []).append(watched)
+        started = [match_id for match_id in active if match_id not in self.live_matches]
+        matches = await asyncio.gather(*(
+            self._fetch_match(match_id, active[match_id][0].status)  # type: ignore[arg-type]
+            for match_id in started
+        ))
+        ended: Set[int] = set(self.live_matches).difference(active)
+        for match_id in ended:
+            events.append(LiveMatchEnded(match_id, self.live_matches.pop(match_id)))
+        for match_id, match in zip(started, matches):
+            self.live_matches[match_id] = match
+            events.append(
+                LiveMatchStarted(match_id, match, [w.player for w in active[match_id]])
+            )
+        return events
+
+
+class ServerStatusChanged(WatcherEvent):
+    """
+    Emitted by the `StatusWatcher` when the status of a single server changes.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    platform : str
+        The key of the server in the `ServerStatus.statuses` dictionary,
+        like ``pc`` or ``switch``.
+    previous : Optional[Status]
+        The previous status of the server.\n
+        `None` if the server has just appeared.
+    current : Optional[Status]
+        The current status of the server.\n
+        `None` if the server has just disappeared.
+    """
+    def __init__(self, platform: str, previous: Optional[Status], current: Optional[Status]):
+        self.platform = platform
+        self.previous = previous
+        self.current = current
+
+
+class ComponentStatusChanged(WatcherEvent):
+    """
+    Emitted by the `StatusWatcher` when the status of a status page's component
+    or component group changes.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    component : Union[Component, ComponentGroup]
+        The component, with the current status.
+    previous_status : Optional[str]
+        The previous status of the component.\n
+        `None` if the component has just appeared.
+    """
+    def __init__(
+        self, component: Union[Component, ComponentGroup], previous_status: Optional[str]
+    ):
+        self.component = component
+        self.previous_status = previous_status
+
+
+class IncidentCreated(WatcherEvent):
+    """
+    Emitted by the `StatusWatcher` when a new incident shows up on the status page.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    incident : Incident
+        The new incident.
+    """
+    def __init__(self, incident: Incident):
+        self.incident = incident
+
+
+class IncidentUpdated(WatcherEvent):
+    """
+    Emitted by the `StatusWatcher` when an existing incident receives new updates,
+    or it's status changes.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    incident : Incident
+        The incident, in it's current state.
+    previous_status : str
+        The previous status of the incident.
+    updates : List[Update]
+        The updates added since the last poll, from the newest to the oldest.
+    """
+    def __init__(self, incident: Incident, previous_status: str, updates: List[Update]):
+        self.incident = incident
+        self.previous_status = previous_status
+        self.updates = updates
+
+
+class IncidentResolved(WatcherEvent):
+    """
+    Emitted by the `StatusWatcher` when an incident disappears from the status page,
+    which happens once it's been resolved.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    incident : Incident
+        The incident, as it was during the last poll.
+    """
+    def __init__(self, incident: Incident):
+        self.incident = incident
+
+
+class MaintenanceChanged(WatcherEvent):
+    """
+    Emitted by the `StatusWatcher` when a new scheduled maintenance shows up
+    on the status page, or the status of an existing one changes.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    maintenance : ScheduledMaintenance
+        The scheduled maintenance, in it's current state.
+    previous_status : Optional[str]
+        The previous status of the scheduled maintenance.\n
+        `None` if the scheduled maintenance has just been announced.
+    """
+    def __init__(self, maintenance: ScheduledMaintenance, previous_status: Optional[str]):
+        self.maintenance = maintenance
+        self.previous_status = previous_status
+
+
+class MaintenanceEnded(WatcherEvent):
+    """
+    Emitted by the `StatusWatcher` when a scheduled maintenance disappears from
+    the status page, which happens once it's been completed.
+
+    Inherits from `WatcherEvent`.
+
+    Attributes
+    ----------
+    maintenance : ScheduledMaintenance
+        The scheduled maintenance, as it was during the last poll.
+    """
+    def __init__(self, maintenance: ScheduledMaintenance):
+        self.maintenance = maintenance
+
+
+def _diff_server_status(previous: ServerStatus, current: ServerStatus) -> List[WatcherEvent]:
+    events: List[WatcherEvent] = []
+    for platform in dict.fromkeys([*previous.statuses, *current.statuses]):
+        before = previous.statuses.get(platform)
+        after = current.statuses.get(platform)
+        if (
+            before is None or after is None
+            or (before.up, before.limited_access, before.version)
+            != (after.up, after.limited_access, after.version)
+        ):
+            events.append(ServerStatusChanged(platform, before, after))
+    return events
+
+
+def _diff_page_status(previous: CurrentStatus, current: CurrentStatus) -> List[WatcherEvent]:
+    events: List[WatcherEvent] = []
+    # components and groups
+    before_list: List[Union[Component, ComponentGroup]] = [*previous.groups, *previous.components]
+    after_list: List[Union[Component, ComponentGroup]] = [*current.groups, *current.components]
+    previous_components = {c.id: c for c in before_list}
+    for component in after_list:
+        before_component = previous_components.get(component.id)
+        if before_component is None:
+            events.append(ComponentStatusChanged(component, None))
+        elif before_component.status != component.status:
+            events.append(ComponentStatusChanged(component, before_component.status))
+    # incidents
+    previous_incidents = {i.id: i for i in previous.incidents}
+    for incident in current.incidents:
+        before_incident = previous_incidents.pop(incident.id, None)
+        if before_incident is None:
+            events.append(IncidentCreated(incident))
+            continue
+        known = {u.id for u in before_incident.updates}
+        updates = [u for u in incident.updates if u.id not in known]
+        if updates or before_incident.status != incident.status:
+            events.append(IncidentUpdated(incident, before_incident.status, updates))
+    events.extend(IncidentResolved(i) for i in previous_incidents.values())
+    # scheduled maintenances
+    previous_maintenances = {m.id: m for m in previous.scheduled_maintenances}
+    for maintenance in current.scheduled_maintenances:
+        before_maintenance = previous_maintenances.pop(maintenance.id, None)
+        if before_maintenance is None:
+            events.append(MaintenanceChanged(maintenance, None))
+        elif before_maintenance.status != maintenance.status:
+            events.append(MaintenanceChanged(maintenance, before_maintenance.status))
+    events.extend(MaintenanceEnded(m) for m in previous_maintenances.values())
+    return events
+
+
+class StatusWatcher(_Watcher):
+    """
+    Watches the server status returned by `PaladinsAPI.get_server_status`, and the status
+    page's status returned by `StatusPage.get_status`, emitting only the changes between
+    consecutive polls as events.
+
+    The interval between polls starts at ``min_interval``, and doubles after every poll
+    that found everything up and nothing changed, up to ``max_interval``. Any change,
+    as well as any server being down, component not being operational or incident being open,
+    resets the interval back to ``min_interval``.
+
+    The first poll only takes the initial snapshot, and emits no events.
+
+    .. code-block:: py
+
+        watcher = arez.StatusWatcher(api, status_page)
+        async for event in watcher:
+            if isinstance(event, arez.IncidentCreated):
+                print(f"New incident: {event.incident.name}")
+            elif isinstance(event, arez.ServerStatusChanged):
+                print(f"{event.platform}: {event.previous} -> {event.current}")
+
+    Parameters
+    ----------
+    api : Optional[PaladinsAPI]
+        The API instance to poll the server status with.\n
+        Defaults to `None`, meaning the server status isn't watched.
+    status_page : Optional[StatusPage]
+        The status page to poll the status of.\n
+        Defaults to `None`, meaning the status page isn't watched.
+    min_interval : float
+        The shortest interval between polls, in seconds.\n
+        Defaults to ``60``.
+    max_interval : float
+        The longest interval between polls, in seconds.\n
+        Defaults to ``600``.
+
+    Attributes
+    ----------
+    server_status : Optional[ServerStatus]
+        The server status from the last successful poll.\n
+        `None` if it wasn't polled yet.
+    page_status : Optional[CurrentStatus]
+        The status page's status from the last successful poll.\n
+        `None` if it wasn't polled yet.
+    interval : float
+        The current interval between polls, in seconds.
+
+    Raises
+    ------
+    ValueError
+        Neither ``api`` nor ``status_page`` were provided.
+    """
+    def __init__(
+        self,
+        api: Optional[PaladinsAPI] = None,
+        status_page: Optional[StatusPage] = None,
+        *,
+        min_interval: float = 60,
+        max_interval: float = 600,
+    ):
+        if api is None and status_page is None:
+            raise ValueError("At least one of api or status_page has to be provided")
+        super().__init__(min_interval, max_interval)
+        self._api = api
+        self._status_page = status_page
+        self.interval = min_interval
+        self.server_status: Optional[ServerStatus] = None
+        self.page_status: Optional[CurrentStatus] = None
+        self._last_poll: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(interval={self.interval})"
+
+    def _next_poll(self) -> float:
+        if self._last_poll is None:
+            return monotonic()
+        return self._last_poll + self.interval
+
+    def _all_up(self) -> bool:
+        if self.server_status is not None and not self.server_status.all_up:
+            return False
+        if self.page_status is not None and (
+            self.page_status.incidents
+            or any(c.status != "Operational" for c in self.page_status.components)
+        ):
+            return False
+        return True
+
+    async def _fetch_server_status(self) -> Optional[ServerStatus]:
+        if self._api is None:
+            return None
+        try:
+            return await self._api.get_server_status(force_refresh=True)
+        except ArezException as exc:
+            logger.warning("StatusWatcher -> polling the server status failed: %r", exc)
+            return None
+
+    async def _fetch_page_status(self) -> Optional[CurrentStatus]:
+        if self._status_page is None:
+            return None
+        try:
+            return await self._status_page.get_status()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            logger.warning("StatusWatcher -> polling the status page failed: %r", exc)
+            return None
+        except (ValueError, KeyError, TypeError) as exc:
+            # malformed or incomplete summary data
+            logger.warning("StatusWatcher -> parsing the status page failed: %r", exc)
+            return None
+
+    async def poll(self) -> List[WatcherEvent]:
+        """
+        Polls the server status and the status page once, and returns the changes
+        since the last poll as events.\n
+        Iterating over the watcher does this automatically - use this only if you want to
+        drive the polling yourself.
+
+        Returns
+        -------
+        List[WatcherEvent]
+            A list of the events.
+        """
+        self._last_poll = monotonic()
+        server_status, page_status = await asyncio.gather(
+            self._fetch_server_status(), self._fetch_page_status()
+        )
+        events: List[WatcherEvent] = []
+        if server_status is not None:
+            if self.server_status is not None:
+                events.extend(_diff_server_status(self.server_status, server_status))
+            self.server_status = server_status
+        if page_status is not None:
+            if self.page_status is not None:
+                events.extend(_diff_page_status(self.page_status, page_status))
+            self.page_status = page_status
+        if events or not self._all_up():
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * 2, self.max_interval)
+        return events
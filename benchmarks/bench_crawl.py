@@ -0,0 +1,130 @@
+"""
+Benchmarks the queue crawl path end-to-end - `PaladinsAPI.get_matches_for_queue`,
+running against the local fake server from ``arez.testing`` with injected latency.
+
+For each combination of the ``expand_players`` and ``reverse`` settings, crawls the same
+whole-hour time slice, and reports the amount of matches yielded per second, the amount
+of requests made per match, and the p50/p99 latency between consecutive yields.
+
+Usage:
+    python benchmarks/bench_crawl.py [--hours 2] [--latency 0.05] [--jitter 0.01]
+                                     [--save results.json]
+
+The fake server is seeded, so every run crawls the same matches and sees the same
+latency pattern, which keeps the results comparable between runs.
+"""
+import json
+import asyncio
+import argparse
+import platform
+from itertools import product
+from time import perf_counter
+from datetime import datetime, timedelta
+from typing import List, Dict
+
+import arez
+from arez.testing import FakeServer
+
+
+def percentile(values: List[float], q: float) -> float:
+    # nearest-rank percentile
+    ordered = sorted(values)
+    index = max(int(round(q * len(ordered))) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+async def crawl(
+    api: arez.PaladinsAPI,
+    queue: arez.Queue,
+    start: datetime,
+    end: datetime,
+    *,
+    expand_players: bool,
+    reverse: bool,
+) -> Dict[str, float]:
+    api.metrics.reset()
+    yield_times: List[float] = []
+    matches = 0
+    begin = last = perf_counter()
+    async for _ in api.get_matches_for_queue(
+        queue, start=start, end=end, expand_players=expand_players, reverse=reverse
+    ):
+        now = perf_counter()
+        yield_times.append(now - last)
+        last = now
+        matches += 1
+    elapsed = perf_counter() - begin
+    requests = sum(m.requests for m in api.metrics.methods.values())
+    return {
+        "matches": matches,
+        "seconds": elapsed,
+        "matches_per_second": matches / elapsed,
+        "requests": requests,
+        "requests_per_match": requests / matches,
+        "p50_ms": percentile(yield_times, 0.5) * 1000,
+        "p99_ms": percentile(yield_times, 0.99) * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    queue = arez.Queue.Casual_Siege
+    # a fixed, whole-hour time slice in the past
+    end = datetime.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(days=1)
+    start = end - timedelta(hours=args.hours)
+    results = {}
+    for expand_players, reverse in product((False, True), repeat=2):
+        # a fresh server for every run, so the latency pattern repeats
+        async with FakeServer(
+            seed=0,
+            latency=args.latency,
+            jitter=args.jitter,
+            request_limit=1_000_000,
+            matches_per_hour=args.matches_per_hour,
+        ) as server:
+            async with arez.PaladinsAPI(1004, "authkey") as api:
+                api.url = server.url
+                # warm up the session and the champion information cache
+                await api.get_champion_info()
+                result = await crawl(
+                    api, queue, start, end, expand_players=expand_players, reverse=reverse
+                )
+        name = f"expand_players={expand_players}, reverse={reverse}"
+        results[name] = result
+        print(
+            f"{name:>36}: {result['matches_per_second']:8.1f} matches/s, "
+            f"{result['requests_per_match']:5.2f} requests/match, "
+            f"p50 {result['p50_ms']:8.3f}ms, p99 {result['p99_ms']:8.3f}ms"
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the queue crawl path.")
+    parser.add_argument(
+        "--hours", type=int, default=2, help="the amount of hours to crawl (default: 2)"
+    )
+    parser.add_argument(
+        "--matches-per-hour", type=int, default=60, help="matches played per hour (default: 60)"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="server latency, in seconds (default: 0.05)"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.01, help="random latency added, in seconds"
+    )
+    parser.add_argument("--save", help="save the results into this JSON file")
+    args = parser.parse_args()
+    results = asyncio.run(run(args))
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({
+                "version": arez.__version__,
+                "python": platform.python_version(),
+                "timestamp": datetime.utcnow().isoformat(),
+                "settings": vars(args),
+                "results": results,
+            }, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmarks the library's own request paths with logging disabled, to measure
+the overhead the log calls add to them.
+
+Runs `Endpoint.request`, `PaladinsAPI.get_players` and `PaladinsAPI.get_matches`
+against the local fake server from ``arez.testing``, with no latency injected, so that
+the time spent in the library itself isn't hidden behind the network. Each benchmark is ran
+twice - once with the ``arez`` logger disabled, and once with it enabled at the ``DEBUG``
+level with a handler that formats and then discards every record. The difference between
+the two is the cost of the formatting, that the disabled case should avoid completely.
+
+Usage:
+    python benchmarks/bench_logging.py [--save results.json] [--compare baseline.json]
+
+To compare the library before and after a change, save the results on one revision,
+and compare against them on the other. When comparing, the script exits with a non-zero
+code if any benchmark got slower by more than ``--threshold`` percent, with logging disabled.
+"""
+import sys
+import json
+import asyncio
+import logging
+import argparse
+import platform
+from time import perf_counter
+from datetime import datetime, timedelta
+from typing import Any, List, Dict, Tuple, Callable, Awaitable
+
+import arez
+from arez.testing import FakeServer
+
+
+logger = logging.getLogger("arez")
+
+
+class FormattingHandler(logging.Handler):
+    # formats every record, like a real handler would, then drops it
+    def emit(self, record: logging.LogRecord):
+        self.format(record)
+
+
+async def measure(func: Callable[[], Awaitable[Any]], min_time: float) -> float:
+    # best of 5 runs, in calls per second
+    await func()  # warm up
+    best = 0.0
+    for _ in range(5):
+        calls = 0
+        start = perf_counter()
+        while True:
+            await func()
+            calls += 1
+            elapsed = perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, calls / elapsed)
+    return best
+
+
+async def run(min_time: float) -> Dict[str, Dict[str, float]]:
+    handler = FormattingHandler()
+    async with FakeServer(seed=0, request_limit=10_000_000, players=2000) as server:
+        async with arez.PaladinsAPI(1004, "authkey") as api:
+            api.url = server.url
+            api.reconcile_every = None
+            await api.get_champion_info()
+            player_id = server.player_ids[0]
+            player_ids = server.player_ids[:1000]
+            end = datetime.utcnow() - timedelta(hours=1)
+            match_ids = server.match_ids(424, end - timedelta(hours=1), end)[:50]
+            benchmarks: List[Tuple[str, Callable[[], Awaitable[Any]]]] = [
+                ("Endpoint.request", lambda: api.request("getplayer", player_id)),
+                ("get_players (1000 IDs)", lambda: api.get_players(player_ids)),
+                ("get_matches (50 IDs)", lambda: api.get_matches(match_ids)),
+            ]
+            results = {}
+            for name, func in benchmarks:
+                logger.setLevel(logging.WARNING)
+                disabled = await measure(func, min_time)
+                logger.setLevel(logging.DEBUG)
+                logger.addHandler(handler)
+                try:
+                    enabled = await measure(func, min_time)
+                finally:
+                    logger.removeHandler(handler)
+                    logger.setLevel(logging.NOTSET)
+                results[name] = {"disabled_per_second": disabled, "enabled_per_second": enabled}
+                print(
+                    f"{name:>22}: disabled {disabled:10,.1f} /s, enabled {enabled:10,.1f} /s "
+                    f"({(disabled / enabled - 1) * 100:+.1f}% when disabled)"
+                )
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline_path: str, threshold: float) -> bool:
+    with open(baseline_path) as file:
+        baseline = json.load(file)["results"]
+    print(f"\nCompared to {baseline_path} (logging disabled):")
+    ok = True
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]["disabled_per_second"]
+        change = (result["disabled_per_second"] - old) / old * 100
+        regressed = change < -threshold
+        ok = ok and not regressed
+        print(f"{name:>22}: {change:+7.1f}%{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the log calls overhead.")
+    parser.add_argument("--save", help="save the results into this JSON file")
+    parser.add_argument("--compare", help="compare the results against this JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=10, help="allowed slowdown, in percent (default: 10)"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.5, help="minimum time per run, in seconds"
+    )
+    args = parser.parse_args()
+    results = asyncio.run(run(args.min_time))
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({
+                "version": arez.__version__,
+                "python": platform.python_version(),
+                "timestamp": datetime.utcnow().isoformat(),
+                "results": results,
+            }, file, indent=4)
+    if args.compare and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
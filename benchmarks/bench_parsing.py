@@ -0,0 +1,178 @@
+"""
+Benchmarks the parsing hot paths - constructing the library's objects from raw API responses.
+
+Every benchmark runs on the JSON fixtures stored in ``benchmarks/fixtures``, that were
+generated once by the fake server from ``arez.testing``. Use ``--regenerate`` to recreate them,
+which will make the results incomparable with the ones obtained on the old fixtures.
+
+For each benchmark, reports the amount of objects constructed per second, as well as
+the peak and retained memory allocated per single construction.
+
+Usage:
+    python benchmarks/bench_parsing.py [--save results.json] [--compare baseline.json]
+
+When comparing, the script exits with a non-zero code if any benchmark got slower
+by more than ``--threshold`` percent.
+"""
+import sys
+import json
+import asyncio
+import argparse
+import platform
+import tracemalloc
+from pathlib import Path
+from timeit import Timer
+from datetime import datetime, timedelta
+from typing import Any, List, Dict, Callable, Tuple
+
+import arez
+from arez.match import Match, PartialMatch
+from arez.player import Player
+from arez.stats import ChampionStats
+from arez.cache import CacheEntry
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+# name: (request method, request arguments)
+FIXTURES = {
+    "gods": ("getgods", (1,)),
+    "items": ("getitems", (1,)),
+    "match": ("getmatchdetails", ()),
+    "history": ("getmatchhistory", ()),
+    "player": ("getplayer", ()),
+    "champion_stats": ("getgodranks", ()),
+}
+
+
+async def generate_fixtures():
+    from arez.testing import FakeServer
+
+    server = FakeServer(seed=0, private_ratio=0, champions=45)
+    player_id = server.player_ids[0]
+    end = datetime.utcnow() - timedelta(hours=1)
+    match_id = server.match_ids(424, end - timedelta(minutes=10), end)[0]
+    args = {"match": (match_id,), "history": (player_id,), "player": (player_id,)}
+    args["champion_stats"] = (player_id,)
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    for name, (method, method_args) in FIXTURES.items():
+        handler = server._methods[method]
+        data = handler("0", *map(str, args.get(name, method_args)))
+        with open(FIXTURES_DIR / f"{name}.json", 'w') as file:
+            json.dump(data, file)
+
+
+def load_fixtures() -> Dict[str, Any]:
+    fixtures = {}
+    for name in FIXTURES:
+        with open(FIXTURES_DIR / f"{name}.json") as file:
+            fixtures[name] = json.load(file)
+    return fixtures
+
+
+def measure(func: Callable[[], Any], min_time: float) -> Tuple[float, int, int]:
+    # objects per second, best of 5 runs
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    number = max(int(number * min_time / 0.2), 1)
+    best = min(timer.repeat(repeat=5, number=number)) / number
+    # memory allocated per object
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return 1 / best, peak - start, current - start
+
+
+async def run(min_time: float) -> Dict[str, Dict[str, float]]:
+    fixtures = load_fixtures()
+    language = arez.Language.English
+    expires_at = datetime.utcnow() + timedelta(days=1)
+    async with arez.PaladinsAPI(0, "0") as api:
+        entry = CacheEntry(language, expires_at, fixtures["gods"], fixtures["items"])
+        api._cache[language] = entry
+        player = Player(api, fixtures["player"][0])
+
+        benchmarks: List[Tuple[str, Callable[[], Any]]] = [
+            (
+                "CacheEntry",
+                lambda: CacheEntry(language, expires_at, fixtures["gods"], fixtures["items"]),
+            ),
+            ("Match", lambda: Match(api, language, fixtures["match"], {})),
+            (
+                "PartialMatch history",
+                lambda: [PartialMatch(player, language, m) for m in fixtures["history"]],
+            ),
+            ("Player", lambda: Player(api, fixtures["player"][0])),
+            (
+                "ChampionStats",
+                lambda: [
+                    ChampionStats(player, language, s) for s in fixtures["champion_stats"]
+                ],
+            ),
+        ]
+        results = {}
+        for name, func in benchmarks:
+            per_second, peak, retained = measure(func, min_time)
+            results[name] = {
+                "per_second": per_second, "peak_bytes": peak, "retained_bytes": retained
+            }
+            print(
+                f"{name:>22}: {per_second:12,.1f} /s, "
+                f"peak {peak / 1024:9.1f} KiB, retained {retained / 1024:9.1f} KiB"
+            )
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline_path: str, threshold: float) -> bool:
+    with open(baseline_path) as file:
+        baseline = json.load(file)["results"]
+    print(f"\nCompared to {baseline_path}:")
+    ok = True
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]["per_second"]
+        change = (result["per_second"] - old) / old * 100
+        regressed = change < -threshold
+        ok = ok and not regressed
+        print(f"{name:>22}: {change:+7.1f}%{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the parsing hot paths.")
+    parser.add_argument("--save", help="save the results into this JSON file")
+    parser.add_argument("--compare", help="compare the results against this JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=10, help="allowed slowdown, in percent (default: 10)"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="minimum time per run, in seconds"
+    )
+    parser.add_argument(
+        "--regenerate", action="store_true", help="regenerate the fixtures and exit"
+    )
+    args = parser.parse_args()
+    if args.regenerate:
+        asyncio.run(generate_fixtures())
+        return
+    results = asyncio.run(run(args.min_time))
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({
+                "version": arez.__version__,
+                "python": platform.python_version(),
+                "timestamp": datetime.utcnow().isoformat(),
+                "results": results,
+            }, file, indent=4)
+    if args.compare and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,10 @@ setup(
     install_requires=[
         "aiohttp>=2.0",
     ],
+    extras_require={
+        "numpy": ["numpy"],
+        "parquet": ["pyarrow"],
+    },
     python_requires=">=3.8",
     package_data={
         "arez": ["py.typed"],
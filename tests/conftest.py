@@ -3,14 +3,16 @@ from __future__ import annotations
 import re
 import asyncio
 import warnings
-from datetime import datetime
+from datetime import datetime, timedelta
 from collections import deque, namedtuple
-from typing import Optional, List, Dict, Set, TypedDict, Literal
+from typing import Optional, List, Tuple, Dict, Set, TypedDict, Literal
 
 import arez
 import pytest
+import pytest_asyncio
 from vcr import VCR
 from pytest import Module, Item
+from arez.testing import FakeServer
 
 from .secret import DEV_ID, AUTH_KEY
 
@@ -106,6 +108,43 @@ def no_flag_private_player(api: arez.PaladinsAPI):
     return api.wrap_player(*PRIVATE_PLAYER)
 
 
+# starts a local fake API server, without any live matches by default - use indirect
+# parametrization with a dictionary of FakeServer arguments to change it's settings
+@pytest_asyncio.fixture
+async def fake_server(request):
+    options = {"live_ratio": 0, **getattr(request, "param", {})}
+    async with FakeServer(**options) as server:
+        yield server
+
+
+# generates an API instance, that uses the fake server
+@pytest_asyncio.fixture
+async def fake_api(fake_server: FakeServer):
+    async with arez.PaladinsAPI(1004, "authkey") as api:
+        api.url = fake_server.url
+        yield api
+
+
+# a half an hour long time slice, ending an hour ago
+@pytest.fixture
+def fake_window() -> Tuple[datetime, datetime]:
+    end = datetime.utcnow() - timedelta(hours=1)
+    return end - timedelta(minutes=30), end
+
+
+# the fake server's Casual Siege matches played during the fake window
+@pytest_asyncio.fixture
+async def fake_matches(
+    fake_api: arez.PaladinsAPI, fake_window: Tuple[datetime, datetime]
+) -> List[arez.Match]:
+    start, end = fake_window
+    return [
+        m async for m in fake_api.get_matches_for_queue(
+            arez.Queue.Casual_Siege, start=start, end=end
+        )
+    ]
+
+
 def filter_request(request):
     if request.host == "api.paladins.com":
         # remove the authentication part
@@ -0,0 +1,81 @@
+import json
+
+import arez
+import pytest
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+
+
+async def test_champion_aggregator(fake_api, fake_window, fake_matches):
+    start, end = fake_window
+    matches = list(fake_matches)
+    matches.extend([
+        m async for m in fake_api.get_matches_for_queue(
+            arez.Queue.Competitive_Keyboard, start=start, end=end
+        )
+    ])
+    # streaming straight from the crawl
+    streamed = await arez.ChampionAggregator().consume(
+        fake_api.get_matches_for_queue(arez.Queue.Casual_Siege, start=start, end=end)
+    )
+    whole = arez.ChampionAggregator()
+    whole.extend(matches)
+    assert sum(whole.matches.values()) == len(matches)
+    # casual matches have no rank tier
+    casual = [m for m in matches if m.queue == arez.Queue.Casual_Siege]
+    assert whole.matches[(arez.Queue.Casual_Siege, "Qualifying")] == len(casual)
+    assert streamed.totals() == whole.totals(queue=arez.Queue.Casual_Siege)
+    # totals match the per-player data
+    players = [mp for m in matches for mp in m.players]
+    totals = whole.totals()
+    for champion_id, stats in totals.items():
+        champion_players = [mp for mp in players if mp.champion.id == champion_id]
+        assert stats.picks == len(champion_players)
+        assert stats.wins == sum(mp.winner for mp in champion_players)
+        assert stats.kills == sum(mp.kills for mp in champion_players)
+        assert stats.damage == sum(mp.damage_done for mp in champion_players)
+        assert stats.bans == sum(
+            1 for m in matches for ban in m.bans if ban.id == champion_id
+        )
+    assert sum(s.bans for s in totals.values()) == sum(len(m.bans) for m in matches)
+    # ranked matches are split by tier
+    ranked_tiers = {
+        tier for queue, tier in whole.matches if queue == arez.Queue.Competitive_Keyboard
+    }
+    assert ranked_tiers and "Qualifying" not in ranked_tiers
+    assert all(' ' not in tier for tier in ranked_tiers)
+    # merging partial aggregates gives the same result
+    half = len(matches) // 2
+    first = arez.ChampionAggregator()
+    first.extend(matches[:half])
+    second = arez.ChampionAggregator()
+    second.extend(matches[half:])
+    merged = first.merge(second)
+    assert merged.matches == whole.matches
+    assert merged.stats == whole.stats
+    # serialization roundtrip
+    restored = arez.ChampionAggregator.from_dict(json.loads(json.dumps(whole.to_dict())))
+    assert restored.matches == whole.matches
+    assert restored.stats == whole.stats
+    # no splitting by rank
+    unranked = arez.ChampionAggregator(by_rank=False)
+    unranked.extend(matches)
+    assert all(tier is None for _, tier in unranked.matches)
+    assert unranked.totals() == totals
+    with pytest.raises(ValueError):
+        unranked.merge(whole)
+    # qualifying players are left out of the match's tier
+    ranked_match = next(m for m in matches if m.queue == arez.Queue.Competitive_Keyboard)
+    for mp in ranked_match.players:
+        mp.rank = arez.Rank.Qualifying
+    single = arez.ChampionAggregator()
+    single.add(ranked_match)
+    assert list(single.matches) == [(arez.Queue.Competitive_Keyboard, "Qualifying")]
+    next(iter(ranked_match.players)).rank = arez.Rank.Diamond_I
+    single = arez.ChampionAggregator()
+    single.add(ranked_match)
+    assert list(single.matches) == [(arez.Queue.Competitive_Keyboard, "Diamond")]
+    # the aggregates are mutable, and can't be hashed
+    with pytest.raises(TypeError):
+        hash(next(iter(single.stats.values())))
@@ -0,0 +1,64 @@
+import time
+
+import arez
+import pytest
+
+
+pytestmark = pytest.mark.base
+
+
+def test_breaker_trip():
+    breaker = arez.CircuitBreaker(min_requests=4, error_rate=0.5, reset_timeout=0.05)
+    assert breaker.state == "closed"
+    # not enough requests to trip yet
+    for _ in range(3):
+        assert not breaker._acquire()
+        breaker._record(False, False)
+    assert breaker.state == "closed"
+    assert breaker.error_rate == 1
+    breaker._record(True, False)
+    assert breaker.state == "closed"
+    breaker._record(False, False)
+    assert breaker.state == "open"
+    assert breaker.trips == 1
+    assert breaker.retry_after > 0
+    # fail fast while open
+    with pytest.raises(arez.Unavailable):
+        breaker._acquire()
+
+
+def test_breaker_half_open():
+    breaker = arez.CircuitBreaker(min_requests=1, reset_timeout=0.05, max_reset_timeout=0.08)
+    breaker._record(False, False)
+    assert breaker.state == "open"
+    time.sleep(0.05)
+    assert breaker.state == "half-open"
+    # only a single probe is let through
+    assert breaker._acquire()
+    with pytest.raises(arez.Unavailable):
+        breaker._acquire()
+    # unknown outcome lets another probe through
+    breaker._record(None, True)
+    assert breaker._acquire()
+    # failed probe reopens the breaker, for longer
+    breaker._record(False, True)
+    assert breaker.state == "open"
+    assert breaker.retry_after > 0.05
+    assert breaker.trips == 1
+    # a healthy status report lets the probe through early
+    breaker.report_health(True)
+    assert breaker.state == "half-open"
+    assert breaker._acquire()
+    breaker._record(True, True)
+    assert breaker.state == "closed"
+    assert breaker.error_rate == 0
+
+
+def test_breaker_disabled():
+    breaker = arez.CircuitBreaker(min_requests=1, enabled=False)
+    for _ in range(5):
+        breaker._record(False, False)
+    assert breaker.state == "closed"
+    # retry delays grow with the error rate
+    assert breaker.retry_delay(0) > arez.CircuitBreaker().retry_delay(0) / 2
+    assert breaker.retry_delay(10) <= 10
@@ -0,0 +1,173 @@
+import gc
+import weakref
+from itertools import chain
+
+import arez
+import pytest
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+
+
+async def test_find_by_name(fake_server, fake_api):
+    english = arez.Language.English
+    german = arez.Language.German
+    assert fake_api.find_champion("anything") is None
+    assert await fake_api.initialize()
+    assert await fake_api.initialize(language=german)
+    champion = fake_api.get_entry().champions._list_lookup[0]
+    device = fake_api.get_entry().devices._list_lookup[0]
+    german_champion = fake_api.get_champion(champion.id, german)
+    assert german_champion is not None and german_champion.name != champion.name
+    # names in any cached language resolve, case insensitive
+    assert fake_api.find_champion(champion.name.upper()) is champion
+    assert fake_api.find_champion(german_champion.name) is champion
+    assert fake_api.find_champion(champion.name, german) is german_champion
+    assert fake_api.find_device(device.name.lower()) is device
+    assert fake_api.find_champion(device.name) is None
+    # languages that aren't cached fall back to the matching one
+    assert fake_api.find_champion(champion.name, arez.Language.French) is champion
+    del fake_api._cache[english]
+    assert fake_api.find_champion(champion.name) is None
+
+
+async def test_shared_cores(fake_server, fake_api):
+    german = arez.Language.German
+    assert await fake_api.initialize()
+    assert await fake_api.initialize(language=german)
+    entry = fake_api.get_entry()
+    german_entry = fake_api.get_entry(german)
+    # the language-independent data is shared, only the text differs
+    for objects in ("champions", "abilities", "devices"):
+        for obj in getattr(entry, objects):
+            german_obj = getattr(german_entry, objects)._id_lookup[obj.id]
+            assert german_obj is not obj and german_obj._core is obj._core
+            assert german_obj.name != obj.name and german_obj.icon_url == obj.icon_url
+    champion = next(iter(entry.champions))
+    german_champion = german_entry.get_champion(champion.id)
+    assert german_champion.health == champion.health
+    assert german_champion.get_card(next(iter(champion.cards)).id).champion is german_champion
+    # changed data gets a new core, leaving the other language's one alone
+    get_gods = fake_server._methods["getgods"]
+    champion_id = champion.id
+
+    def patched_gods(dev_id, *args):
+        data = get_gods(dev_id, *args)
+        for c in data:
+            if c["id"] == champion_id:
+                c["Speed"] += 10
+        return data
+
+    fake_server._methods["getgods"] = patched_gods
+    assert await fake_api.initialize()
+    new_champion = fake_api.get_champion(champion_id)
+    assert new_champion._core is not champion._core
+    assert new_champion.speed == german_champion.speed + 10
+    assert german_entry.get_champion(champion_id)._core is champion._core
+    # the cores are dropped together with the entries using them
+    del entry, german_entry, champion, german_champion, new_champion, obj, german_obj
+    fake_api._cache.clear()
+    gc.collect()
+    assert len(fake_api._cores) == 0
+
+
+async def test_incremental_refresh(fake_server, fake_api):
+    get_items = fake_server._methods["getitems"]
+    get_gods = fake_server._methods["getgods"]
+    assert await fake_api.initialize()
+    entry = fake_api.get_entry()
+    assert entry is not None and entry.changes is None
+    # nothing has changed
+    assert await fake_api.initialize()
+    refreshed = fake_api.get_entry()
+    assert refreshed is not entry and refreshed.changes is not None
+    assert not refreshed.changes
+    assert all(
+        refreshed.get_champion(c.id) is c and refreshed.get_device(d.id) is d
+        for c in entry.champions for d in entry.devices
+    )
+    champion, other_champion = list(entry.champions)[:2]
+    card = next(iter(champion.cards))
+    item = next(iter(entry.items))
+
+    # patch a card's price, remove a shop item and change the other champion's health
+    def patched_items(dev_id, *args):
+        data = [d for d in get_items(dev_id, *args) if d["ItemId"] != item.id]
+        for d in data:
+            if d["ItemId"] == card.id:
+                d["Price"] += 100
+        return data
+
+    def patched_gods(dev_id, *args):
+        data = get_gods(dev_id, *args)
+        for c in data:
+            if c["id"] == other_champion.id:
+                c["Health"] += 100
+        return data
+
+    fake_server._methods["getitems"] = patched_items
+    fake_server._methods["getgods"] = patched_gods
+    assert await fake_api.initialize()
+    patched = fake_api.get_entry()
+    changes = patched.changes
+    assert changes is not None
+    assert [d.id for d in changes.changed_devices] == [card.id]
+    assert [d.id for d in changes.removed_devices] == [item.id]
+    assert [c.id for c in changes.changed_champions] == [other_champion.id]
+    assert not changes.added_champions and not changes.added_devices
+    assert not changes.removed_champions
+    new_card = patched.get_card(card.id)
+    assert new_card is not card and new_card.price == card.price + 100
+    # the champion had to be rebuilt, together with it's other cards
+    new_champion = patched.get_champion(champion.id)
+    assert new_champion is not champion and new_champion.get_card(card.id) is new_card
+    for other_card in champion.cards:
+        if other_card.id != card.id:
+            new_other_card = new_champion.get_card(other_card.id)
+            assert new_other_card is not other_card and new_other_card.champion is new_champion
+            ability = new_other_card.ability
+            assert type(ability) is arez.CacheObject or ability.champion is new_champion
+    # the previous entry is left untouched
+    for old_card in chain(champion.cards, champion.talents):
+        assert old_card.champion is champion and entry.get_device(old_card.id) is old_card
+        ability = old_card.ability
+        assert type(ability) is arez.CacheObject or ability.champion is champion
+    new_other = patched.get_champion(other_champion.id)
+    assert new_other is not other_champion
+    assert new_other.health == other_champion.health + 100
+    # the rest is untouched
+    assert any(patched.get_champion(c.id) is c for c in entry.champions)
+    assert patched.get_item(item.id) is None
+
+
+async def test_eviction(fake_server, fake_api):
+    english = arez.Language.English
+    german = arez.Language.German
+    french = arez.Language.French
+    spanish = arez.Language.Spanish
+    fake_api.max_languages = 3
+    assert fake_api.cache_size == 0
+    for language in (english, german, french):
+        assert await fake_api.initialize(language=language)
+    size = fake_api.cache_size
+    assert size > 0
+    french_name = next(iter(fake_api._cache[french].champions)).name
+    assert fake_api.find_champion(french_name) is not None
+    # the default language is pinned, and german was used recently
+    assert fake_api.get_entry(german) is not None
+    assert await fake_api.initialize(language=spanish)
+    assert list(fake_api._cache) == [english, german, spanish]
+    assert fake_api.find_champion(french_name) is None
+    # the memory budget keeps the default language only
+    fake_api.max_cache_size = size // 3
+    evicted = weakref.ref(fake_api._cache[german])
+    evicted_champion = weakref.ref(next(iter(fake_api._cache[german].champions)))
+    assert await fake_api.initialize(language=french)
+    assert list(fake_api._cache) == [english]
+    assert fake_api.cache_size < size
+    # nothing keeps the evicted entries alive
+    gc.collect()
+    assert evicted() is None and evicted_champion() is None
+    # the cross-language name indexes are accounted for
+    entry_size = fake_api._cache[english]._estimate_size()
+    assert fake_api.cache_size > entry_size
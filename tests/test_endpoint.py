@@ -3,6 +3,8 @@ from datetime import datetime, timedelta
 import arez
 import pytest
 
+from .secret import DEV_ID, AUTH_KEY
+
 
 pytestmark = [pytest.mark.vcr, pytest.mark.base, pytest.mark.asyncio]
 
@@ -16,13 +18,27 @@ async def test_ping(api: arez.PaladinsAPI):
 @pytest.mark.dependency(depends=["test_ping"])
 async def test_unauthorized(api: arez.PaladinsAPI):
     # temporarly overwrite the authorization key with a fake one
-    real_key = api._Endpoint__auth_key  # type: ignore
-    api._Endpoint__auth_key = "FAKE_KEY"  # type: ignore
+    creds = api._credentials[0]
+    real_key = creds.auth_key
+    creds.auth_key = "FAKE_KEY"
     try:
         with pytest.raises(arez.Unauthorized):
             await api.request("testsession")
     finally:
-        api._Endpoint__auth_key = real_key  # type: ignore
+        creds.auth_key = real_key
+
+
+# test failing over to the next credentials
+@pytest.mark.dependency(depends=["test_unauthorized"])
+async def test_credentials_failover():
+    async with arez.PaladinsAPI(
+        DEV_ID, "FAKE_KEY", credentials=[(DEV_ID, AUTH_KEY)]
+    ) as api:
+        await api.request("testsession")
+        fake_creds, real_creds = api._credentials
+        assert fake_creds.unauthorized
+        assert not real_creds.unauthorized
+        assert fake_creds.in_flight == real_creds.in_flight == 0
 
 
 # test session creation
@@ -30,10 +46,11 @@ async def test_unauthorized(api: arez.PaladinsAPI):
 @pytest.mark.dependency(scope="session")
 async def test_session(api: arez.PaladinsAPI):
     # test invalid session
-    api._session_key = "ABCDEF"
-    api._session_expires = datetime.utcnow() + timedelta(seconds=30)
+    creds = api._credentials[0]
+    creds.session_key = "ABCDEF"
+    creds.session_expires = datetime.utcnow() + timedelta(seconds=30)
     await api.request("getpatchinfo")
-    api._session_expires = datetime.utcnow() - timedelta(seconds=30)
+    creds.session_expires = datetime.utcnow() - timedelta(seconds=30)
     # test normal session
     await api.request("testsession")
 
@@ -0,0 +1,78 @@
+import csv
+import gzip
+import json
+from datetime import datetime
+
+import arez
+import pytest
+import arez.export
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+
+
+async def test_match_writers(tmp_path, fake_api, fake_window, fake_matches):
+    start, end = fake_window
+    matches = fake_matches
+    csv_path = tmp_path / "matches.csv.gz"
+    with arez.CSVMatchWriter(csv_path, compression="gzip", batch_size=7) as writer:
+        written = await writer.consume(
+            fake_api.get_matches_for_queue(arez.Queue.Casual_Siege, start=start, end=end)
+        )
+    rows = await fake_api.request(
+        "getmatchdetailsbatch", ','.join(str(m.id) for m in matches[:10])
+    )
+    assert written == len(matches)
+    assert writer.rows_written == len(matches) * 10
+    players = [mp for m in matches for mp in m.players]
+    # CSV
+    with gzip.open(csv_path, "rt", newline='') as file:
+        csv_rows = list(csv.DictReader(file))
+    assert len(csv_rows) == len(players)
+    assert tuple(csv_rows[0]) == arez.MatchWriter.fields
+    for row, mp in zip(csv_rows, players):
+        assert int(row["player_id"]) == mp.player.id
+        assert int(row["kills"]) == mp.kills
+    assert datetime.fromisoformat(csv_rows[0]["timestamp"]) == matches[0].timestamp
+    # JSON Lines, from both the matches and the raw rows
+    objects_path = tmp_path / "objects.jsonl"
+    with arez.JSONLMatchWriter(objects_path) as writer:
+        writer.extend(matches[:10])
+    raw_path = tmp_path / "raw.jsonl"
+    with arez.JSONLMatchWriter(raw_path) as writer:
+        writer.write_rows(rows)
+    objects_lines = objects_path.read_text().splitlines()
+    assert objects_lines == raw_path.read_text().splitlines()
+    # the champion names don't depend on the language the matches were fetched in
+    french_matches = await fake_api.get_matches(
+        [m.id for m in matches[:10]], language=arez.Language.French
+    )
+    assert french_matches[0].team1[0].champion.name != matches[0].team1[0].champion.name
+    french_path = tmp_path / "french.jsonl"
+    with arez.JSONLMatchWriter(french_path) as writer:
+        writer.extend(french_matches)
+    assert french_path.read_text().splitlines() == objects_lines
+    first = json.loads(objects_lines[0])
+    assert first["match_id"] == matches[0].id
+    assert first["winner"] is players[0].winner
+    assert first["platform"] == players[0].player.platform.name
+    # closed writers and bad arguments
+    with pytest.raises(ValueError):
+        writer.write(matches[0])
+    with pytest.raises(ValueError):
+        arez.JSONLMatchWriter(tmp_path / "bad.jsonl", compression="rar")
+    with pytest.raises(ValueError):
+        arez.JSONLMatchWriter(tmp_path / "bad.jsonl", batch_size=0)
+    with pytest.raises(TypeError):
+        arez.MatchWriter(tmp_path / "bad.jsonl")
+    # Parquet
+    if arez.export._pyarrow is None:
+        with pytest.raises(ImportError):
+            arez.ParquetMatchWriter(tmp_path / "matches.parquet")
+    else:
+        parquet_path = tmp_path / "matches.parquet"
+        with arez.ParquetMatchWriter(parquet_path, compression="zstd") as writer:
+            writer.extend(matches)
+        table = arez.export._parquet.read_table(parquet_path)
+        assert table.num_rows == len(players)
+        assert table.column("kills").to_pylist() == [mp.kills for mp in players]
@@ -0,0 +1,74 @@
+import arez
+import pytest
+import arez.frame
+from arez.frame import MatchFrame
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(arez.frame, "_numpy", None)
+    return request.param
+
+
+async def test_match_frame(backend: str, fake_api, fake_matches):
+    matches = fake_matches
+    match_ids = ','.join(str(m.id) for m in matches[:10])
+    rows = await fake_api.request("getmatchdetailsbatch", match_ids)
+    frame = MatchFrame.from_matches(matches)
+    assert len(frame) == len(matches) * 10
+    # the raw rows give the same result
+    assert list(MatchFrame.from_rows(rows)["kills"]) == list(frame["kills"])[:100]
+    players = [mp for m in matches for mp in m.players]
+    # group by a single column
+    by_champion = frame.group_by("champion_id")
+    champion_ids = {mp.champion.id for mp in players}
+    assert len(by_champion) == len(champion_ids)
+    counts = by_champion.count()
+    assert sum(counts.values()) == len(frame)
+    kills = by_champion.sum("kills")
+    winrates = by_champion.mean("winner")
+    for champion_id in champion_ids:
+        champion_players = [mp for mp in players if mp.champion.id == champion_id]
+        assert counts[champion_id] == len(champion_players)
+        assert kills[champion_id] == sum(mp.kills for mp in champion_players)
+        assert winrates[champion_id] == pytest.approx(
+            sum(mp.winner for mp in champion_players) / len(champion_players)
+        )
+    # group by several columns
+    by_team = frame.group_by(("match_id", "team"))
+    assert by_team.count() == {(m.id, t): 5 for m in matches for t in (1, 2)}
+    assert by_team.mean("winner") == {
+        (m.id, t): float(m.winning_team == t) for m in matches for t in (1, 2)
+    }
+    # extending
+    other = MatchFrame()
+    other.extend(frame)
+    other.extend(frame)
+    assert len(other) == 2 * len(frame)
+    assert other.group_by("champion_id").count() == {k: 2 * v for k, v in counts.items()}
+
+
+async def test_match_frame_numpy():
+    np = pytest.importorskip("numpy")
+    frame = MatchFrame()
+    assert all(len(column) == 0 for column in frame.to_numpy().values())
+    frame.append_rows([{
+        "Match": 1, "playerId": "2", "ChampionId": 2001, "match_queue_id": 424,
+        "Time_In_Match_Seconds": 600, "TaskForce": 1, "Winning_TaskForce": 1, "League_Tier": 0,
+        "Kills_Player": 3, "Deaths": 1, "Assists": 5, "Damage_Done_Physical": 12345,
+        "Healing": 0, "Gold_Earned": 4000,
+    }])
+    arrays = frame.to_numpy()
+    assert set(arrays) == set(MatchFrame.columns)
+    assert isinstance(arrays["damage"], np.ndarray)
+    assert arrays["damage"].tolist() == [12345]
+    assert arrays["winner"].tolist() == [1]
+    # the arrays share memory with the frame
+    frame["kills"][0] = 10
+    assert arrays["kills"][0] == 10
@@ -0,0 +1,101 @@
+import arez
+import pytest
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+
+
+def expected_edges(server, seed, depth, failing=()):
+    # reference breadth-first search over the server's friendships,
+    # where the friend lists of the failing players can't be fetched
+    edges = set()
+    visited = {seed}
+    frontier = [seed]
+    for _ in range(depth):
+        next_frontier = []
+        for player_id in frontier:
+            if player_id in failing:
+                continue
+            for friend_id in server._friend_ids(player_id):
+                edges.add(frozenset((player_id, friend_id)))
+                if friend_id not in visited:
+                    visited.add(friend_id)
+                    next_frontier.append(friend_id)
+        frontier = next_frontier
+    return edges, visited
+
+
+async def test_friends_crawler(fake_server, fake_api):
+    seed = fake_server.player_ids[0]
+    with pytest.raises(ValueError):
+        arez.FriendsCrawler(fake_api, [seed], depth=0)
+    crawler = arez.FriendsCrawler(fake_api, [seed, seed, 0], depth=2)
+    edges = [edge async for edge in crawler]
+    pairs = [frozenset((edge.source.id, edge.target.id)) for edge in edges]
+    expected, visited = expected_edges(fake_server, seed, 2)
+    # every friendship is found exactly once
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == expected
+    assert set(crawler.nodes) == visited
+    assert all(edge.depth in (1, 2) for edge in edges)
+    assert {edge.source.id for edge in edges if edge.depth == 1} == {seed}
+    assert crawler.requests_used == fake_server.calls["getfriends"] == len(crawler.expanded)
+    # the whole crawl has already been done
+    assert [edge async for edge in crawler] == []
+
+    # request budget
+    fake_server.calls.clear()
+    crawler = arez.FriendsCrawler(fake_api, [seed], depth=3, max_requests=5)
+    budget_edges = [edge async for edge in crawler]
+    assert budget_edges
+    assert crawler.requests_used == fake_server.calls["getfriends"] == 5
+
+    # batched expansion
+    fake_server.calls.clear()
+    crawler = arez.FriendsCrawler(fake_api, [seed], depth=2, fetch_players=True)
+    batch_pairs = {
+        frozenset((edge.source.id, edge.target.id)) async for edge in crawler
+    }
+    assert batch_pairs <= expected
+    assert fake_server.calls["getplayerbatch"] >= 2
+    assert crawler.requests_used == (
+        fake_server.calls["getplayerbatch"] + fake_server.calls["getfriends"]
+    )
+    for player_id in crawler.expanded:
+        assert isinstance(crawler.nodes[player_id], arez.Player)
+        assert not fake_server._player_private(player_id)
+
+    # stopping early
+    crawler = arez.FriendsCrawler(fake_api, [seed], depth=2)
+    async for edge in crawler:
+        break
+    assert len(crawler.nodes) < len(visited)
+
+
+async def test_friends_crawler_failures(monkeypatch, fake_server, fake_api):
+    seed = fake_server.player_ids[0]
+    # fail a friend of the seed that's also friends with other friends of the seed
+    seed_friends = set(fake_server._friend_ids(seed))
+    failing_id = max(
+        seed_friends, key=lambda f: len(seed_friends.intersection(fake_server._friend_ids(f)))
+    )
+    assert seed_friends.intersection(fake_server._friend_ids(failing_id))
+    get_friends = arez.PartialPlayer.get_friends
+
+    async def failing_get_friends(self):
+        if self.id == failing_id:
+            raise arez.Private
+        return await get_friends(self)
+
+    monkeypatch.setattr(arez.PartialPlayer, "get_friends", failing_get_friends)
+    crawler = arez.FriendsCrawler(fake_api, [seed], depth=2)
+    edges = [edge async for edge in crawler]
+    pairs = [frozenset((edge.source.id, edge.target.id)) for edge in edges]
+    expected, visited = expected_edges(fake_server, seed, 2, failing={failing_id})
+    # the friendships of the failing player are still found from the other side
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == expected
+    assert crawler.failed == {failing_id}
+    assert failing_id not in crawler.expanded
+    # failed players aren't retried
+    assert [edge async for edge in crawler] == []
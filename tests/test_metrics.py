@@ -0,0 +1,59 @@
+from typing import List
+
+import arez
+import pytest
+
+
+pytestmark = pytest.mark.base
+
+
+def test_histogram():
+    histogram = arez.Histogram((1, 5, 10))
+    assert histogram.quantile(0.5) is None
+    for value in (0.5, 1, 3, 7, 20):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1, 1]
+    assert histogram.count == 5
+    assert histogram.sum == 31.5
+    assert histogram.cumulative() == [(1, 2), (5, 3), (10, 4), (float("inf"), 5)]
+    assert histogram.quantile(0.4) == 1
+    assert histogram.quantile(0.5) == 5
+    assert histogram.quantile(1) == float("inf")
+
+
+def test_metrics():
+    metrics = arez.Metrics()
+    records: List[arez.RequestRecord] = []
+
+    def failing_listener(record: arez.RequestRecord):
+        raise RuntimeError
+
+    metrics.add_listener(records.append)
+    metrics.add_listener(failing_listener)
+    # successful request, after a single retry
+    record = arez.RequestRecord("getplayer", arez.Priority.Normal)
+    record.tries = 2
+    record.payload_size = 2000
+    record.errors.append("TimeoutError")
+    metrics._record(record)
+    # failed request
+    record = arez.RequestRecord("getplayer", arez.Priority.Bulk)
+    record.tries = 1
+    record.exception = arez.Unavailable()
+    metrics._record(record)
+
+    assert len(records) == 2
+    assert records[0].retries == 1
+    assert records[0].duration > 0
+    method_metrics = metrics.methods["getplayer"]
+    assert method_metrics.requests == 2
+    assert method_metrics.retries == 1
+    assert method_metrics.errors == {"TimeoutError": 1}
+    assert method_metrics.failures == {"Unavailable": 1}
+    assert method_metrics.latency.count == 2
+    assert method_metrics.phases["http"].count == 2
+    assert method_metrics.payload_size.count == 1
+
+    metrics.remove_listener(failing_listener)
+    metrics.reset()
+    assert not metrics.methods
@@ -0,0 +1,75 @@
+import asyncio
+from typing import List
+
+import arez
+import pytest
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+Priority = arez.Priority
+
+
+async def test_scheduler_priority():
+    scheduler = arez.RequestScheduler(1, aging=0)
+    order: List[str] = []
+
+    async def job(name: str, priority: Priority):
+        await scheduler.acquire(priority)
+        order.append(name)
+        await asyncio.sleep(0)
+        scheduler.release()
+
+    await scheduler.acquire()
+    tasks = [
+        asyncio.ensure_future(job("bulk1", Priority.Bulk)),
+        asyncio.ensure_future(job("normal", Priority.Normal)),
+        asyncio.ensure_future(job("bulk2", Priority.Bulk)),
+        asyncio.ensure_future(job("interactive", Priority.Interactive)),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued == {
+        Priority.Interactive: 1, Priority.Normal: 1, Priority.Bulk: 2
+    }
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    assert order == ["interactive", "normal", "bulk1", "bulk2"]
+    assert scheduler.in_flight == 0
+
+
+async def test_scheduler_aging():
+    scheduler = arez.RequestScheduler(1, aging=0.01)
+    order: List[str] = []
+
+    async def job(name: str, priority: Priority):
+        await scheduler.acquire(priority)
+        order.append(name)
+        scheduler.release()
+
+    await scheduler.acquire()
+    bulk = asyncio.ensure_future(job("bulk", Priority.Bulk))
+    await asyncio.sleep(0.03)
+    # the bulk job has been waiting long enough to be let through first
+    interactive = asyncio.ensure_future(job("interactive", Priority.Interactive))
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(bulk, interactive)
+    assert order == ["bulk", "interactive"]
+
+
+async def test_scheduler_cancel():
+    scheduler = arez.RequestScheduler(1)
+    await scheduler.acquire()
+    task = asyncio.ensure_future(scheduler.acquire(Priority.Normal))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    scheduler.release()
+    assert scheduler.in_flight == 0
+    # the limit can be lifted at any time
+    await scheduler.acquire()
+    task = asyncio.ensure_future(scheduler.acquire(Priority.Bulk))
+    await asyncio.sleep(0)
+    scheduler.max_concurrent = None
+    await task
+    assert scheduler.in_flight == 2
@@ -0,0 +1,70 @@
+import json
+
+import arez
+import pytest
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+
+
+def roundtrip(obj):
+    # make sure the serialized form survives a trip through JSON
+    return json.loads(json.dumps(obj.to_dict()))
+
+
+async def test_serialization(fake_server, fake_api, fake_window):
+    start, end = fake_window
+    await fake_api.get_champion_info()
+    fake_api.keep_raw = True
+    match = None
+    async for match in fake_api.get_matches_for_queue(
+        arez.Queue.Casual_Siege, start=start, end=end, expand_players=True
+    ):
+        break
+    assert match is not None
+    player = next(mp.player for mp in match.players if mp.player.id)
+    history = await player.get_match_history()
+    stats = await player.get_champion_stats()
+    queue_stats = await player.get_champion_stats(queue=arez.Queue.Casual_Siege)
+    calls = sum(fake_server.calls.values())
+    # players
+    copy = arez.PartialPlayer.from_dict(fake_api, roundtrip(player))
+    assert isinstance(copy, arez.Player)
+    assert copy == player and copy.level == player.level
+    assert copy.ranked_best.rank == player.ranked_best.rank
+    partial = arez.PartialPlayer(fake_api, id=1234, name="Name", platform=5)
+    partial_copy = arez.PartialPlayer.from_dict(fake_api, roundtrip(partial))
+    assert type(partial_copy) is arez.PartialPlayer
+    assert partial_copy.to_dict() == partial.to_dict()
+    # full match, with the expanded players
+    match_copy = arez.Match.from_dict(fake_api, roundtrip(match))
+    assert match_copy.id == match.id and match_copy.bans == match.bans
+    assert match_copy.timestamp == match.timestamp
+    for mp, mp_copy in zip(match.players, match_copy.players):
+        assert type(mp_copy.player) is type(mp.player)
+        assert mp_copy.player.to_dict() == mp.player.to_dict()
+        assert mp_copy.champion is mp.champion
+        assert (mp_copy.kda, mp_copy.party_number) == (mp.kda, mp.party_number)
+    # partial matches
+    for partial_match in history:
+        copy = arez.PartialMatch.from_dict(fake_api, roundtrip(partial_match))
+        assert copy.id == partial_match.id and copy.player == player
+        assert copy.champion is partial_match.champion
+        assert copy.score == partial_match.score
+    # champion stats
+    for stats_list in (stats, queue_stats):
+        for champion_stats in stats_list:
+            copy = arez.ChampionStats.from_dict(fake_api, roundtrip(champion_stats))
+            assert copy.queue is champion_stats.queue
+            assert copy.champion is champion_stats.champion
+            assert copy.playtime == champion_stats.playtime
+    # no requests were made
+    assert sum(fake_server.calls.values()) == calls
+    # the raw data isn't kept by default
+    fake_api.keep_raw = False
+    match_copy = arez.Match.from_dict(fake_api, roundtrip(match))
+    assert match_copy._raw is None
+    assert all(mp.player._raw is None for mp in match_copy.players if mp.player.id)
+    with pytest.raises(ValueError):
+        match_copy.to_dict()
+    assert isinstance(partial.to_dict(), dict)
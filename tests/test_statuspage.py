@@ -1,10 +1,20 @@
+import copy
+import json
+import asyncio
+from typing import List
+
 import arez
 import pytest
+from aiohttp import web, ClientTimeout, ClientResponseError
+
+from .test_watcher import SUMMARY
 
 
-pytestmark = [pytest.mark.vcr, pytest.mark.asyncio, pytest.mark.statuspage]
+pytestmark = [pytest.mark.asyncio]
 
 
+@pytest.mark.vcr
+@pytest.mark.statuspage
 async def test_statuspage(sp: arez.StatusPage):
     status = await sp.get_status()
     assert isinstance(status, arez.statuspage.CurrentStatus)
@@ -27,3 +37,109 @@ async def test_statuspage(sp: arez.StatusPage):
     # test component and group getting methods
     status.component("Test")
     status.group("Test")
+
+
+@pytest.mark.base
+async def test_statuspage_conditional():
+    summary = copy.deepcopy(SUMMARY)
+    # ETag: (requests, not modified responses)
+    counts = {"requests": 0, "not_modified": 0}
+    use_etag = True
+    always_not_modified = False
+
+    async def handler(request):
+        counts["requests"] += 1
+        if always_not_modified:
+            return web.Response(status=304)
+        body = json.dumps(summary)
+        etag = f'"{hash(body)}"'
+        if use_etag and request.headers.get("If-None-Match") == etag:
+            counts["not_modified"] += 1
+            return web.Response(status=304)
+        headers = {"ETag": etag} if use_etag else {}
+        return web.Response(text=body, content_type="application/json", headers=headers)
+
+    app = web.Application()
+    app.router.add_get("/api/v2/summary.json", handler)
+    app.router.add_get("/api/v2/components.json", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        async with arez.StatusPage(f"http://127.0.0.1:{port}") as page:
+            status = await page.get_status()
+            # not modified - the same object is returned
+            assert await page.get_status() is status
+            assert counts == {"requests": 2, "not_modified": 1}
+            # modified
+            summary["status"]["description"] = "Partially Degraded Service"
+            new_status = await page.get_status()
+            assert new_status is not status
+            assert new_status.status == "Partially Degraded Service"
+            # no conditional request support, but the body is the same
+            use_etag = False
+            assert await page.get_status() is new_status
+            assert counts == {"requests": 4, "not_modified": 1}
+            data = await page.request("summary.json")
+            assert data == summary
+            # the cached response can't be modified from the outside
+            data["status"]["description"] = "Modified"
+            assert (await page.request("summary.json")) == summary
+            # not modified, despite the request not being conditional
+            always_not_modified = True
+            with pytest.raises(ClientResponseError):
+                await page.request("components.json")
+    finally:
+        await runner.cleanup()
+
+
+@pytest.mark.base
+async def test_statuspage_shared_session(monkeypatch):
+    # make the requests time out quickly
+    monkeypatch.setattr(arez.statuspage, "timeout", ClientTimeout(total=0.2))
+    hangs = {"remaining": 1}
+
+    async def handler(request):
+        if hangs["remaining"]:
+            hangs["remaining"] -= 1
+            await asyncio.sleep(1)
+        return web.json_response(SUMMARY)
+
+    app = web.Application()
+    app.router.add_get("/api/v2/summary.json", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    records: List[arez.RequestRecord] = []
+    try:
+        async with arez.PaladinsAPI(1004, "authkey") as api:
+            api.metrics.add_listener(records.append)
+            async with arez.StatusPage(f"http://127.0.0.1:{port}", api=api) as page:
+                assert page._session is api._http_session
+                assert page.metrics is api.metrics
+                # the first try hangs and times out, the retry succeeds
+                status = await page.get_status()
+                assert status.status == SUMMARY["status"]["description"]
+            # closing the status page leaves the shared session open
+            assert not api._http_session.closed
+        assert len(records) == 1
+        record = records[0]
+        assert record.method_name == "statuspage:summary.json"
+        assert record.tries == 2
+        assert len(record.errors) == 1
+        assert record.exception is None
+        assert record.payload_size > 0
+        assert "statuspage:summary.json" in api.metrics.methods
+        # running out of retries propagates the timeout
+        hangs["remaining"] = 1
+        async with arez.StatusPage(f"http://127.0.0.1:{port}", max_retries=0) as page:
+            with pytest.raises(asyncio.TimeoutError):
+                await page.get_status()
+            method_metrics = page.metrics.methods["statuspage:summary.json"]
+            assert method_metrics.requests == 1
+    finally:
+        await runner.cleanup()
@@ -0,0 +1,69 @@
+import arez
+import pytest
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+
+
+async def test_match_store(tmp_path, fake_server, fake_api, fake_matches):
+    path = tmp_path / "matches.db"
+    store = arez.MatchStore(path)
+    fake_api.match_store = store
+    match_ids = [m.id for m in fake_matches]
+    assert len(store) == 0
+    # fetched and stored
+    match = await fake_api.get_match(match_ids[0])
+    assert match_ids[0] in store
+    calls = fake_server.calls["getmatchdetails"]
+    # read from the store
+    stored_match = await fake_api.get_match(match_ids[0], expand_players=True)
+    assert fake_server.calls["getmatchdetails"] == calls
+    assert stored_match.id == match.id and stored_match.bans == match.bans
+    assert any(isinstance(mp.player, arez.Player) for mp in stored_match.players)
+    # only the missing matches are requested
+    batches = fake_server.calls["getmatchdetailsbatch"]
+    matches = await fake_api.get_matches(match_ids[:15])
+    assert fake_server.calls["getmatchdetailsbatch"] == batches + 2
+    assert {m.id for m in matches} == set(match_ids[:15])
+    assert len(store) == 15
+    matches = await fake_api.get_matches(match_ids[:15])
+    assert fake_server.calls["getmatchdetailsbatch"] == batches + 2
+    assert len(matches) == 15
+    # matches without the raw data kept can't be added
+    with pytest.raises(ValueError):
+        store.add(match)
+    fake_api.keep_raw = True
+    match = await fake_api.get_match(match_ids[0])
+    matches = await fake_api.get_matches(match_ids[:15])
+    # adding already stored matches does nothing
+    assert not store.add(match)
+    assert store.add_many(matches) == 0
+    store.close()
+    # reopen the database file and query it
+    fake_api.match_store = None
+    with arez.MatchStore(path) as store:
+        assert len(store) == 15
+        player_id = next(mp.player.id for mp in match.players if mp.player.id)
+        player_matches = [
+            m for m in matches if any(mp.player.id == player_id for mp in m.players)
+        ]
+        found = store.query(fake_api, player=player_id, queue=arez.Queue.Casual_Siege)
+        assert {m.id for m in found} == {m.id for m in player_matches}
+        assert store.query_ids(player=player_id, queue=arez.Queue.Team_Deathmatch) == []
+        # newest first, with an exclusive end and a limit
+        newest = store.query_ids()
+        stamps = [m.timestamp for m in store.get_many(fake_api, newest)]
+        assert stamps == sorted(stamps, reverse=True)
+        assert store.query_ids(limit=3) == newest[:3]
+        assert store.query_ids(start=stamps[0]) == [
+            i for i, s in zip(newest, stamps) if s == stamps[0]
+        ]
+        assert set(store.query_ids(end=stamps[0])) == {
+            i for i, s in zip(newest, stamps) if s < stamps[0]
+        }
+        assert store.get(fake_api, 123) is None
+        # stored and fetched matches keep the order requested
+        fake_api.match_store = store
+        mixed_ids = match_ids[15:20] + match_ids[:5] + match_ids[20:25]
+        matches = await fake_api.get_matches(mixed_ids)
+        assert [m.id for m in matches] == mixed_ids
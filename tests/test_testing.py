@@ -0,0 +1,115 @@
+import asyncio
+from time import monotonic
+
+import arez
+import pytest
+from arez.testing import FakeServer
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+
+
+@pytest.mark.parametrize(
+    "fake_server", [{"credentials": {1004: "authkey"}, "private_ratio": 0}], indirect=True
+)
+async def test_fake_server(fake_server, fake_api, fake_window, fake_matches):
+    entry = await fake_api.get_champion_info()
+    assert len(entry.champions) == 10
+    assert all(entry.champions)
+    player = await fake_api.get_player(fake_server.player_ids[1])
+    assert isinstance(player, arez.Player)
+    assert player.id == fake_server.player_ids[1]
+    # the same data is served every time
+    again = await fake_api.get_player(fake_server.player_ids[1])
+    assert again.name == player.name and again.region == player.region
+    history = await player.get_match_history()
+    assert history and all(m.player.id == player.id for m in history)
+    # the crawled half an hour worth of matches
+    start, end = fake_window
+    assert len(fake_matches) == 30
+    assert [m.id for m in fake_matches] == fake_server.match_ids(424, start, end)
+    assert all(len(m.team1) == len(m.team2) == 5 for m in fake_matches)
+    assert fake_server.calls["createsession"] == 1
+    # invalid credentials are rejected
+    async with arez.PaladinsAPI(1004, "wrong") as api:
+        api.url = fake_server.url
+        with pytest.raises(arez.Unauthorized):
+            await api.request("testsession")
+
+
+async def test_fake_server_errors():
+    async with FakeServer(error_rate=1) as server:
+        async with arez.PaladinsAPI(1004, "authkey") as api:
+            api.url = server.url
+            with pytest.raises(arez.Unavailable):
+                await api.request("testsession")
+    async with FakeServer(request_limit=1) as server:
+        async with arez.PaladinsAPI(1004, "authkey") as api:
+            api.url = server.url
+            api.reconcile_every = None
+            await api.request("testsession")
+            response = await api.request("getplayer", server.player_ids[0])
+            assert response[0]["ret_msg"].startswith("Daily request limit reached")
+
+
+async def test_fake_server_credentials_failover():
+    async with FakeServer(credentials={1004: "authkey"}, private_ratio=0) as server:
+        revoked = [(1005 + i, "revoked") for i in range(5)]
+        async with arez.PaladinsAPI(
+            1004, "authkey", credentials=revoked, max_concurrent=1
+        ) as api:
+            api.url = server.url
+            api.reconcile_every = None
+            player_ids = server.player_ids[:40]
+            players = await asyncio.gather(*(api.get_player(p) for p in player_ids))
+            assert [p.id for p in players] == player_ids
+            valid, *invalid = api._credentials
+            assert all(c.unauthorized for c in invalid)
+            assert not valid.unauthorized
+            # every invalid pair is tried at most once, and only successful sessions count
+            assert server.calls["createsession"] <= 1 + len(invalid)
+            assert valid.quota.sessions_used == 1
+            assert all(c.quota.sessions_used == 0 for c in invalid)
+
+
+async def test_fake_server_data_used():
+    async with FakeServer() as server:
+        async with arez.PaladinsAPI(1004, "authkey", max_concurrent=1) as api:
+            api.url = server.url
+            # the first request schedules a reconciliation
+            await api.request("getplayer", server.player_ids[0])
+            creds = api._credentials[0]
+            assert creds.reconcile_task is not None
+            await creds.reconcile_task
+            assert creds.reconcile_task is None
+            for player_id in server.player_ids[1:3]:
+                await api.request("getplayer", player_id)
+            # the reconciling request itself is counted only once, by the server
+            used, = await api.fetch_data_used()
+            assert server.calls["getdataused"] == 2
+            assert used.requests_used == server._usage["1004"][0] == 5
+            assert used.method_requests == {"getplayer": 3}
+            assert used.reconciled_at is not None
+            # unexpected responses are logged instead of raised
+            server._methods["getdataused"] = lambda dev_id: [{}]
+            used, = await api.fetch_data_used()
+            assert used.requests_used == 5
+
+
+async def test_fake_server_rate_limit():
+    with pytest.raises(ValueError):
+        arez.PaladinsAPI(1004, "authkey", rate_limit=0)
+    async with FakeServer() as server:
+        async with arez.PaladinsAPI(
+            1004, "authkey", credentials=[(1005, "authkey")], rate_limit=20
+        ) as api:
+            api.url = server.url
+            api.reconcile_every = None
+            start = monotonic()
+            await asyncio.gather(
+                *(api.request("getplayer", player_id) for player_id in server.player_ids[:80])
+            )
+            elapsed = monotonic() - start
+    # 20 requests for each pair go through right away, and the rest at 20 per second each
+    assert 0.9 <= elapsed < 2
+    assert server._usage["1004"][0] == server._usage["1005"][0] == 40
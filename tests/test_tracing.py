@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Any, Optional, List, Dict, Iterator
+
+import arez
+import pytest
+from arez.tracing import _traced
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+
+
+class FakeSpan:
+    def __init__(self, name: str, parent: Optional[FakeSpan], attributes: Dict[str, Any]):
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans: List[FakeSpan] = []
+        self._stack: List[FakeSpan] = []
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes=None) -> Iterator[FakeSpan]:
+        parent = self._stack[-1] if self._stack else None
+        span = FakeSpan(name, parent, dict(attributes or {}))
+        self.spans.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            self._stack.pop()
+
+
+class Traced:
+    def __init__(self, tracer: Optional[FakeTracer]):
+        self.tracer = tracer
+
+    @_traced
+    async def method(self, value: int) -> int:
+        return value * 2
+
+
+async def test_traced():
+    tracer = FakeTracer()
+    assert await Traced(tracer).method(2) == 4
+    assert len(tracer.spans) == 1
+    span = tracer.spans[0]
+    assert span.name == "Traced.method"
+    assert span.parent is None
+    # no tracer means no spans and no errors
+    assert await Traced(None).method(3) == 6
+
+
+async def test_request_span():
+    tracer = FakeTracer()
+    async with arez.PaladinsAPI(1, "a") as api:
+        api.tracer = tracer
+        # fail fast with the breaker, to avoid reaching the API
+        api.breaker._trip(time.monotonic())
+        with pytest.raises(arez.Unavailable):
+            await api.request("getmatchdetailsbatch", "1,2,3", priority=arez.Priority.Bulk)
+    assert len(tracer.spans) == 1
+    span = tracer.spans[0]
+    assert span.name == "Endpoint.request"
+    assert span.attributes == {
+        "arez.method": "getmatchdetailsbatch",
+        "arez.priority": "Bulk",
+        "arez.chunk_size": 3,
+        "arez.tries": 0,
+        "arez.payload_size": 0,
+    }
+    assert api.metrics.methods["getmatchdetailsbatch"].failures == {"Unavailable": 1}
+
+
+async def test_cache_lookup_span(fake_api):
+    tracer = FakeTracer()
+    fake_api.tracer = tracer
+    fake_api.reconcile_every = None
+    for _ in range(2):
+        await fake_api.get_champion_info()
+    lookups = [span for span in tracer.spans if span.name == "DataCache.lookup"]
+    assert [span.attributes["arez.cache_hit"] for span in lookups] == [False, True]
+    assert all(span.parent.name == "PaladinsAPI.get_champion_info" for span in lookups)
+    assert lookups[0].attributes["arez.language"] == "English"
+    # the requests made on a miss are nested under the lookup
+    requests = [span for span in tracer.spans if span.name == "Endpoint.request"]
+    assert [span.attributes["arez.method"] for span in requests] == ["getgods", "getitems"]
+    assert all(span.parent is lookups[0] for span in requests)
+    # the server status
+    for _ in range(2):
+        await fake_api.get_server_status()
+    lookups = [
+        span for span in tracer.spans if span.name == "PaladinsAPI.server_status_lookup"
+    ]
+    assert [span.attributes["arez.cache_hit"] for span in lookups] == [False, True]
+    assert all(span.parent.name == "PaladinsAPI.get_server_status" for span in lookups)
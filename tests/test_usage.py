@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+import arez
+import pytest
+from arez.usage import _Quota
+
+
+pytestmark = [pytest.mark.base]
+
+
+usage_data = {
+    "Active_Sessions": 2,
+    "Concurrent_Sessions": 50,
+    "Request_Limit_Daily": 7500,
+    "Session_Cap": 500,
+    "Session_Time_Limit": 15,
+    "Total_Requests_Today": 100,
+    "Total_Sessions_Today": 3,
+    "ret_msg": None,
+}
+
+
+def test_quota_counting():
+    quota = _Quota()
+    quota.add_session()
+    for _ in range(3):
+        quota.add_request("getplayer")
+    quota.add_request("getmatchdetails")
+    used = quota.snapshot("1234")
+    assert used.requests_used == 4
+    assert used.sessions_used == used.active_sessions == 1
+    assert used.method_requests == {"getplayer": 3, "getmatchdetails": 1}
+    assert used.requests_left == 7496
+    assert used.reconciled_at is None
+    repr(used)
+
+
+def test_quota_reconcile():
+    quota = _Quota()
+    quota.add_request("getplayer")
+    quota.start_reconcile()
+    # made while the reconciliation was in progress
+    quota.add_request("getplayer")
+    quota.reconcile(usage_data)
+    used = quota.snapshot("1234")
+    assert used.requests_used == 101
+    assert used.sessions_used == 3
+    assert used.active_sessions == 2
+    assert used.sessions_left == 497
+    assert used.reconciled_at is not None
+    # counts reset with the day
+    quota.day -= timedelta(days=1)
+    assert quota.snapshot("1234").requests_used == 0
+
+
+def test_quota_budgets():
+    quota = _Quota()
+    for _ in range(5):
+        quota.add_request("getplayer")
+    assert quota.within_budget(arez.Priority.Bulk, None, None)
+    assert not quota.within_budget(arez.Priority.Bulk, 5, 10)
+    assert quota.within_budget(arez.Priority.Normal, 5, 10)
+    assert quota.within_budget(arez.Priority.Interactive, 5, 10)
+    assert not quota.within_budget(arez.Priority.Interactive, 3, 5)
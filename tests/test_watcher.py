@@ -0,0 +1,242 @@
+import copy
+import asyncio
+
+import arez
+import pytest
+from aiohttp import web
+from arez.testing import FakeServer
+
+
+pytestmark = [pytest.mark.base, pytest.mark.asyncio]
+STAMP = "2020-01-01T12:00:00.000+00:00"
+
+
+def component(id, name, status, *, group=False, group_id=None):
+    return {
+        "id": id, "name": name, "status": status, "group": group, "group_id": group_id,
+        "created_at": STAMP, "updated_at": STAMP,
+    }
+
+
+def update(id, status):
+    return {
+        "id": id, "body": f"Update {id}", "status": status,
+        "created_at": STAMP, "updated_at": STAMP,
+    }
+
+
+def event(id, status, impact, updates, components, **extra):
+    return {
+        "id": id, "name": f"Event {id}", "status": status, "impact": impact,
+        "incident_updates": updates, "components": [{"id": c} for c in components],
+        "created_at": STAMP, "updated_at": STAMP, **extra,
+    }
+
+
+SUMMARY = {
+    "page": {"id": "page", "name": "Status", "time_zone": "UTC", "updated_at": STAMP},
+    "status": {"indicator": "none", "description": "All Systems Operational"},
+    "components": [
+        component("group", "Paladins", "operational", group=True),
+        component("pc", "Paladins PC", "operational", group_id="group"),
+        component("switch", "Paladins Switch", "operational", group_id="group"),
+    ],
+    "incidents": [],
+    "scheduled_maintenances": [],
+}
+
+
+@pytest.mark.parametrize("fake_server", [{"live_ratio": 1}], indirect=True)
+async def test_live_match_watcher(fake_server, fake_api):
+    player_ids = fake_server.player_ids[:3]
+    match_id = fake_server._live_match_id(player_ids[0])
+    # player ID: (status, live match ID)
+    statuses = {player_id: (0, 0) for player_id in player_ids}
+
+    def get_player_status(dev_id, player):
+        status, live_match_id = statuses[int(player)]
+        return [{
+            "Match": live_match_id,
+            "match_queue_id": live_match_id % 1000 if live_match_id else 0,
+            "personal_status_message": "",
+            "ret_msg": None,
+            "status": status,
+            "status_string": "",
+        }]
+
+    fake_server._methods["getplayerstatus"] = get_player_status
+    watcher = arez.LiveMatchWatcher(fake_api, player_ids, min_interval=0, max_interval=0)
+    # everyone's offline
+    assert await watcher.poll() == []
+    assert fake_server.calls["getplayerstatus"] == 3
+    # two players go online and start a match together
+    statuses[player_ids[0]] = statuses[player_ids[1]] = (3, match_id)
+    events = await watcher.poll()
+    assert [type(e) for e in events] == [
+        arez.PlayerOnline, arez.PlayerOnline, arez.LiveMatchStarted
+    ]
+    started = events[-1]
+    assert started.match_id == match_id and started.match.id == match_id
+    assert [p.id for p in started.players] == player_ids[:2]
+    assert fake_server.calls["getmatchplayerdetails"] == 1
+    # only one of the players in the match is polled
+    assert await watcher.poll() == []
+    assert fake_server.calls["getplayerstatus"] == 3 + 3 + 2
+    assert fake_server.calls["getmatchplayerdetails"] == 1
+    assert set(watcher.live_matches) == {match_id}
+    # the match ends, and the first player goes offline
+    statuses[player_ids[0]] = (0, 0)
+    statuses[player_ids[1]] = (1, 0)
+    events = await watcher.poll()
+    # the match ends for the other player as well, without waiting for them to be polled
+    assert [type(e) for e in events] == [arez.PlayerOffline, arez.LiveMatchEnded]
+    assert events[1].match is started.match
+    assert watcher.live_matches == {}
+    calls = fake_server.calls["getplayerstatus"]
+    assert await watcher.poll() == []
+    assert fake_server.calls["getplayerstatus"] == calls + 3
+    assert watcher.statuses[player_ids[1]].status == arez.Activity.In_Lobby
+
+    # adaptive intervals, with the event iterator
+    watcher = arez.LiveMatchWatcher(
+        fake_api, player_ids[:1], min_interval=0.05, max_interval=10
+    )
+    calls = fake_server.calls["getplayerstatus"]
+    received = []
+
+    async def consume():
+        async for event in watcher:
+            received.append(event)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.5)
+    # polled at 0, 0.05, 0.15 and 0.35 seconds
+    assert fake_server.calls["getplayerstatus"] - calls == 4
+    statuses[player_ids[2]] = (4, 0)
+    watcher.add(player_ids[2])
+    await asyncio.sleep(0.01)
+    watcher.stop()
+    await asyncio.wait_for(task, timeout=1)
+    assert [type(e) for e in received] == [arez.PlayerOnline]
+    assert received[0].player.id == player_ids[2]
+    # stopping before iterating ends the iteration right away
+    watcher = arez.LiveMatchWatcher(fake_api, player_ids, min_interval=0, max_interval=0)
+    watcher.stop()
+    calls = fake_server.calls["getplayerstatus"]
+    assert [event async for event in watcher] == []
+    assert fake_server.calls["getplayerstatus"] == calls
+
+
+async def test_status_watcher():
+    summary = copy.deepcopy(SUMMARY)
+    body = None
+
+    async def handler(request):
+        if body is not None:
+            return web.Response(body=body, content_type="application/json")
+        return web.json_response(summary)
+
+    app = web.Application()
+    app.router.add_get("/api/v2/summary.json", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        async with FakeServer() as server:
+            async with arez.PaladinsAPI(1004, "authkey") as api:
+                api.url = server.url
+                async with arez.StatusPage(f"http://127.0.0.1:{port}") as page:
+                    with pytest.raises(ValueError):
+                        arez.StatusWatcher()
+                    with pytest.raises(TypeError):
+                        arez.watcher._Watcher(10, 40)
+                    watcher = arez.StatusWatcher(
+                        api, page, min_interval=10, max_interval=40
+                    )
+                    # the initial snapshot emits nothing
+                    assert await watcher.poll() == []
+                    assert watcher.server_status.all_up
+                    assert watcher.page_status.name == "Status"
+                    # backing off while everything is up
+                    assert await watcher.poll() == []
+                    assert watcher.interval == 40
+                    # a server goes down
+                    original = server._methods["gethirezserverstatus"]
+
+                    def server_status(dev_id):
+                        statuses = original(dev_id)
+                        statuses[3]["status"] = "DOWN"
+                        return statuses
+
+                    server._methods["gethirezserverstatus"] = server_status
+                    events = await watcher.poll()
+                    assert [type(e) for e in events] == [arez.ServerStatusChanged]
+                    assert events[0].platform == "switch"
+                    assert events[0].previous.up and not events[0].current.up
+                    assert watcher.interval == 10
+                    # still down - no changes, but no backing off either
+                    assert await watcher.poll() == []
+                    assert watcher.interval == 10
+                    server._methods["gethirezserverstatus"] = original
+                    assert len(await watcher.poll()) == 1
+                    # an incident is opened
+                    summary["components"][2]["status"] = "major_outage"
+                    summary["incidents"].append(
+                        event(
+                            "inc", "investigating", "major",
+                            [update("u1", "investigating")], ["switch"],
+                        )
+                    )
+                    events = await watcher.poll()
+                    assert [type(e) for e in events] == [
+                        arez.ComponentStatusChanged, arez.IncidentCreated
+                    ]
+                    assert events[0].component.name == "Paladins Switch"
+                    assert events[0].previous_status == "Operational"
+                    assert events[0].component.status == "Major Outage"
+                    assert events[1].incident.name == "Event inc"
+                    # the incident is updated
+                    incident = summary["incidents"][0]
+                    incident["status"] = "identified"
+                    incident["incident_updates"].insert(0, update("u2", "identified"))
+                    events = await watcher.poll()
+                    assert [type(e) for e in events] == [arez.IncidentUpdated]
+                    assert events[0].previous_status == "Investigating"
+                    assert [u.id for u in events[0].updates] == ["u2"]
+                    assert await watcher.poll() == []
+                    # the incident is resolved, and a maintenance is scheduled
+                    summary["components"][2]["status"] = "operational"
+                    summary["incidents"].clear()
+                    summary["scheduled_maintenances"].append(event(
+                        "main", "scheduled", "maintenance", [update("u3", "scheduled")], ["pc"],
+                        scheduled_for=STAMP, scheduled_until=STAMP,
+                    ))
+                    events = await watcher.poll()
+                    assert [type(e) for e in events] == [
+                        arez.ComponentStatusChanged,
+                        arez.IncidentResolved,
+                        arez.MaintenanceChanged,
+                    ]
+                    assert events[2].previous_status is None
+                    # the maintenance starts and ends
+                    summary["scheduled_maintenances"][0]["status"] = "in_progress"
+                    events = await watcher.poll()
+                    assert [type(e) for e in events] == [arez.MaintenanceChanged]
+                    assert events[0].previous_status == "Scheduled"
+                    assert events[0].maintenance.status == "In Progress"
+                    summary["scheduled_maintenances"].clear()
+                    events = await watcher.poll()
+                    assert [type(e) for e in events] == [arez.MaintenanceEnded]
+                    # malformed summaries keep the previous snapshot
+                    page_status = watcher.page_status
+                    for body in (b"{not json", b'{"page": {}}'):
+                        assert await watcher.poll() == []
+                        assert watcher.page_status is page_status
+                    body = None
+                    summary["components"][2]["status"] = "major_outage"
+                    events = await watcher.poll()
+                    assert [type(e) for e in events] == [arez.ComponentStatusChanged]
+    finally:
+        await runner.cleanup()
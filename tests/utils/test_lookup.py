@@ -34,3 +34,25 @@ def test_lookup():
     assert lcp._lookup("Two") == 2
     assert lcp._lookup("two", fuzzy=True) == 2
     assert lcp._lookup("six", fuzzy=True) is None
+
+
+def test_lookup_search():
+    lookup = Lookup([
+        Element(1, "Makoa"),
+        Element(2, "Ying"),
+        Element(3, "Master Riding"),
+        Element(4, "Makoa's Shell"),
+        Element(5, "Morale Boost"),
+    ])
+    assert lookup.search("Ying") == [2]
+    # exact match first, then the name prefix match
+    assert lookup.search("makoa") == [1, 4]
+    # word prefixes and punctuation
+    assert lookup.search("riding") == [3]
+    assert lookup.search("makoas shell")[0] == 4
+    # typos
+    assert lookup.search("Mastr Riding") == [3]
+    assert lookup.search("morle boots")[0] == 5
+    assert lookup.search("makoa", limit=1) == [1]
+    assert lookup.search("zzz") == []
+    assert lookup.search("  ") == []